@@ -2,41 +2,45 @@
 import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
     DOMAIN,
-    CONF_ROAD_SECTION_ID,
-    CONF_TMS_ID,
+    CONF_CORRIDOR,
     CONF_LANGUAGE,
-    CONF_MONITOR_TYPE,
-    CONF_WEATHER_STATION_ID,
-    MONITOR_CONDITIONS,
-    MONITOR_TMS,
-    MONITOR_WEATHER,
+    DATA_CAMERA_IMAGES,
 )
-from .coordinator import DigitraficDataCoordinator
+from .backfill import async_register_backfill_service
+from .catalog import async_get_catalog_cache
+from .coordinator import DigitraficDataCoordinator, entry_monitor_type, entry_targets
+from .store import async_get_overrides_store
+from .websocket import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "camera"]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up integration-wide services and websocket commands."""
+    async_register_websocket_commands(hass)
+    async_register_backfill_service(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up DigiTraffic from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
-    monitor_type = entry.data.get(CONF_MONITOR_TYPE, MONITOR_CONDITIONS)
-
-    if monitor_type == MONITOR_TMS:
-        identifier = entry.data.get(CONF_TMS_ID)
-    elif monitor_type == MONITOR_WEATHER:
-        identifier = entry.data.get(CONF_WEATHER_STATION_ID)
-    else:
-        identifier = entry.data.get(CONF_ROAD_SECTION_ID)
+    monitor_type = entry_monitor_type(entry.data)
+    # One entry may cover several sections or stations; they share one coordinator
+    targets = entry_targets(entry.data)
 
     language = entry.data.get(CONF_LANGUAGE, "fi")
 
-    if identifier is None:
+    if not targets:
         _LOGGER.error(
             "Config entry %s missing identifier for monitor type %s",
             entry.entry_id,
@@ -44,8 +48,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         return False
 
+    # Section-title overrides and catalogs are loaded once and shared by all entries
+    overrides = await async_get_overrides_store(hass)
+    await async_get_catalog_cache(hass)
+
     # Create and setup coordinator
-    coordinator = DigitraficDataCoordinator(hass, identifier, monitor_type, language)
+    coordinator = DigitraficDataCoordinator(hass, targets, monitor_type, language, entry, overrides)
+    if entry.data.get(CONF_CORRIDOR):
+        await coordinator.async_load_corridor(entry.data[CONF_CORRIDOR])
     await coordinator.async_config_entry_first_refresh()
     
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -65,11 +75,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        # The camera image cache is shared; its fetches stop with the last entry
+        if not hass.data[DOMAIN]:
+            image_cache = hass.data.pop(DATA_CAMERA_IMAGES, None)
+            if image_cache is not None:
+                image_cache.cancel_inflight()
     
     return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
+    """Reload config entry when it was updated from outside the coordinator."""
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    # Skip only the update the running coordinator made itself (a resolved section id)
+    if coordinator is not None and coordinator.entry_data_write_pending:
+        coordinator.entry_data_write_pending = False
+        return
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
@@ -0,0 +1,140 @@
+"""Incrementally synced traffic messages filtered to an area."""
+import logging
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .spatial import KM_PER_DEGREE, haversine_km
+
+_LOGGER = logging.getLogger(__name__)
+
+SITUATION_TYPES = ("TRAFFIC_ANNOUNCEMENT", "ROAD_WORK", "WEIGHT_RESTRICTION", "EXEMPTED_TRANSPORT")
+
+
+def area_id(latitude: float, longitude: float, radius: float) -> str:
+    """Return the identifier of an announcement area, used in unique ids."""
+    return f"{latitude:.4f}_{longitude:.4f}_{radius:g}"
+
+
+def _points(coordinates: Any) -> Iterator[Tuple[float, float]]:
+    """Yield (lat, lon) of every vertex of GeoJSON coordinates of any depth."""
+    if not isinstance(coordinates, (list, tuple)) or not coordinates:
+        return
+    if isinstance(coordinates[0], (int, float)):
+        if len(coordinates) >= 2:
+            yield float(coordinates[1]), float(coordinates[0])
+        return
+    for part in coordinates:
+        yield from _points(part)
+
+
+class Area:
+    """Circle around a point; a message is inside if any vertex of its geometry is."""
+
+    def __init__(self, latitude: float, longitude: float, radius: float) -> None:
+        """Initialize the area; `radius` is in kilometres."""
+        self.latitude = latitude
+        self.longitude = longitude
+        self.radius = radius
+        # Bounding box in degrees, checked before the exact distance
+        self._dlat = radius / KM_PER_DEGREE
+        self._dlon = radius / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+
+    def distance(self, geometry: Optional[Dict[str, Any]]) -> Optional[float]:
+        """Return the distance (km) of the closest vertex inside the area, or None if outside."""
+        if not isinstance(geometry, dict):
+            return None
+        closest = None
+        for lat, lon in _points(geometry.get("coordinates")):
+            if abs(lat - self.latitude) > self._dlat or abs(lon - self.longitude) > self._dlon:
+                continue
+            distance = haversine_km(self.latitude, self.longitude, lat, lon)
+            if distance <= self.radius and (closest is None or distance < closest):
+                closest = distance
+        return closest
+
+
+def _announcement(props: Dict[str, Any], language: str) -> Dict[str, Any]:
+    announcements = props.get("announcements") or [{}]
+    wanted = language.upper()
+    for announcement in announcements:
+        if str(announcement.get("language", "")).upper() == wanted:
+            return announcement
+    return announcements[0]
+
+
+def compact_message(feature: Dict[str, Any], distance: float, language: str) -> Dict[str, Any]:
+    """Return the fields of a traffic message feature exposed to Home Assistant."""
+    props = feature.get("properties") or {}
+    announcement = _announcement(props, language)
+    location = announcement.get("location") or {}
+    duration = announcement.get("timeAndDuration") or {}
+    return {
+        "id": props.get("situationId"),
+        "version": props.get("version"),
+        "situation_type": props.get("situationType"),
+        "announcement_type": props.get("trafficAnnouncementType"),
+        "title": announcement.get("title"),
+        "location": location.get("description"),
+        "start_time": duration.get("startTime"),
+        "end_time": duration.get("endTime"),
+        "release_time": props.get("releaseTime"),
+        "distance_km": round(distance, 1),
+    }
+
+
+class AnnouncementStore:
+    """Traffic messages inside an area, kept by situation id and version.
+
+    `merge` is given the full active message feed on every poll. Features
+    whose (id, version) was already seen are skipped without being parsed
+    or distance-checked, so a poll costs work only for new or updated
+    messages. Versions of messages outside the area are remembered too, so
+    they are not checked again until they change.
+    """
+
+    def __init__(self, area: Area, language: str = "fi") -> None:
+        """Initialize an empty store."""
+        self.area = area
+        self.language = language
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, Any] = {}
+        # Validators of the last feed response, for conditional requests
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+
+    def merge(self, features: List[Dict[str, Any]]) -> bool:
+        """Merge the current feed; return True if the messages in the area changed."""
+        changed = False
+        active = set()
+        for feature in features:
+            props = feature.get("properties") or {}
+            situation_id = props.get("situationId")
+            if not situation_id:
+                continue
+            active.add(situation_id)
+            version = props.get("version")
+            if situation_id in self._versions and self._versions[situation_id] == version:
+                continue
+            self._versions[situation_id] = version
+            distance = self.area.distance(feature.get("geometry"))
+            if distance is None:
+                if self.messages.pop(situation_id, None) is not None:
+                    changed = True
+                continue
+            self.messages[situation_id] = compact_message(feature, distance, self.language)
+            changed = True
+
+        # Messages no longer in the feed have ended or been withdrawn
+        for situation_id in [sid for sid in self._versions if sid not in active]:
+            del self._versions[situation_id]
+            if self.messages.pop(situation_id, None) is not None:
+                changed = True
+
+        _LOGGER.debug(
+            "Merged %d traffic messages, %d in area (changed=%s)", len(active), len(self.messages), changed
+        )
+        return changed
+
+    def sorted_messages(self) -> List[Dict[str, Any]]:
+        """Return the messages in the area, closest first."""
+        return sorted(self.messages.values(), key=lambda message: message["distance_km"])
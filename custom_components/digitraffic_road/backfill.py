@@ -0,0 +1,126 @@
+"""Bulk backfill of long-term statistics from recorded station data.
+
+History is read from a replay file and aggregated into hourly mean/min/max
+rows, which are imported as external statistics
+(`digitraffic_road:<type>_<station>_<key>`) in batches. Nothing passes
+through the state machine, so a backfill of months of data costs a handful
+of recorder jobs instead of one state write per sample.
+
+A replay file holds one JSON document per line (optionally gzip
+compressed), each being a Digitraffic station data payload; see
+`replay.py` for the format and the aggregation.
+"""
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .const import CONF_MONITOR_TYPE, DOMAIN, MONITOR_TMS, MONITOR_WEATHER, SERVICE_BACKFILL_STATISTICS
+from .replay import aggregate_hourly, iter_replay_file
+from .search import fold_text
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statistics rows passed to the recorder per import job
+BACKFILL_BATCH_SIZE = 1000
+
+ATTR_PATH = "path"
+ATTR_STATION_IDS = "station_ids"
+
+BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PATH): cv.string,
+        vol.Required(CONF_MONITOR_TYPE): vol.In([MONITOR_TMS, MONITOR_WEATHER]),
+        vol.Optional(ATTR_STATION_IDS): vol.All(cv.ensure_list, [cv.positive_int]),
+    }
+)
+
+
+def statistic_id(monitor_type: str, station: str, key: str) -> str:
+    """Return the external statistic id of a station measurement."""
+    return f"{DOMAIN}:" + fold_text(f"{monitor_type} {station} {key}").replace(" ", "_")
+
+
+def _replay_path(hass: HomeAssistant, name: str) -> Optional[Path]:
+    """Return the resolved replay file path if it may be read (blocking).
+
+    Relative names are taken relative to the config directory. A path is
+    allowed if it resolves under the config directory or under an
+    `allowlist_external_dirs` entry.
+    """
+    path = Path(hass.config.path(name)).resolve()
+    if path.is_relative_to(Path(hass.config.config_dir).resolve()) or hass.config.is_allowed_path(str(path)):
+        return path
+    return None
+
+
+def _read_and_aggregate(path: Path, station_ids: Optional[Set[str]]):
+    return aggregate_hourly(iter_replay_file(path), station_ids)
+
+
+async def async_backfill_statistics(
+    hass: HomeAssistant,
+    path: Path,
+    monitor_type: str,
+    station_ids: Optional[Set[str]] = None,
+) -> Dict[str, int]:
+    """Import hourly statistics aggregated from a replay file."""
+    # Imported here so the integration loads without the recorder
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    buckets, units, samples = await hass.async_add_executor_job(_read_and_aggregate, path, station_ids)
+
+    rows = 0
+    for (station, key), hours in buckets.items():
+        metadata = {
+            "has_mean": True,
+            "has_sum": False,
+            "name": f"{station} {key}",
+            "source": DOMAIN,
+            "statistic_id": statistic_id(monitor_type, station, key),
+            "unit_of_measurement": units.get((station, key)),
+        }
+        statistics = [
+            {"start": hour, "mean": total / count, "min": low, "max": high}
+            for hour, (total, count, low, high) in sorted(hours.items())
+        ]
+        for start in range(0, len(statistics), BACKFILL_BATCH_SIZE):
+            async_add_external_statistics(hass, metadata, statistics[start:start + BACKFILL_BATCH_SIZE])
+        rows += len(statistics)
+
+    _LOGGER.debug(
+        "Backfilled %d hourly rows for %d series from %d samples in %s",
+        rows,
+        len(buckets),
+        samples,
+        path,
+    )
+    return {"series": len(buckets), "hours": rows, "samples": samples}
+
+
+@callback
+def async_register_backfill_service(hass: HomeAssistant) -> None:
+    """Register the `backfill_statistics` service."""
+
+    async def _async_handle_backfill(call: ServiceCall) -> ServiceResponse:
+        if "recorder" not in hass.config.components:
+            raise HomeAssistantError("The recorder is required to backfill statistics")
+        path = await hass.async_add_executor_job(_replay_path, hass, call.data[ATTR_PATH])
+        if path is None:
+            raise HomeAssistantError(f"Path is not allowed: {call.data[ATTR_PATH]}")
+        if not await hass.async_add_executor_job(path.is_file):
+            raise HomeAssistantError(f"Replay file not found: {path}")
+        station_ids = {str(sid) for sid in call.data.get(ATTR_STATION_IDS, [])} or None
+        return await async_backfill_statistics(hass, path, call.data[CONF_MONITOR_TYPE], station_ids)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_STATISTICS,
+        _async_handle_backfill,
+        schema=BACKFILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
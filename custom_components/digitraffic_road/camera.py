@@ -0,0 +1,124 @@
+"""Weather camera platform for DigiTraffic road weather stations."""
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from homeassistant.components.camera import Camera
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .catalog import get_catalog_cache
+from .client import WEATHERCAM_IMAGE_URL, DigitraficClient
+from .const import (
+    CAMERA_CACHE_DIR,
+    CAMERA_DISK_CACHE_BYTES,
+    CAMERA_MATCH_KM,
+    CAMERA_MEMORY_CACHE_BYTES,
+    CAMERA_PUBLISH_INTERVAL,
+    DATA_CAMERA_IMAGES,
+    DOMAIN,
+    MONITOR_WEATHER,
+)
+from .coordinator import DigitraficDataCoordinator, entry_monitor_type
+from .image_cache import CameraImageCache
+from .sensor import format_station_name
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_camera_image_cache(hass: HomeAssistant) -> CameraImageCache:
+    """Return the integration-wide camera image cache stored in `hass.data`.
+
+    Images are fetched through a client on Home Assistant's shared session,
+    not through any one entry's coordinator, so the cache outlives entries.
+    """
+    cache = hass.data.get(DATA_CAMERA_IMAGES)
+    if cache is None:
+        client = DigitraficClient(async_get_clientsession(hass), catalogs=get_catalog_cache(hass))
+        cache = hass.data[DATA_CAMERA_IMAGES] = CameraImageCache(
+            client.async_get_camera_image,
+            hass.async_add_executor_job,
+            hass.async_create_background_task,
+            Path(hass.config.path(CAMERA_CACHE_DIR, DOMAIN, "weathercam")),
+            interval=CAMERA_PUBLISH_INTERVAL,
+            memory_limit=CAMERA_MEMORY_CACHE_BYTES,
+            disk_limit=CAMERA_DISK_CACHE_BYTES,
+        )
+    return cache
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up camera entities for the presets of a weather station's cameras."""
+    if entry_monitor_type(config_entry.data) != MONITOR_WEATHER:
+        return
+
+    coordinator: DigitraficDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    catalog = await coordinator.client.async_get_weathercam_catalog()
+    if catalog is None:
+        _LOGGER.debug("Weather camera catalog unavailable, no cameras added")
+        return
+    weather_catalog = await coordinator.client.async_get_weather_catalog()
+    cache = get_camera_image_cache(hass)
+
+    entities = []
+    for target in coordinator.targets:
+        station_id = target["id"]
+        location = weather_catalog.location(station_id) if weather_catalog is not None else None
+        for camera in catalog.for_weather_station(station_id, location, CAMERA_MATCH_KM):
+            presets = [preset for preset in camera.get("presets") or [] if preset.get("inCollection", True)]
+            for number, preset in enumerate(presets, 1):
+                if not preset.get("id"):
+                    continue
+                entities.append(
+                    DigitraficWeatherCamera(cache, station_id, target.get("name") or station_id, camera, preset, number)
+                )
+
+    _LOGGER.debug("Adding %d weather camera presets", len(entities))
+    async_add_entities(entities)
+
+
+class DigitraficWeatherCamera(Camera):
+    """One preset (view direction) of a road weather camera.
+
+    Images come from the shared `CameraImageCache`: however many dashboards
+    show the camera, the image is downloaded at most once per publish
+    interval, and only if it changed.
+    """
+
+    _attr_frame_interval = 60
+    _attr_icon = "mdi:cctv"
+
+    def __init__(
+        self,
+        cache: CameraImageCache,
+        station_id: Any,
+        station_name: str,
+        camera: Dict[str, Any],
+        preset: Dict[str, Any],
+        number: int,
+    ) -> None:
+        super().__init__()
+        self._cache = cache
+        self.preset_id = str(preset["id"])
+        self._camera_station = camera.get("id")
+        self._attr_unique_id = f"{DOMAIN}_weathercam_{station_id}_{self.preset_id}"
+        label = preset.get("presentationName") or f"{camera.get('name') or self._camera_station} {number}"
+        self._attr_name = f"{format_station_name(str(station_name))} - {label}"
+
+    async def async_camera_image(self, width: Optional[int] = None, height: Optional[int] = None) -> Optional[bytes]:
+        """Return the cached image of this preset."""
+        return await self._cache.async_get(self.preset_id)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {
+            "preset_id": self.preset_id,
+            "camera_station_id": self._camera_station,
+            "image_url": WEATHERCAM_IMAGE_URL.format(preset=self.preset_id),
+        }
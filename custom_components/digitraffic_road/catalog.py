@@ -0,0 +1,409 @@
+"""Indexed station and section catalogs for DigiTraffic searches."""
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .const import CATALOG_SECTIONS, CATALOG_TMS, CATALOG_TTL, CATALOG_WEATHER, CATALOG_WEATHERCAM, DATA_CATALOGS
+from .intervals import IntervalIndex
+from .search import FuzzyIndex, PrefixTrie, fold_text
+from .snapshot import read_snapshot
+from .spatial import GridIndex, feature_location
+
+_LOGGER = logging.getLogger(__name__)
+
+# Forecast section ids look like "00004_421_00000_1_0": road, road section,
+# start distance within the road section (m), ...
+SECTION_ADDRESS_RE = re.compile(r"^(\d+)_(\d+)_(\d+)")
+
+
+def normalize_string(s: str) -> str:
+    """Normalize string for comparison: lowercase, remove punctuation, collapse spaces."""
+    s = s.lower()
+    s = re.sub(r"[^a-z0-9åäöÅÄÖ ]+", " ", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+class _IndexedCatalog:
+    """Feature list indexed by id, name (exact, tokens, trigrams) and location.
+
+    The catalog is built once from a Digitraffic feature collection; searches
+    then only touch the postings of the query instead of scanning every
+    feature. Subclasses decide which names of a feature are searchable.
+    """
+
+    def __init__(self, features: List[Dict[str, Any]], snapshot: bool = False):
+        """Build the indexes from GeoJSON features.
+
+        Catalogs built from the bundled snapshot (`snapshot=True`) are usable
+        right away but always count as expired, so live data replaces them.
+        """
+        self.created = time.monotonic()
+        self.snapshot = snapshot
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self._order: Dict[str, int] = {}
+        self._by_name: Dict[str, List[str]] = {}
+        self._tokens: Dict[str, List[str]] = {}
+        self._fuzzy = FuzzyIndex()
+        self._trie = PrefixTrie()
+        self._spatial = GridIndex()
+        self._locations: Dict[str, Tuple[float, float]] = {}
+
+        for feat in features:
+            props = feat.get("properties", {}) or {}
+            names = [name for name in self._names(feat, props) if name]
+            if not names:
+                continue
+            sid = str(props.get("id"))
+            if sid in self.by_id:
+                continue
+            self.by_id[sid] = props
+            self._order[sid] = len(self._order)
+            self._add(sid, props)
+            location = feature_location(feat)
+            if location is not None:
+                self._spatial.add(sid, *location)
+                self._locations[sid] = location
+
+            tokens = set()
+            for name in names:
+                norm_name = normalize_string(name)
+                ids = self._by_name.setdefault(norm_name, [])
+                if not ids or ids[-1] != sid:
+                    ids.append(sid)
+                # Folded once, shared by the token, trigram and prefix indexes
+                folded = fold_text(name)
+                tokens.update(folded.split())
+                self._fuzzy.add_folded(sid, folded)
+                self._trie.add_folded(sid, folded)
+            for token in tokens:
+                self._tokens.setdefault(token, []).append(sid)
+        self._trie.sort()
+
+    def _names(self, feat: Dict[str, Any], props: Dict[str, Any]) -> List[str]:
+        """Return the searchable names of a feature."""
+        raise NotImplementedError
+
+    def _add(self, sid: str, props: Dict[str, Any]) -> None:
+        """Hook for subclasses to build extra indexes."""
+
+    def label(self, props: Dict[str, Any]) -> str:
+        """Return the display name of a feature."""
+        return str(props.get("name") or props.get("id"))
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def is_expired(self, ttl: float) -> bool:
+        """Return True if the catalog is a snapshot or older than `ttl` seconds."""
+        return self.snapshot or time.monotonic() - self.created > ttl
+
+    def get(self, item_id: Any) -> Optional[Dict[str, Any]]:
+        """Return feature properties by id."""
+        return self.by_id.get(str(item_id).strip())
+
+    def location(self, item_id: Any) -> Optional[Tuple[float, float]]:
+        """Return the (lat, lon) of a feature by id, if it has one."""
+        return self._locations.get(str(item_id).strip())
+
+    def exact(self, query: str) -> List[Dict[str, Any]]:
+        """Return features whose normalized name equals the normalized query."""
+        return [self.by_id[sid] for sid in self._by_name.get(normalize_string(query), ())]
+
+    def nearest(self, latitude: float, longitude: float, count: int = 5) -> List[Tuple[float, Dict[str, Any]]]:
+        """Return up to `count` (distance_km, properties) pairs closest to a location."""
+        return [
+            (distance, self.by_id[sid])
+            for distance, sid in self._spatial.nearest(latitude, longitude, count)
+        ]
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Return typeahead suggestions: features with words starting with each query word."""
+        return [self.by_id[sid] for sid in self._trie.complete(query, limit)]
+
+    def search(self, query: str, max_results: int = 12) -> List[Dict[str, Any]]:
+        """Return feature properties matching `query`, best match first.
+
+        A direct id hit scores 200 and an exact normalized name 100. Other
+        features score the number of shared (diacritic-folded) name tokens plus
+        their trigram similarity, which ranks the intended name first among
+        many partial token hits and still finds names with typos or missing
+        umlauts.
+        """
+        best: Dict[str, float] = {}
+
+        sid = query.strip()
+        if sid in self.by_id:
+            best[sid] = 200
+
+        for sid in self._by_name.get(normalize_string(query), ()):
+            best[sid] = max(best.get(sid, 0), 100)
+
+        scores = self._fuzzy.query(query)
+        for token in set(fold_text(query).split()):
+            for sid in self._tokens.get(token, ()):
+                scores[sid] = scores.get(sid, 0.0) + 1
+        for sid, score in scores.items():
+            if score > best.get(sid, 0):
+                best[sid] = score
+
+        # Ties keep catalog order, like the stable sort over features did
+        scored: List[Tuple[float, str]] = sorted(
+            ((score, sid) for sid, score in best.items()),
+            key=lambda item: (-item[0], self._order[item[1]]),
+        )
+        return [self.by_id[sid] for _, sid in scored[:max_results]]
+
+
+class WeatherStationCatalog(_IndexedCatalog):
+    """Road weather stations from `WEATHER_STATIONS_URL`."""
+
+    def _names(self, feat: Dict[str, Any], props: Dict[str, Any]) -> List[str]:
+        return [props.get("name") or feat.get("name") or ""]
+
+    def label(self, props: Dict[str, Any]) -> str:
+        return (props.get("name") or str(props.get("id"))).replace("_", " ")
+
+
+class WeathercamCatalog(_IndexedCatalog):
+    """Weather camera stations from `WEATHERCAM_STATIONS_URL`, with their presets."""
+
+    def __init__(self, features: List[Dict[str, Any]], snapshot: bool = False):
+        """Build the indexes from GeoJSON features."""
+        self.by_weather_station: Dict[str, List[Dict[str, Any]]] = {}
+        super().__init__(features, snapshot=snapshot)
+
+    def _names(self, feat: Dict[str, Any], props: Dict[str, Any]) -> List[str]:
+        return [props.get("name") or ""]
+
+    def _add(self, sid: str, props: Dict[str, Any]) -> None:
+        weather_station = props.get("nearestWeatherStationId")
+        if weather_station is not None:
+            self.by_weather_station.setdefault(str(weather_station), []).append(props)
+
+    def for_weather_station(self, station_id: Any, location: Optional[Tuple[float, float]], max_km: float):
+        """Return camera stations of a weather station.
+
+        Cameras naming the station as their nearest one are used; otherwise
+        cameras within `max_km` of the station's `location`.
+        """
+        cameras = self.by_weather_station.get(str(station_id))
+        if cameras:
+            return list(cameras)
+        if location is None:
+            return []
+        return [props for distance, props in self.nearest(*location, count=3) if distance <= max_km]
+
+
+class TmsStationCatalog(_IndexedCatalog):
+    """TMS/LAM stations from `TMS_STATIONS_URL`, searchable by fi/sv/en names."""
+
+    def _names(self, feat: Dict[str, Any], props: Dict[str, Any]) -> List[str]:
+        names = props.get("names", {}) or {}
+        return [names.get(k, "") for k in ("fi", "sv", "en")] + [props.get("name", "")]
+
+    def label(self, props: Dict[str, Any]) -> str:
+        return props.get("names", {}).get("fi") or props.get("name") or str(props.get("id"))
+
+
+class SectionCatalog(_IndexedCatalog):
+    """Forecast sections from `FORECAST_SECTIONS_METADATA_URL`.
+
+    Besides name search, sections are indexed by `roadNumber`, by the
+    (`roadNumber`, `roadSectionNumber`) pair used for km-marker input, and
+    per road by their (road section, distance) address range for corridor
+    queries.
+    """
+
+    def __init__(self, features: List[Dict[str, Any]], snapshot: bool = False):
+        """Build the indexes from GeoJSON features."""
+        self.by_road: Dict[int, List[Dict[str, Any]]] = {}
+        self._by_road_section: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+        self._road_ranges: Dict[Any, IntervalIndex] = {}
+        super().__init__(features, snapshot=snapshot)
+
+    def _names(self, feat: Dict[str, Any], props: Dict[str, Any]) -> List[str]:
+        return [props.get("description", "") or props.get("name", "")]
+
+    def label(self, props: Dict[str, Any]) -> str:
+        return props.get("description") or props.get("name") or str(props.get("id"))
+
+    def _add(self, sid: str, props: Dict[str, Any]) -> None:
+        road = props.get("roadNumber")
+        self.by_road.setdefault(road, []).append(props)
+        self._by_road_section.setdefault((road, props.get("roadSectionNumber")), []).append(props)
+
+        address = self._address_range(sid, props)
+        if address is not None:
+            self._road_ranges.setdefault(road, IntervalIndex()).add(*address, sid)
+
+    @staticmethod
+    def _address_range(sid: str, props: Dict[str, Any]):
+        """Return the ((section, start m), (section, end m)) road address of a section."""
+        section_number = props.get("roadSectionNumber")
+        start = 0
+        match = SECTION_ADDRESS_RE.match(sid)
+        if match:
+            start = int(match.group(3))
+            if section_number is None:
+                section_number = int(match.group(2))
+        if section_number is None:
+            return None
+        try:
+            length = int(props.get("length") or 0)
+        except (TypeError, ValueError):
+            length = 0
+        return (section_number, start), (section_number, start + length)
+
+    def by_road_section(self, road_number: int, section_number: int) -> List[Dict[str, Any]]:
+        """Return sections matching a road number and road section number."""
+        return list(self._by_road_section.get((road_number, section_number), ()))
+
+    def corridor(self, road_number: int, first_section: int, last_section: int) -> List[Dict[str, Any]]:
+        """Return the sections of a road between two road section numbers (inclusive).
+
+        Sections are returned in road address order; the bounds may be given
+        in either order.
+        """
+        ranges = self._road_ranges.get(road_number)
+        if ranges is None:
+            return []
+        lo, hi = sorted((first_section, last_section))
+        return [self.by_id[sid] for sid in ranges.overlapping((lo, 0), (hi, float("inf")))]
+
+
+CATALOG_CLASSES = {
+    CATALOG_SECTIONS: SectionCatalog,
+    CATALOG_TMS: TmsStationCatalog,
+    CATALOG_WEATHER: WeatherStationCatalog,
+    CATALOG_WEATHERCAM: WeathercamCatalog,
+}
+
+
+def load_snapshot_catalogs() -> Dict[str, _IndexedCatalog]:
+    """Build catalogs from the bundled snapshot (blocking; run in the executor)."""
+    features_by_kind = read_snapshot()
+    if not features_by_kind:
+        _LOGGER.debug("No catalog snapshot bundled, catalogs are downloaded on first use")
+    return {
+        kind: CATALOG_CLASSES[kind](features, snapshot=True)
+        for kind, features in features_by_kind.items()
+        if kind in CATALOG_CLASSES and features
+    }
+
+
+class CatalogCache:
+    """Catalogs shared by the config flow, options flow and running entries.
+
+    Each catalog kind is downloaded at most once per `ttl`, however many
+    flows or entries ask for it; concurrent requests wait for the same
+    download. When `create_task` is given, an expired or bundled snapshot
+    catalog is served immediately while live data is fetched in the
+    background and swapped in.
+    """
+
+    def __init__(
+        self,
+        ttl: float = CATALOG_TTL,
+        create_task: Optional[Callable[[Awaitable[Any]], Any]] = None,
+        run_blocking: Optional[Callable[..., Awaitable[Any]]] = None,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self._create_task = create_task
+        self._run_blocking = run_blocking
+        self._catalogs: Dict[str, _IndexedCatalog] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._refreshing: set = set()
+        self.snapshot_loaded = False
+        self.snapshot_lock = asyncio.Lock()
+
+    def peek(self, kind: str) -> Optional[_IndexedCatalog]:
+        """Return the cached catalog of `kind` without refreshing it."""
+        return self._catalogs.get(kind)
+
+    async def async_build(self, catalog_cls: Callable[..., _IndexedCatalog], features: List[Dict[str, Any]]):
+        """Index downloaded features as `catalog_cls`, off the event loop when possible.
+
+        Building the indexes of a few thousand features takes a noticeable
+        fraction of a second, so it runs through `run_blocking` when the cache
+        has one (the integration passes `hass.async_add_executor_job`).
+        """
+        if self._run_blocking is None:
+            return catalog_cls(features)
+        return await self._run_blocking(catalog_cls, features)
+
+    def seed(self, catalogs: Dict[str, _IndexedCatalog]) -> None:
+        """Add catalogs (e.g. from the snapshot) for kinds not cached yet."""
+        for kind, catalog in catalogs.items():
+            self._catalogs.setdefault(kind, catalog)
+
+    async def async_get(
+        self,
+        kind: str,
+        loader: Callable[[], Awaitable[Optional[_IndexedCatalog]]],
+    ) -> Optional[_IndexedCatalog]:
+        """Return the catalog of `kind`, calling `loader` when missing or expired.
+
+        If the loader fails, a stale catalog is kept in use rather than dropped.
+        """
+        current = self._catalogs.get(kind)
+        if current is not None and not current.is_expired(self.ttl):
+            return current
+
+        if current is not None and self._create_task is not None:
+            if kind not in self._refreshing:
+                self._refreshing.add(kind)
+                self._create_task(self._async_refresh(kind, loader))
+            return current
+
+        return await self._async_refresh(kind, loader)
+
+    async def _async_refresh(
+        self,
+        kind: str,
+        loader: Callable[[], Awaitable[Optional[_IndexedCatalog]]],
+    ) -> Optional[_IndexedCatalog]:
+        lock = self._locks.setdefault(kind, asyncio.Lock())
+        try:
+            async with lock:
+                current = self._catalogs.get(kind)
+                if current is not None and not current.is_expired(self.ttl):
+                    return current
+                fresh = await loader()
+                if fresh is None:
+                    return current
+                self._catalogs[kind] = fresh
+                return fresh
+        finally:
+            self._refreshing.discard(kind)
+
+
+def get_catalog_cache(hass) -> CatalogCache:
+    """Return the integration-wide catalog cache stored in `hass.data`."""
+    cache = hass.data.get(DATA_CATALOGS)
+    if cache is None:
+        cache = hass.data[DATA_CATALOGS] = CatalogCache(
+            create_task=hass.async_create_task,
+            run_blocking=hass.async_add_executor_job,
+        )
+    return cache
+
+
+async def async_get_catalog_cache(hass) -> CatalogCache:
+    """Return the catalog cache, seeding it from the bundled snapshot once."""
+    cache = get_catalog_cache(hass)
+    if cache.snapshot_loaded:
+        return cache
+    # Callers arriving while the snapshot is read wait for it instead of
+    # going to the network
+    async with cache.snapshot_lock:
+        if not cache.snapshot_loaded:
+            try:
+                cache.seed(await hass.async_add_executor_job(load_snapshot_catalogs))
+            except Exception as err:
+                _LOGGER.warning("Failed to load bundled catalog snapshot: %s", err)
+            cache.snapshot_loaded = True
+    return cache
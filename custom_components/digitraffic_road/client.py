@@ -2,11 +2,19 @@
 import aiohttp
 import logging
 import re
-import json
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
+from .catalog import (
+    CatalogCache,
+    SectionCatalog,
+    TmsStationCatalog,
+    WeathercamCatalog,
+    WeatherStationCatalog,
+    normalize_string,
+)
+from .const import CATALOG_SECTIONS, CATALOG_TMS, CATALOG_WEATHER, CATALOG_WEATHERCAM
+
 _LOGGER = logging.getLogger(__name__)
 
 # Digitraffic API endpoints
@@ -20,6 +28,24 @@ TMS_STATION_DATA_URL = "https://tie.digitraffic.fi/api/tms/v1/stations/{id}/data
 WEATHER_STATIONS_URL = "https://tie.digitraffic.fi/api/weather/v1/stations"
 WEATHER_STATION_URL = "https://tie.digitraffic.fi/api/weather/v1/stations/{id}"
 WEATHER_STATION_DATA_URL = "https://tie.digitraffic.fi/api/weather/v1/stations/{id}/data"
+# All-station variants used when one entry tracks several stations
+TMS_STATIONS_DATA_URL = "https://tie.digitraffic.fi/api/tms/v1/stations/data"
+TMS_SENSOR_CONSTANTS_ALL_URL = "https://tie.digitraffic.fi/api/tms/v1/stations/sensor-constants"
+WEATHER_STATIONS_DATA_URL = "https://tie.digitraffic.fi/api/weather/v1/stations/data"
+WEATHERCAM_STATIONS_URL = "https://tie.digitraffic.fi/api/weathercam/v1/stations"
+WEATHERCAM_IMAGE_URL = "https://weathercam.digitraffic.fi/{preset}.jpg"
+TRAFFIC_MESSAGES_URL = "https://tie.digitraffic.fi/api/traffic-message/v1/messages"
+
+# Canonical forecast section ids look like "00003_250_00000_1_0"
+SECTION_ID_RE = re.compile(r"^[0-9]{5}_\d+")
+
+# Road corridors between two road sections, e.g. "4.421-4.440", "vt4 421-440"
+# or "Tie 4: 421–440"
+CORRIDOR_RE = re.compile(
+    r"^\s*(?:vt|kt|st|valtatie|kantatie|seututie|tie|road)?\s*(\d{1,5})(?:\s*[:.]\s*|\s+)(\d{1,4})"
+    r"\s*[-–—]\s*(?:(\d{1,5})\s*\.\s*)?(\d{1,4})\s*$",
+    flags=re.IGNORECASE,
+)
 
 # Finnish road condition descriptions
 FINNISH_ROAD_CONDITIONS = [
@@ -188,17 +214,26 @@ MOCK_ROAD_SECTIONS = [
 class DigitraficClient:
     """Client to interact with Digitraffic API."""
 
-    def __init__(self, session: aiohttp.ClientSession):
-        """Initialize the client."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        overrides: Optional[MutableMapping[str, str]] = None,
+        catalogs: Optional[CatalogCache] = None,
+    ):
+        """Initialize the client.
+
+        `overrides` maps normalized section titles to section ids and
+        `catalogs` caches the station and section lists; the integration
+        passes its shared `OverridesStore` and `CatalogCache` here.
+        """
         self.session = session
+        self.overrides: MutableMapping[str, str] = overrides if overrides is not None else {}
+        self.catalogs = catalogs if catalogs is not None else CatalogCache()
 
     @staticmethod
     def _normalize_string(s: str) -> str:
         """Normalize string for comparison: lowercase, remove punctuation, collapse spaces."""
-        s = s.lower()
-        s = re.sub(r"[^a-z0-9åäöÅÄÖ ]+", " ", s)
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
+        return normalize_string(s)
 
     async def resolve_section_id(self, user_input: str) -> Optional[str]:
         """Resolve a user-entered road section title to an API section ID.
@@ -216,115 +251,25 @@ class DigitraficClient:
             _LOGGER.debug("Attempting to resolve section ID for: %s", user_input)
 
             # Check for user overrides first (persistent mapping from query -> section id)
-            try:
-                overrides_path = Path(__file__).parent / "overrides.json"
-                if overrides_path.exists():
-                    with overrides_path.open("r", encoding="utf-8") as fh:
-                        overrides = json.load(fh)
-                    # use normalized key to match stored overrides
-                    norm_key = self._normalize_string(user_input)
-                    mapped = overrides.get(norm_key)
-                    if mapped:
-                        _LOGGER.debug("Found override for '%s' -> %s", user_input, mapped)
-                        return mapped
-            except Exception as e:
-                _LOGGER.debug("Failed to read overrides: %s", e)
+            mapped = self.overrides.get(self._normalize_string(user_input))
+            if mapped:
+                _LOGGER.debug("Found override for '%s' -> %s", user_input, mapped)
+                return mapped
             
             # If input looks like an ID (numeric pattern), return as-is
-            if re.match(r"^[0-9]{5}_\d+", user_input):
+            if SECTION_ID_RE.match(user_input):
                 return user_input
 
-            # Prefer numeric parsing: if the user entered a road + km marker (e.g. "Valtatie 3 3.250")
-            # then try to find metadata entries that match roadNumber and roadSectionNumber
-            try:
-                candidates = await self.resolve_section_candidates(user_input, max_candidates=8)
-                if candidates:
-                    # If resolve_section_candidates returned exact numeric matches, they will be first.
-                    # Choose the best candidate deterministically (first in list).
-                    first = candidates[0]
-                    cid = first.get('id')
-                    if cid:
-                        _LOGGER.debug("Resolved '%s' to section %s via numeric/metadata match", user_input, cid)
-                        return cid
-            except Exception as e:
-                _LOGGER.debug("Numeric candidate resolution failed: %s", e)
-
-            # Fallback: original text token overlap approach (if numeric/match not found)
-            async with self.session.get(FORECAST_SECTIONS_METADATA_URL) as resp:
-                if resp.status != 200:
-                    _LOGGER.debug("Metadata endpoint returned %d", resp.status)
-                    return None
-                
-                data = await resp.json()
-                features = data.get("features", [])
-                
-            norm_user = self._normalize_string(user_input)
-            user_tokens = set(norm_user.split())
-            
-            candidates = []
-            for feat in features:
-                props = feat.get("properties", {})
-                desc = props.get("description", "")
-                if desc:
-                    norm_desc = self._normalize_string(desc)
-                    desc_tokens = set(norm_desc.split())
-                    common = user_tokens & desc_tokens
-                    if len(common) > 0:
-                        score = len(common)
-                        section_id = props.get("id")
-                        candidates.append((score, section_id, desc))
-
-            if candidates:
-                # Sort by text match score (descending)
-                candidates.sort(reverse=True, key=lambda x: x[0])
-                best_score = candidates[0][0]
-                # Gather all top-scoring candidates
-                top_candidates = [c for c in candidates if c[0] == best_score]
-
-                # If only one top candidate, return it
-                if len(top_candidates) == 1:
-                    _, best_id, best_desc = top_candidates[0]
-                    _LOGGER.debug("Resolved '%s' to section %s (score %d, desc: %s)", 
-                                 user_input, best_id, best_score, best_desc)
-                    return best_id
-
-                # Tie-breaker: fetch forecast feed and score candidates by forecast content
-                try:
-                    async with self.session.get(FORECAST_SECTIONS_URL) as fresp:
-                        if fresp.status == 200:
-                            fdata = await fresp.json()
-                            fs_map = {fs.get('id'): fs for fs in fdata.get('forecastSections', [])}
-                            best_candidate = None
-                            best_tie_score = -1
-                            for _, cid, cdesc in top_candidates:
-                                fs = fs_map.get(cid)
-                                if not fs:
-                                    continue
-                                tie_score = 0
-                                # Score based on forecasts: prefer NORMAL_CONDITION and MOIST
-                                for f in fs.get('forecasts', []):
-                                    if f.get('type') != 'FORECAST':
-                                        continue
-                                    if f.get('overallRoadCondition') == 'NORMAL_CONDITION':
-                                        tie_score += 2
-                                    if f.get('forecastConditionReason', {}).get('roadCondition') == 'MOIST':
-                                        tie_score += 1
-                                if tie_score > best_tie_score:
-                                    best_tie_score = tie_score
-                                    best_candidate = cid
-                            if best_candidate:
-                                _LOGGER.debug("Resolved '%s' to section %s by forecast tie-breaker (text score %d, tie score %d)",
-                                             user_input, best_candidate, best_score, best_tie_score)
-                                return best_candidate
-                except Exception as e:
-                    _LOGGER.debug("Tie-breaker forecast check failed: %s", e)
-
-                # Fallback: return first top candidate
-                _, best_id, best_desc = top_candidates[0]
-                _LOGGER.debug("Resolved '%s' to section %s (score %d, desc: %s) [fallback]", 
-                             user_input, best_id, best_score, best_desc)
-                return best_id
-        
+            # Numeric road + km marker matches come first, then the catalog's
+            # ranked name search (token overlap plus trigram similarity)
+            candidates = await self.resolve_section_candidates(user_input, max_candidates=1)
+            cid = candidates[0].get("id") if candidates else None
+            if cid:
+                _LOGGER.debug("Resolved '%s' to section %s (%s)", user_input, cid, candidates[0].get("description"))
+                return cid
+            _LOGGER.debug("No forecast section matches '%s'", user_input)
+            return None
+
         except Exception as err:
             _LOGGER.warning("Error resolving section ID: %s", err)
             return None
@@ -342,25 +287,20 @@ class DigitraficClient:
         endpoint) ordered by relevance.
         """
         try:
-            async with self.session.get(FORECAST_SECTIONS_METADATA_URL) as resp:
-                if resp.status != 200:
-                    _LOGGER.debug("Metadata endpoint returned %d", resp.status)
-                    return []
-                data = await resp.json()
-                features = data.get("features", [])
+            catalog = await self.async_get_section_catalog()
+            if catalog is None:
+                return []
 
-            norm = self._normalize_string(user_input)
+            # A section the user confirmed earlier for this query wins outright
+            override = self.overrides.get(self._normalize_string(user_input))
+            if override and catalog.get(override) is not None:
+                return [catalog.get(override)]
 
             # First: exact-match against the `description` field (normalized).
             # This allows the config flow to compare the user's typed label directly
             # to the authoritative metadata `description` and present exact matches
             # for the user to pick from if there are multiple identical descriptions.
-            exact_matches: List[Dict[str, Any]] = []
-            for feat in features:
-                props = feat.get("properties", {})
-                desc = props.get("description", "") or props.get("name", "")
-                if desc and self._normalize_string(desc) == norm:
-                    exact_matches.append(props)
+            exact_matches = catalog.exact(user_input)
             if exact_matches:
                 return exact_matches[:max_candidates]
 
@@ -378,10 +318,7 @@ class DigitraficClient:
                         road_num = int(mroad.group(1))
                         norm_right = self._normalize_string(right)
                         matched: List[Dict[str, Any]] = []
-                        for feat in features:
-                            props = feat.get("properties", {})
-                            if props.get("roadNumber") != road_num:
-                                continue
+                        for props in catalog.by_road.get(road_num, []):
                             desc = props.get("description", "") or props.get("name", "")
                             if desc and self._normalize_string(desc) == norm_right:
                                 matched.append(props)
@@ -406,85 +343,57 @@ class DigitraficClient:
                     road_num = None
                     section_num = None
 
-            candidates: List[Dict[str, Any]] = []
-
             # If we parsed numeric road + section, prefer exact matches
             if road_num is not None and section_num is not None:
-                for feat in features:
-                    props = feat.get("properties", {})
-                    if props.get("roadNumber") == road_num and props.get("roadSectionNumber") == section_num:
-                        candidates.append(props)
+                candidates = catalog.by_road_section(road_num, section_num)
                 if candidates:
                     return candidates[:max_candidates]
 
-            # Fallback: token-overlap scoring (as before)
-            user_tokens = set(norm.split())
-            scored = []
-            for feat in features:
-                props = feat.get("properties", {})
-                desc = props.get("description", "") or props.get("name", "")
-                if not desc:
-                    continue
-                norm_desc = self._normalize_string(desc)
-                desc_tokens = set(norm_desc.split())
-                score = len(user_tokens & desc_tokens)
-                if score > 0:
-                    scored.append((score, props))
-            scored.sort(key=lambda x: (-x[0], x[1].get("id", "")))
-            return [p for _, p in scored[:max_candidates]]
+            # Fallback: token overlap plus typo-tolerant trigram similarity
+            return catalog.search(user_input, max_results=max_candidates)
         except Exception as err:
             _LOGGER.warning("Error resolving candidates: %s", err)
             return []
 
+    @staticmethod
+    def parse_corridor(user_input: str) -> Optional[Tuple[int, int, int]]:
+        """Parse corridor input into (road number, first section, last section).
+
+        Returns None if the input is not a corridor.
+        """
+        m = CORRIDOR_RE.match(user_input or "")
+        if not m:
+            return None
+        road_num = int(m.group(1))
+        if m.group(3) is not None and int(m.group(3)) != road_num:
+            return None
+        return road_num, int(m.group(2)), int(m.group(4))
+
+    async def async_get_corridor_sections(
+        self, road_number: int, first_section: int, last_section: int
+    ) -> List[Dict[str, Any]]:
+        """Return every forecast section of a road between two road sections.
+
+        Uses the section catalog's road address interval index, so a corridor
+        is one range query. Returns [] if the catalog is unavailable.
+        """
+        catalog = await self.async_get_section_catalog()
+        if catalog is None:
+            return []
+        return catalog.corridor(road_number, first_section, last_section)
+
     async def async_search_tms_stations(self, query: str, max_results: int = 12) -> List[Dict[str, Any]]:
         """Search TMS stations by name.
 
-        Matches against `properties.names` (fi/sv/en) and `properties.name`.
+        Matches against `properties.names` (fi/sv/en) and `properties.name`,
+        tolerating typos and missing diacritics.
         Returns a list of `properties` dicts for matching stations.
         """
         try:
-            async with self.session.get(TMS_STATIONS_URL, headers={"Accept": "application/json"}) as resp:
-                if resp.status != 200:
-                    _LOGGER.debug("TMS stations endpoint returned %d", resp.status)
-                    return []
-                # API requires gzip; aiohttp handles compression automatically
-                data = await resp.json()
-                features = data.get("features", [])
-
-            norm = self._normalize_string(query)
-            tokens = set(norm.split())
-
-            matches: List[Tuple[int, Dict[str, Any]]] = []
-            for feat in features:
-                props = feat.get("properties", {})
-                # Look into names dict first
-                names = props.get("names", {}) or {}
-                candidates = [names.get(k, "") for k in ("fi", "sv", "en")] + [props.get("name", "")]
-                for cand in candidates:
-                    if not cand:
-                        continue
-                    norm_cand = self._normalize_string(cand)
-                    # exact normalized match gets highest priority
-                    if norm_cand == norm:
-                        matches.append((100, props))
-                        break
-                    # token overlap scoring
-                    common = tokens & set(norm_cand.split())
-                    if common:
-                        matches.append((len(common), props))
-                        break
-
-            # Deduplicate by id keeping highest score
-            best: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
-            for score, p in matches:
-                pid = p.get("id")
-                if pid not in best or score > best[pid][0]:
-                    best[pid] = (score, p)
-
-            # Sort by score (descending) without attempting to compare dicts.
-            # Using a key avoids TypeError when scores tie and dicts would be compared.
-            scored = sorted(best.values(), key=lambda x: -x[0])
-            return [p for _, p in scored[:max_results]]
+            catalog = await self.async_get_tms_catalog()
+            if catalog is None:
+                return []
+            return catalog.search(query, max_results=max_results)
         except Exception as err:
             _LOGGER.debug("Error searching TMS stations: %s", err)
             return []
@@ -534,58 +443,105 @@ class DigitraficClient:
             _LOGGER.debug("Error fetching TMS station data %s: %s", station_id, err)
             return None
 
-    async def async_search_weather_stations(self, query: str, max_results: int = 12) -> List[Dict[str, Any]]:
-        """Search weather stations by name or id."""
-        if not query:
-            return []
+    async def _async_fetch_catalog(self, url: str, catalog_cls):
+        """Download a feature collection and index it as `catalog_cls`.
 
+        Returns None if the download fails.
+        """
         try:
-            async with self.session.get(WEATHER_STATIONS_URL, headers={"Accept": "application/json"}) as resp:
+            async with self.session.get(url, headers={"Accept": "application/json"}) as resp:
                 if resp.status != 200:
-                    _LOGGER.debug("Weather stations endpoint returned %d", resp.status)
-                    return []
+                    _LOGGER.debug("Catalog endpoint %s returned %d", url, resp.status)
+                    return None
+                # API requires gzip; aiohttp handles compression automatically
                 payload = await resp.json()
         except Exception as err:
-            _LOGGER.debug("Error fetching weather stations: %s", err)
-            return []
-
-        features = payload.get("features", [])
-        norm_query = self._normalize_string(query)
-        tokens = set(norm_query.split())
-
-        matches: List[Tuple[int, Dict[str, Any]]] = []
-        for feat in features:
-            props = feat.get("properties", {})
-            name = props.get("name") or feat.get("name") or ""
-            if not name:
-                continue
-
-            # Allow direct id match
-            if str(props.get("id")) == query.strip():
-                matches.append((200, props))
-                continue
-
-            norm_name = self._normalize_string(name)
-            if norm_name == norm_query:
-                matches.append((100, props))
-                continue
+            _LOGGER.debug("Error fetching catalog %s: %s", url, err)
+            return None
 
-            common = tokens & set(norm_name.split())
-            if common:
-                matches.append((len(common), props))
+        catalog = await self.catalogs.async_build(catalog_cls, payload.get("features", []))
+        _LOGGER.debug("Indexed %d entries from %s", len(catalog), url)
+        return catalog
+
+    async def async_get_section_catalog(self) -> Optional[SectionCatalog]:
+        """Return the indexed forecast section catalog, refreshing it once per TTL."""
+        return await self.catalogs.async_get(
+            CATALOG_SECTIONS,
+            lambda: self._async_fetch_catalog(FORECAST_SECTIONS_METADATA_URL, SectionCatalog),
+        )
+
+    async def async_get_tms_catalog(self) -> Optional[TmsStationCatalog]:
+        """Return the indexed TMS station catalog, refreshing it once per TTL."""
+        return await self.catalogs.async_get(
+            CATALOG_TMS,
+            lambda: self._async_fetch_catalog(TMS_STATIONS_URL, TmsStationCatalog),
+        )
+
+    async def async_get_weather_catalog(self) -> Optional[WeatherStationCatalog]:
+        """Return the indexed weather station catalog, refreshing it once per TTL."""
+        return await self.catalogs.async_get(
+            CATALOG_WEATHER,
+            lambda: self._async_fetch_catalog(WEATHER_STATIONS_URL, WeatherStationCatalog),
+        )
+
+    async def async_get_weathercam_catalog(self) -> Optional[WeathercamCatalog]:
+        """Return the indexed weather camera station catalog, refreshing it once per TTL."""
+        return await self.catalogs.async_get(
+            CATALOG_WEATHERCAM,
+            lambda: self._async_fetch_catalog(WEATHERCAM_STATIONS_URL, WeathercamCatalog),
+        )
+
+    async def async_get_camera_image(
+        self,
+        preset_id: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Tuple[int, Optional[bytes], Dict[str, Optional[str]]]:
+        """Fetch a weather camera image with a conditional request.
+
+        Returns the HTTP status (0 on a network error), the JPEG bytes on 200
+        and the response's `ETag`/`Last-Modified` validators.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        try:
+            async with self.session.get(WEATHERCAM_IMAGE_URL.format(preset=preset_id), headers=headers) as resp:
+                validators = {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+                if resp.status != 200:
+                    _LOGGER.debug("Camera image %s returned %d", preset_id, resp.status)
+                    return resp.status, None, validators
+                return resp.status, await resp.read(), validators
+        except Exception as err:
+            _LOGGER.debug("Error fetching camera image %s: %s", preset_id, err)
+            return 0, None, {}
+
+    async def async_get_catalog(self, kind: str):
+        """Return the catalog of `kind` (one of the CATALOG_* constants)."""
+        if kind == CATALOG_SECTIONS:
+            return await self.async_get_section_catalog()
+        if kind == CATALOG_TMS:
+            return await self.async_get_tms_catalog()
+        if kind == CATALOG_WEATHERCAM:
+            return await self.async_get_weathercam_catalog()
+        return await self.async_get_weather_catalog()
 
-        if not matches:
+    async def async_search_weather_stations(self, query: str, max_results: int = 12) -> List[Dict[str, Any]]:
+        """Search weather stations by name or id."""
+        if not query:
             return []
 
-        best: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
-        for score, props in matches:
-            sid = props.get("id")
-            if sid not in best or score > best[sid][0]:
-                best[sid] = (score, props)
+        catalog = await self.async_get_weather_catalog()
+        if catalog is None:
+            return []
 
-        scored = sorted(best.values(), key=lambda item: -item[0])
         results: List[Dict[str, Any]] = []
-        for _, props in scored[:max_results]:
+        for props in catalog.search(query, max_results=max_results):
             results.append(
                 {
                     "id": props.get("id"),
@@ -623,30 +579,106 @@ class DigitraficClient:
             _LOGGER.debug("Error fetching weather station data %s: %s", station_id, err)
             return None
 
-    def save_override(self, user_input: str, section_id: str) -> bool:
-        """Persist a user override mapping from the normalized user_input to section_id.
+    async def _async_get_json(self, url: str, what: str) -> Optional[Dict[str, Any]]:
+        """GET a JSON document, returning None on any failure."""
+        try:
+            async with self.session.get(url, headers={"Accept": "application/json"}) as resp:
+                if resp.status != 200:
+                    _LOGGER.debug("%s returned %d", what, resp.status)
+                    return None
+                return await resp.json()
+        except Exception as err:
+            _LOGGER.debug("Error fetching %s: %s", what, err)
+            return None
 
-        Returns True on success.
+    @staticmethod
+    def _by_station(payload: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Index an all-stations payload (`{"stations": [...]}`) by station id."""
+        if not isinstance(payload, dict):
+            return {}
+        return {str(st.get("id")): st for st in payload.get("stations", []) or []}
+
+    async def async_get_tms_stations_data(self, station_ids: List[int]) -> Dict[str, Dict[str, Any]]:
+        """Fetch measurement data for several TMS stations in one request.
+
+        Returns a mapping of station id (str) -> station payload with
+        `sensorValues`, for the requested stations only.
+        """
+        wanted = {str(sid) for sid in station_ids}
+        stations = self._by_station(await self._async_get_json(TMS_STATIONS_DATA_URL, "TMS stations data"))
+        return {sid: st for sid, st in stations.items() if sid in wanted}
+
+    async def async_get_tms_sensor_constants_all(self, station_ids: List[int]) -> Dict[str, Dict[str, Any]]:
+        """Fetch sensor constants for several TMS stations in one request.
+
+        Entries are normalized to the single-station shape with a
+        `sensorConstantValues` list.
+        """
+        wanted = {str(sid) for sid in station_ids}
+        stations = self._by_station(
+            await self._async_get_json(TMS_SENSOR_CONSTANTS_ALL_URL, "TMS sensor-constants")
+        )
+        result: Dict[str, Dict[str, Any]] = {}
+        for sid, st in stations.items():
+            if sid not in wanted:
+                continue
+            # The all-stations payload spells the list key without the "t"
+            values = st.get("sensorConstantValues") or st.get("sensorConstanValues") or []
+            result[sid] = {**st, "sensorConstantValues": values}
+        return result
+
+    async def async_get_weather_stations_data(self, station_ids: List[int]) -> Dict[str, Dict[str, Any]]:
+        """Fetch measurement data for several weather stations in one request."""
+        wanted = {str(sid) for sid in station_ids}
+        stations = self._by_station(
+            await self._async_get_json(WEATHER_STATIONS_DATA_URL, "Weather stations data")
+        )
+        return {sid: st for sid, st in stations.items() if sid in wanted}
+
+    async def async_get_traffic_messages(
+        self,
+        situation_types: Tuple[str, ...],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Tuple[int, Optional[Dict[str, Any]], Dict[str, Optional[str]]]:
+        """Fetch the active traffic message feed with a conditional request.
+
+        Returns the HTTP status (0 on a network error), the feed on 200 and
+        the response's `ETag`/`Last-Modified` validators. A 304 means nothing
+        changed since the validators passed in.
         """
+        headers = {"Accept": "application/json"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        params = [("inactiveHours", "0"), ("includeAreaGeometry", "false")]
+        params.extend(("situationType", situation_type) for situation_type in situation_types)
         try:
-            overrides_path = Path(__file__).parent / "overrides.json"
-            overrides = {}
-            if overrides_path.exists():
-                with overrides_path.open("r", encoding="utf-8") as fh:
-                    try:
-                        overrides = json.load(fh)
-                    except Exception:
-                        overrides = {}
-
-            key = self._normalize_string(user_input)
-            overrides[key] = section_id
-            with overrides_path.open("w", encoding="utf-8") as fh:
-                json.dump(overrides, fh, ensure_ascii=False, indent=2)
-            _LOGGER.debug("Saved override: %s -> %s", key, section_id)
-            return True
+            async with self.session.get(TRAFFIC_MESSAGES_URL, params=params, headers=headers) as resp:
+                validators = {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+                if resp.status != 200:
+                    _LOGGER.debug("Traffic messages returned %d", resp.status)
+                    return resp.status, None, validators
+                return resp.status, await resp.json(), validators
         except Exception as err:
-            _LOGGER.warning("Failed to save override: %s", err)
-            return False
+            _LOGGER.debug("Error fetching traffic messages: %s", err)
+            return 0, None, {}
+
+    def save_override(self, user_input: str, section_id: str) -> bool:
+        """Map the normalized user_input to a section id the user confirmed.
+
+        Called by the config flow when one candidate is picked for a typed
+        query. The overrides store debounces the write off the event loop.
+        Returns True on success.
+        """
+        key = self._normalize_string(user_input)
+        self.overrides[key] = section_id
+        _LOGGER.debug("Saved override: %s -> %s", key, section_id)
+        return True
 
     async def search_road_sections(self, query: str) -> List[Dict[str, Any]]:
         """Search for road sections by name, road number, or location.
@@ -695,6 +727,199 @@ class DigitraficClient:
             _LOGGER.error("Error fetching road sections: %s", err)
             return []
 
+    async def _async_resolve_for_fetch(self, section_id: str) -> str:
+        """Return the API section id for `section_id`, resolving titles."""
+        if SECTION_ID_RE.match(section_id):
+            return section_id
+        # Doesn't look like an API ID, try to resolve
+        resolved = await self.resolve_section_id(section_id)
+        if resolved:
+            return resolved
+        _LOGGER.warning("Could not resolve section title: %s", section_id)
+        return section_id
+
+    async def async_get_forecast_feed(self) -> Optional[Dict[str, Any]]:
+        """Fetch the forecast feed for all sections in one request.
+
+        Returns `{"dataUpdatedTime": ..., "sections": {section_id: forecastSection}}`
+        or None if the feed is unavailable.
+        """
+        # If session looks like an aiohttp session, attempt to fetch real data
+        if not hasattr(self.session, "get"):
+            return None
+        try:
+            async with self.session.get(FORECAST_SECTIONS_URL) as resp:
+                if resp.status != 200:
+                    _LOGGER.debug("Forecast feed returned %d", resp.status)
+                    return None
+                data = await resp.json()
+        except Exception as err:
+            _LOGGER.debug("Failed to fetch forecast feed: %s", err)
+            return None
+        return {
+            "dataUpdatedTime": data.get("dataUpdatedTime"),
+            "sections": {fs.get("id"): fs for fs in data.get("forecastSections", [])},
+        }
+
+    def _conditions_from_feed(
+        self,
+        resolved_id: str,
+        section_id: str,
+        feed: Optional[Dict[str, Any]],
+        language: str,
+    ) -> Dict[str, Any]:
+        """Build the current-conditions payload of one section from the feed."""
+        fs = (feed or {}).get("sections", {}).get(resolved_id)
+        if fs:
+            # Find observation
+            obs = next((f for f in fs.get("forecasts", []) if f.get("type") == "OBSERVATION"), None)
+            if obs:
+                rc = obs.get("overallRoadCondition") or obs.get("forecastConditionReason", {}).get("roadCondition")
+                condition_text = ROAD_CONDITION_MAP.get(rc, {}).get(language, rc or "Unknown")
+                return {
+                    "features": [
+                        {
+                            "type": "Feature",
+                            "properties": {
+                                "id": fs.get("id"),
+                                "location": section_id,
+                                "condition": condition_text,
+                                "reliability": obs.get("reliability"),
+                                "last_updated": feed.get("dataUpdatedTime"),
+                            },
+                            "geometry": {"type": "Point", "coordinates": [0, 0]}
+                        }
+                    ]
+                }
+
+        # Fallback to mock data if network unavailable or no match
+        section = next(
+            (s for s in MOCK_ROAD_SECTIONS if s["id"] == section_id),
+            None
+        )
+        location = section["location"] if section else section_id
+
+        # Choose language for condition descriptions
+        if language == "en":
+            condition = ENGLISH_ROAD_CONDITIONS[hash(section_id) % len(ENGLISH_ROAD_CONDITIONS)]
+        else:
+            condition = FINNISH_ROAD_CONDITIONS[hash(section_id) % len(FINNISH_ROAD_CONDITIONS)]
+
+        return {
+            "features": [
+                {
+                    "type": "Feature",
+                    "properties": {
+                        "id": section_id,
+                        "location": location,
+                        "condition": condition,
+                        "reliability": 90 + (hash(section_id) % 10),
+                        "last_updated": datetime.now().isoformat(),
+                    },
+                    "geometry": {"type": "Point", "coordinates": [0, 0]}
+                }
+            ]
+        }
+
+    def _forecast_from_feed(
+        self,
+        resolved_id: str,
+        feed: Optional[Dict[str, Any]],
+        language: str,
+    ) -> Dict[str, Any]:
+        """Build the forecast payload of one section from the feed."""
+        fs = (feed or {}).get("sections", {}).get(resolved_id)
+        if fs:
+            # Build forecasts from API
+            forecasts = []
+            for f in fs.get("forecasts", []):
+                if f.get("type") == "FORECAST":
+                    time_iso = f.get("time")
+                    try:
+                        # Parse UTC time and convert to EET (UTC+2)
+                        dt_utc = datetime.fromisoformat(time_iso.replace("Z", "+00:00"))
+                        # Convert to EET (UTC+2)
+                        eet = timezone(timedelta(hours=2))
+                        dt_eet = dt_utc.astimezone(eet)
+                        time_str = dt_eet.strftime("%H:%M")
+                    except Exception:
+                        time_str = time_iso
+
+                    # Get overall road condition
+                    overall_rc = f.get("overallRoadCondition")
+                    overall_text = ROAD_CONDITION_MAP.get(overall_rc, {}).get(language, overall_rc or "")
+
+                    # Get specific road condition
+                    road_rc = f.get("forecastConditionReason", {}).get("roadCondition")
+                    road_text = ROAD_CONDITION_MAP.get(road_rc, {}).get(language, road_rc or "")
+                    # Make specific condition lowercase
+                    if road_text:
+                        road_text = road_text[0].lower() + road_text[1:] if len(road_text) > 0 else road_text
+
+                    # Combine both conditions
+                    if overall_text and road_text:
+                        condition_text = f"{overall_text}, {road_text}"
+                    elif overall_text:
+                        condition_text = overall_text
+                    elif road_text:
+                        condition_text = road_text
+                    else:
+                        condition_text = "Unavailable"
+
+                    forecasts.append({
+                        "type": "Feature",
+                        "properties": {
+                            "time": time_str,
+                            "condition": condition_text,
+                            # Raw values for the get_forecast service; not exposed as attributes
+                            "datetime": time_iso,
+                            "overall_road_condition": overall_rc,
+                            "road_condition": road_rc,
+                            "reliability": f.get("reliability"),
+                            "road_temperature": f.get("roadTemperature"),
+                            "temperature": f.get("temperature"),
+                            "weather_symbol": f.get("weatherSymbol"),
+                            "wind_speed": f.get("windSpeed"),
+                            "wind_direction": f.get("windDirection"),
+                            "daylight": f.get("daylight"),
+                        },
+                        "geometry": {"type": "Point", "coordinates": [0, 0]}
+                    })
+            if forecasts:
+                return {"features": forecasts}
+
+        # No real data available - return unavailable instead of mock
+        unavailable_text = "Tiedot eivät saatavilla" if language == "fi" else "Data unavailable"
+        return {
+            "features": [{
+                "type": "Feature",
+                "properties": {
+                    "time": "N/A",
+                    "condition": unavailable_text,
+                },
+                "geometry": {"type": "Point", "coordinates": [0, 0]}
+            }]
+        }
+
+    async def async_get_section_reports(
+        self,
+        section_ids: List[str],
+        language: str = "fi",
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch conditions and forecast for many sections with one feed download.
+
+        `section_ids` must already be API section ids. Returns a mapping of
+        section id -> {"conditions": ..., "forecast": ...}.
+        """
+        feed = await self.async_get_forecast_feed()
+        return {
+            section_id: {
+                "conditions": self._conditions_from_feed(section_id, section_id, feed, language),
+                "forecast": self._forecast_from_feed(section_id, feed, language),
+            }
+            for section_id in section_ids
+        }
+
     async def get_road_conditions(self, section_id: str, language: str = "fi") -> Optional[Dict[str, Any]]:
         """Fetch current road conditions for a specific section.
         
@@ -704,77 +929,9 @@ class DigitraficClient:
         """
         try:
             _LOGGER.debug("Fetching road conditions for section: %s", section_id)
-
-            # Attempt to resolve user input to API section ID
-            resolved_id = section_id
-            if not re.match(r"^[0-9]{5}_\d+", section_id):
-                # Doesn't look like an API ID, try to resolve
-                resolved = await self.resolve_section_id(section_id)
-                if resolved:
-                    resolved_id = resolved
-                else:
-                    _LOGGER.warning("Could not resolve section title: %s", section_id)
-            
-            # If session looks like an aiohttp session, attempt to fetch real data
-            if hasattr(self.session, "get"):
-                try:
-                    async with self.session.get(FORECAST_SECTIONS_URL) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            # Find matching forecast section by resolved ID
-                            for fs in data.get("forecastSections", []):
-                                if fs.get("id") == resolved_id:
-                                    # Find observation
-                                    obs = next((f for f in fs.get("forecasts", []) if f.get("type") == "OBSERVATION"), None)
-                                    if obs:
-                                        rc = obs.get("overallRoadCondition") or obs.get("forecastConditionReason", {}).get("roadCondition")
-                                        condition_text = ROAD_CONDITION_MAP.get(rc, {}).get(language, rc or "Unknown")
-                                        return {
-                                            "features": [
-                                                {
-                                                    "type": "Feature",
-                                                    "properties": {
-                                                        "id": fs.get("id"),
-                                                        "location": section_id,
-                                                        "condition": condition_text,
-                                                        "reliability": obs.get("reliability"),
-                                                        "last_updated": data.get("dataUpdatedTime"),
-                                                    },
-                                                    "geometry": {"type": "Point", "coordinates": [0, 0]}
-                                                }
-                                            ]
-                                        }
-                except Exception as err:
-                    _LOGGER.debug("Failed to fetch real road conditions, falling back to mock: %s", err)
-
-            # Fallback to mock data if network unavailable or no match
-            section = next(
-                (s for s in MOCK_ROAD_SECTIONS if s["id"] == section_id),
-                None
-            )
-            location = section["location"] if section else section_id
-
-            # Choose language for condition descriptions
-            if language == "en":
-                condition = ENGLISH_ROAD_CONDITIONS[hash(section_id) % len(ENGLISH_ROAD_CONDITIONS)]
-            else:
-                condition = FINNISH_ROAD_CONDITIONS[hash(section_id) % len(FINNISH_ROAD_CONDITIONS)]
-
-            return {
-                "features": [
-                    {
-                        "type": "Feature",
-                        "properties": {
-                            "id": section_id,
-                            "location": location,
-                            "condition": condition,
-                            "reliability": 90 + (hash(section_id) % 10),
-                            "last_updated": datetime.now().isoformat(),
-                        },
-                        "geometry": {"type": "Point", "coordinates": [0, 0]}
-                    }
-                ]
-            }
+            resolved_id = await self._async_resolve_for_fetch(section_id)
+            feed = await self.async_get_forecast_feed()
+            return self._conditions_from_feed(resolved_id, section_id, feed, language)
         except Exception as err:
             _LOGGER.error("Error fetching road conditions for %s: %s", section_id, err)
             return None
@@ -788,87 +945,9 @@ class DigitraficClient:
         """
         try:
             _LOGGER.debug("Fetching forecast for section: %s", section_id)
-            
-            # Attempt to resolve user input to API section ID
-            resolved_id = section_id
-            if not re.match(r"^[0-9]{5}_\d+", section_id):
-                # Doesn't look like an API ID, try to resolve
-                resolved = await self.resolve_section_id(section_id)
-                if resolved:
-                    resolved_id = resolved
-                else:
-                    _LOGGER.warning("Could not resolve section title: %s", section_id)
-            
-            # Try to use real API if session supports network calls
-            if hasattr(self.session, "get"):
-                try:
-                    async with self.session.get(FORECAST_SECTIONS_URL) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            # Find matching forecast section by resolved ID
-                            for fs in data.get("forecastSections", []):
-                                if fs.get("id") == resolved_id:
-                                    # Build forecasts from API
-                                    forecasts = []
-                                    for f in fs.get("forecasts", []):
-                                        if f.get("type") == "FORECAST":
-                                            time_iso = f.get("time")
-                                            try:
-                                                # Parse UTC time and convert to EET (UTC+2)
-                                                dt_utc = datetime.fromisoformat(time_iso.replace("Z", "+00:00"))
-                                                # Convert to EET (UTC+2)
-                                                eet = timezone(timedelta(hours=2))
-                                                dt_eet = dt_utc.astimezone(eet)
-                                                time_str = dt_eet.strftime("%H:%M")
-                                            except Exception:
-                                                time_str = time_iso
-                                            
-                                            # Get overall road condition
-                                            overall_rc = f.get("overallRoadCondition")
-                                            overall_text = ROAD_CONDITION_MAP.get(overall_rc, {}).get(language, overall_rc or "")
-                                            
-                                            # Get specific road condition
-                                            road_rc = f.get("forecastConditionReason", {}).get("roadCondition")
-                                            road_text = ROAD_CONDITION_MAP.get(road_rc, {}).get(language, road_rc or "")
-                                            # Make specific condition lowercase
-                                            if road_text:
-                                                road_text = road_text[0].lower() + road_text[1:] if len(road_text) > 0 else road_text
-                                            
-                                            # Combine both conditions
-                                            if overall_text and road_text:
-                                                condition_text = f"{overall_text}, {road_text}"
-                                            elif overall_text:
-                                                condition_text = overall_text
-                                            elif road_text:
-                                                condition_text = road_text
-                                            else:
-                                                condition_text = "Unavailable"
-                                            
-                                            forecasts.append({
-                                                "type": "Feature",
-                                                "properties": {
-                                                    "time": time_str,
-                                                    "condition": condition_text,
-                                                },
-                                                "geometry": {"type": "Point", "coordinates": [0, 0]}
-                                            })
-                                    if forecasts:
-                                        return {"features": forecasts}
-                except Exception as err:
-                    _LOGGER.debug("Failed to fetch real forecast: %s", err)
-
-            # No real data available - return unavailable instead of mock
-            unavailable_text = "Tiedot eivät saatavilla" if language == "fi" else "Data unavailable"
-            return {
-                "features": [{
-                    "type": "Feature",
-                    "properties": {
-                        "time": "N/A",
-                        "condition": unavailable_text,
-                    },
-                    "geometry": {"type": "Point", "coordinates": [0, 0]}
-                }]
-            }
+            resolved_id = await self._async_resolve_for_fetch(section_id)
+            feed = await self.async_get_forecast_feed()
+            return self._forecast_from_feed(resolved_id, feed, language)
         except Exception as err:
             _LOGGER.error("Error fetching forecast for %s: %s", section_id, err)
             return None
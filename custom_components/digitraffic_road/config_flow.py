@@ -4,9 +4,13 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import selector
+from homeassistant.helpers import config_validation as cv
 import logging
 
+from .announcements import area_id
+from .catalog import async_get_catalog_cache
 from .client import DigitraficClient
+from .coordinator import entry_monitor_type, entry_targets
 from .const import (
     DOMAIN,
     CONF_ROAD_SECTION,
@@ -15,20 +19,242 @@ from .const import (
     CONF_MONITOR_TYPE,
     CONF_TMS_ID,
     CONF_WEATHER_STATION_ID,
+    CONF_NEARBY,
+    CONF_TARGETS,
+    CONF_CORRIDOR,
+    CONF_AREA,
+    DEFAULT_AREA_RADIUS,
+    MONITOR_ANNOUNCEMENTS,
     MONITOR_CONDITIONS,
     MONITOR_TMS,
     MONITOR_WEATHER,
+    NEARBY_COUNT,
 )
+from .store import async_get_overrides_store
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _section_name(props, fallback_name: str = "") -> str:
+    """Return the display name of a forecast section."""
+    return props.get("description") or props.get("name") or fallback_name or str(props.get("id"))
+
+
+def _picked_ids(value) -> list:
+    """Return the ids chosen in a single- or multi-select field."""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+def _weather_station_name(props) -> str:
+    """Return the display name of a weather station."""
+    name_raw = props.get("name") or str(props.get("id"))
+    return name_raw.replace("_", " ")
+
+
+def _tms_station_name(props) -> str:
+    """Return the display name of a TMS station."""
+    return props.get("names", {}).get("fi") or props.get("name") or str(props.get("id"))
+
+
 class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for DigiTraffic."""
 
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    _client = None
+
+    async def _async_get_client(self) -> DigitraficClient:
+        """Return a client reading from the integration-wide catalog cache.
+
+        The cache is seeded from the bundled snapshot, so the first search
+        does not wait for the live catalogs.
+        """
+        if self._client is None:
+            self._client = DigitraficClient(
+                async_get_clientsession(self.hass),
+                overrides=await async_get_overrides_store(self.hass),
+                catalogs=await async_get_catalog_cache(self.hass),
+            )
+        return self._client
+
+    async def _async_nearby_choices(self, catalog) -> dict:
+        """Return id -> label choices for the catalog entries closest to home.
+
+        Returns an empty mapping if Home Assistant has no location or the
+        catalog is unavailable.
+        """
+        latitude = self.hass.config.latitude
+        longitude = self.hass.config.longitude
+        if catalog is None or latitude is None or longitude is None:
+            return {}
+        return {
+            str(props.get("id")): f"{catalog.label(props)} ({distance:.1f} km)"
+            for distance, props in catalog.nearest(latitude, longitude, NEARBY_COUNT)
+        }
+
+    @staticmethod
+    def _nearby_picks(catalog, user_input) -> list:
+        """Return the catalog properties of the nearby entries the user ticked."""
+        if catalog is None:
+            return []
+        picked = (catalog.get(sid) for sid in _picked_ids(user_input.get(CONF_NEARBY)))
+        return [props for props in picked if props]
+
+    def _input_schema(self, key: str, nearby: dict) -> vol.Schema:
+        """Return a search form schema, with a nearby picker when choices exist."""
+        if not nearby:
+            return vol.Schema({vol.Required(key): str})
+        return vol.Schema(
+            {
+                vol.Optional(key): str,
+                vol.Optional(CONF_NEARBY): cv.multi_select(nearby),
+            }
+        )
+
+    def _configured_ids(self, monitor_type: str) -> set:
+        """Return the ids already covered by single or batch entries of `monitor_type`."""
+        return {
+            str(target["id"])
+            for entry in self._async_current_entries()
+            if entry_monitor_type(entry.data) == monitor_type
+            for target in entry_targets(entry.data)
+        }
+
+    async def _async_create_batch_entry(
+        self,
+        monitor_type: str,
+        targets: list,
+        title: str = None,
+        unique_id: str = None,
+        extra_data: dict = None,
+    ):
+        """Create one entry covering several sections or stations.
+
+        The entry gets a single coordinator that refreshes every target in one
+        batched update. Targets already configured in another entry are left
+        out so no entity is created twice.
+        """
+        configured = self._configured_ids(monitor_type)
+        targets = [target for target in targets if str(target["id"]) not in configured]
+        if not targets:
+            return self.async_abort(reason="all_configured")
+
+        if unique_id is None:
+            unique_id = f"{monitor_type}_" + "_".join(sorted(str(target["id"]) for target in targets))
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        if title is None:
+            title = targets[0]["name"]
+            if len(targets) > 1:
+                title = f"{title} +{len(targets) - 1}"
+
+        data = {
+            CONF_MONITOR_TYPE: monitor_type,
+            CONF_LANGUAGE: getattr(self, "language", "en"),
+            CONF_TARGETS: targets,
+            **(extra_data or {}),
+        }
+        return self.async_create_entry(title=title, data=data)
+
+    async def _async_create_corridor_entry(self, corridor, sections: list):
+        """Create one entry tracking every section of a road corridor.
+
+        The corridor itself is stored so setup can re-run the range query
+        against the current section catalog.
+        """
+        road_number, first_section, last_section = corridor
+        first_section, last_section = sorted((first_section, last_section))
+        road_label = "Tie" if getattr(self, "language", "en") == "fi" else "Road"
+        targets = [{"id": props.get("id"), "name": _section_name(props)} for props in sections]
+        return await self._async_create_batch_entry(
+            MONITOR_CONDITIONS,
+            targets,
+            title=f"{road_label} {road_number}: {first_section}–{last_section}",
+            unique_id=f"{MONITOR_CONDITIONS}_corridor_{road_number}_{first_section}_{last_section}",
+            extra_data={
+                CONF_CORRIDOR: {"road": road_number, "first": first_section, "last": last_section},
+            },
+        )
+
+    async def _async_create_picked(self, monitor_type: str, picked: list, create_single, name_fn):
+        """Create a single entry for one pick or a batch entry for several."""
+        if len(picked) == 1:
+            return await create_single(picked[0])
+        targets = [{"id": props.get("id"), "name": name_fn(props)} for props in picked]
+        return await self._async_create_batch_entry(monitor_type, targets)
+
+    async def _async_create_section_entry(self, props, fallback_name: str = ""):
+        """Create an entry for a forecast section metadata entry."""
+        chosen_id = props.get("id")
+        section_name = _section_name(props, fallback_name)
+
+        # Default monitor type to conditions if not set
+        monitor_type = getattr(self, "monitor_type", MONITOR_CONDITIONS)
+
+        if str(chosen_id) in self._configured_ids(monitor_type):
+            return self.async_abort(reason="already_configured")
+        unique_id = f"{monitor_type}_{chosen_id}"
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        data = {
+            CONF_MONITOR_TYPE: monitor_type,
+            CONF_LANGUAGE: getattr(self, "language", "en"),
+        }
+        if monitor_type == MONITOR_CONDITIONS:
+            data.update({CONF_ROAD_SECTION_ID: chosen_id, CONF_ROAD_SECTION: section_name})
+        else:
+            data.update({CONF_TMS_ID: chosen_id, CONF_ROAD_SECTION: section_name})
+
+        return self.async_create_entry(title=section_name, data=data)
+
+    async def _async_create_tms_entry(self, props):
+        """Create an entry for a TMS station."""
+        chosen_id = props.get("id")
+        section_name = _tms_station_name(props)
+
+        monitor_type = MONITOR_TMS
+        if str(chosen_id) in self._configured_ids(monitor_type):
+            return self.async_abort(reason="already_configured")
+        unique_id = f"{monitor_type}_{chosen_id}"
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        data = {
+            CONF_MONITOR_TYPE: monitor_type,
+            CONF_LANGUAGE: getattr(self, "language", "en"),
+        }
+        data.update({CONF_TMS_ID: chosen_id, CONF_ROAD_SECTION: section_name})
+
+        return self.async_create_entry(title=section_name, data=data)
+
+    async def _async_create_weather_entry(self, props):
+        """Create an entry for a road weather station."""
+        chosen_id = props.get("id")
+        station_name = _weather_station_name(props)
+
+        monitor_type = MONITOR_WEATHER
+        if str(chosen_id) in self._configured_ids(monitor_type):
+            return self.async_abort(reason="already_configured")
+        unique_id = f"{monitor_type}_{chosen_id}"
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        data = {
+            CONF_MONITOR_TYPE: monitor_type,
+            CONF_LANGUAGE: getattr(self, "language", "en"),
+            CONF_WEATHER_STATION_ID: chosen_id,
+            CONF_ROAD_SECTION: station_name,
+        }
+
+        return self.async_create_entry(title=station_name, data=data)
+
     async def async_step_user(self, user_input=None):
         """Initial step: go directly to monitor type selection."""
         # Use Home Assistant's language setting
@@ -44,6 +270,8 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_tms()
             if self.monitor_type == MONITOR_WEATHER:
                 return await self.async_step_weather()
+            if self.monitor_type == MONITOR_ANNOUNCEMENTS:
+                return await self.async_step_announcements()
             return await self.async_step_section()
 
         return self.async_show_form(
@@ -55,7 +283,7 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         default=MONITOR_CONDITIONS,
                     ): selector.SelectSelector(
                         selector.SelectSelectorConfig(
-                            options=[MONITOR_CONDITIONS, MONITOR_TMS, MONITOR_WEATHER],
+                            options=[MONITOR_CONDITIONS, MONITOR_TMS, MONITOR_WEATHER, MONITOR_ANNOUNCEMENTS],
                             mode=selector.SelectSelectorMode.LIST,
                             translation_key="monitor_type_selector",
                         )
@@ -64,22 +292,83 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
         )
 
+    async def async_step_announcements(self, user_input=None):
+        """Pick the area whose traffic announcements are tracked."""
+        if user_input is not None and CONF_AREA in user_input:
+            location = user_input[CONF_AREA]
+            # The location selector reports the radius in metres
+            radius = round(location.get("radius", DEFAULT_AREA_RADIUS * 1000) / 1000, 1)
+            area = {
+                "latitude": round(location["latitude"], 4),
+                "longitude": round(location["longitude"], 4),
+                "radius": radius,
+            }
+            await self.async_set_unique_id(
+                f"{MONITOR_ANNOUNCEMENTS}_{area_id(area['latitude'], area['longitude'], radius)}"
+            )
+            self._abort_if_unique_id_configured()
+
+            name = user_input.get(CONF_ROAD_SECTION) or f"{self.hass.config.location_name} {radius:g} km"
+            return self.async_create_entry(
+                title=name,
+                data={
+                    CONF_MONITOR_TYPE: MONITOR_ANNOUNCEMENTS,
+                    CONF_LANGUAGE: getattr(self, "language", "en"),
+                    CONF_AREA: area,
+                    CONF_ROAD_SECTION: name,
+                },
+            )
+
+        default_area = {
+            "latitude": self.hass.config.latitude,
+            "longitude": self.hass.config.longitude,
+            "radius": DEFAULT_AREA_RADIUS * 1000,
+        }
+        return self.async_show_form(
+            step_id="announcements",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_ROAD_SECTION): str,
+                    vol.Required(CONF_AREA, default=default_area): selector.LocationSelector(
+                        selector.LocationSelectorConfig(radius=True)
+                    ),
+                }
+            ),
+        )
+
     async def async_step_section(self, user_input=None):
-        """Handle the step - enter road section ID or title."""
+        """Handle the step - enter road section ID or title, or pick a nearby one."""
         errors = {}
+        client = await self._async_get_client()
+        catalog = await client.async_get_section_catalog()
 
         # If user submitted input
         if user_input is not None:
             section_input = user_input.get(CONF_ROAD_SECTION, "").strip()
+            nearby = self._nearby_picks(catalog, user_input)
+
+            if nearby and not section_input:
+                return await self._async_create_picked(
+                    getattr(self, "monitor_type", MONITOR_CONDITIONS),
+                    nearby,
+                    self._async_create_section_entry,
+                    _section_name,
+                )
+
+            corridor = client.parse_corridor(section_input) if section_input else None
 
             if not section_input:
                 errors["base"] = "empty_search"
+            elif corridor is not None:
+                # A road corridor such as "4.421-4.440" becomes one entry for all its sections
+                sections = await client.async_get_corridor_sections(*corridor)
+                if sections:
+                    return await self._async_create_corridor_entry(corridor, sections)
+                errors["base"] = "no_matches"
             else:
                 _LOGGER.debug("Road section input: %s", section_input)
 
                 # Resolve candidates using the client (may return 0, 1 or many)
-                session = async_get_clientsession(self.hass)
-                client = DigitraficClient(session)
                 try:
                     candidates = await client.resolve_section_candidates(section_input, max_candidates=12)
                 except Exception as err:
@@ -90,31 +379,7 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors["base"] = "no_matches"
                 elif len(candidates) == 1:
                     # Single candidate -> create entry directly
-                    props = candidates[0]
-                    chosen_id = props.get("id")
-                    section_name = props.get("description") or props.get("name") or section_input
-
-                    # Default monitor type to conditions if not set
-                    monitor_type = getattr(self, "monitor_type", MONITOR_CONDITIONS)
-
-                    unique_id = f"{monitor_type}_{chosen_id}"
-                    await self.async_set_unique_id(unique_id)
-                    self._abort_if_unique_id_configured()
-
-                    data = {
-                        CONF_MONITOR_TYPE: monitor_type,
-                        CONF_LANGUAGE: getattr(self, "language", "en"),
-                    }
-
-                    if monitor_type == MONITOR_CONDITIONS:
-                        data.update({
-                            CONF_ROAD_SECTION_ID: chosen_id,
-                            CONF_ROAD_SECTION: section_name,
-                        })
-                    else:
-                        data.update({CONF_TMS_ID: chosen_id, CONF_ROAD_SECTION: section_name})
-
-                    return self.async_create_entry(title=section_name, data=data)
+                    return await self._async_create_section_entry(candidates[0], section_input)
                 else:
                     # Multiple candidates -> present a pick step (dropdown)
                     # Store candidates temporarily and move to pick step
@@ -122,14 +387,12 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     self._raw_input = section_input
                     return await self.async_step_pick()
 
+        nearby = await self._async_nearby_choices(catalog)
+
         # Show input form
         return self.async_show_form(
             step_id="section",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_ROAD_SECTION): str,
-                }
-            ),
+            data_schema=self._input_schema(CONF_ROAD_SECTION, nearby),
             errors=errors,
             description_placeholders={
                 "example": "Tie 4: Kemintie 4.421"
@@ -137,9 +400,10 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def async_step_pick(self, user_input=None):
-        """Allow the user to pick one of the candidate metadata entries.
+        """Allow the user to pick one or more of the candidate metadata entries.
 
         Expects `self._candidates` to be populated by `async_step_section`.
+        Several picks become one batch entry.
         """
         if not hasattr(self, "_candidates") or not self._candidates:
             return await self.async_step_section()
@@ -147,30 +411,22 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None and "pick" in user_input:
-            pick_id = user_input.get("pick")
+            pick_ids = _picked_ids(user_input.get("pick"))
             # Find selected props
-            props = next((p for p in self._candidates if p.get("id") == pick_id), None)
-            if not props:
+            picked = [p for p in self._candidates if str(p.get("id")) in pick_ids]
+            if not picked:
                 errors["base"] = "invalid_selection"
             else:
-                chosen_id = props.get("id")
-                section_name = props.get("description") or props.get("name") or pick_id
-                monitor_type = getattr(self, "monitor_type", MONITOR_CONDITIONS)
-
-                unique_id = f"{monitor_type}_{chosen_id}"
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-
-                data = {
-                    CONF_MONITOR_TYPE: monitor_type,
-                    CONF_LANGUAGE: getattr(self, "language", "en"),
-                }
-                if monitor_type == MONITOR_CONDITIONS:
-                    data.update({CONF_ROAD_SECTION_ID: chosen_id, CONF_ROAD_SECTION: section_name})
-                else:
-                    data.update({CONF_TMS_ID: chosen_id, CONF_ROAD_SECTION: section_name})
-
-                return self.async_create_entry(title=section_name, data=data)
+                if len(picked) == 1 and getattr(self, "_raw_input", ""):
+                    # Remember the confirmed section so the same query resolves directly next time
+                    client = await self._async_get_client()
+                    client.save_override(self._raw_input, str(picked[0].get("id")))
+                return await self._async_create_picked(
+                    getattr(self, "monitor_type", MONITOR_CONDITIONS),
+                    picked,
+                    self._async_create_section_entry,
+                    _section_name,
+                )
 
         # Build choices mapping id -> label
         choices = {}
@@ -180,9 +436,9 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             rn = p.get("roadNumber")
             rs = p.get("roadSectionNumber")
             label = f"{rid} — {desc} (road={rn}, section={rs})"
-            choices[rid] = label
+            choices[str(rid)] = label
 
-        schema = vol.Schema({vol.Required("pick"): vol.In(choices)})
+        schema = vol.Schema({vol.Required("pick"): cv.multi_select(choices)})
         return self.async_show_form(step_id="pick", data_schema=schema, errors=errors)
 
     async def async_step_tms(self, user_input=None):
@@ -191,15 +447,22 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         This step searches the Digitraffic TMS stations list by the user's input
         (matching `names.fi`, `names.sv`, `names.en`, and `properties.name`).
         If multiple matches are found, present a dropdown for the user to pick.
+        Stations closest to the Home Assistant location are offered directly.
         """
         errors = {}
 
-        session = async_get_clientsession(self.hass)
-        client = DigitraficClient(session)
+        client = await self._async_get_client()
+        catalog = await client.async_get_tms_catalog()
 
         # If user submitted input
         if user_input is not None:
             tms_input = user_input.get(CONF_TMS_ID, "").strip()
+            nearby = self._nearby_picks(catalog, user_input)
+            if nearby and not tms_input:
+                return await self._async_create_picked(
+                    MONITOR_TMS, nearby, self._async_create_tms_entry, _tms_station_name
+                )
+
             if not tms_input:
                 errors["base"] = "empty_search"
             else:
@@ -212,61 +475,40 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if not candidates:
                     errors["base"] = "no_matches"
                 elif len(candidates) == 1:
-                    props = candidates[0]
-                    chosen_id = props.get("id")
-                    section_name = props.get("names", {}).get("fi") or props.get("name") or str(chosen_id)
-
-                    monitor_type = MONITOR_TMS
-                    unique_id = f"{monitor_type}_{chosen_id}"
-                    await self.async_set_unique_id(unique_id)
-                    self._abort_if_unique_id_configured()
-
-                    data = {
-                        CONF_MONITOR_TYPE: monitor_type,
-                        CONF_LANGUAGE: getattr(self, "language", "en"),
-                    }
-                    data.update({CONF_TMS_ID: chosen_id, CONF_ROAD_SECTION: section_name})
-
-                    return self.async_create_entry(title=section_name, data=data)
+                    return await self._async_create_tms_entry(candidates[0])
                 else:
                     # multiple matches - present pick step for TMS
                     self._tms_candidates = candidates
                     self._tms_raw = tms_input
                     return await self.async_step_tms_pick()
 
+        nearby = await self._async_nearby_choices(catalog)
+
         return self.async_show_form(
             step_id="tms",
-            data_schema=vol.Schema({vol.Required(CONF_TMS_ID): str}),
+            data_schema=self._input_schema(CONF_TMS_ID, nearby),
             errors=errors,
         )
 
     async def async_step_tms_pick(self, user_input=None):
-        """Allow the user to pick one of the TMS station candidates."""
+        """Allow the user to pick one or more of the TMS station candidates."""
         if not hasattr(self, "_tms_candidates") or not self._tms_candidates:
             return await self.async_step_tms()
 
         errors = {}
         if user_input is not None and "pick" in user_input:
-            pick_id = user_input.get("pick")
-            props = next((p for p in self._tms_candidates if str(p.get("id")) == str(pick_id)), None)
-            if not props:
+            pick_ids = _picked_ids(user_input.get("pick"))
+            picked = [p for p in self._tms_candidates if str(p.get("id")) in pick_ids]
+            if not picked:
                 errors["base"] = "invalid_selection"
             else:
-                chosen_id = props.get("id")
-                section_name = props.get("names", {}).get("fi") or props.get("name") or str(chosen_id)
-                monitor_type = MONITOR_TMS
-
-                unique_id = f"{monitor_type}_{chosen_id}"
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-
-                data = {
-                    CONF_MONITOR_TYPE: monitor_type,
-                    CONF_LANGUAGE: getattr(self, "language", "en"),
-                }
-                data.update({CONF_TMS_ID: chosen_id, CONF_ROAD_SECTION: section_name})
-
-                return self.async_create_entry(title=section_name, data=data)
+                if len(picked) == 1 and getattr(self, "_raw_input", ""):
+                    # Remember the confirmed section so the same query resolves directly next time
+                    client = await self._async_get_client()
+                    client.save_override(self._raw_input, str(picked[0].get("id")))
+                return await self._async_create_picked(
+                    MONITOR_TMS, picked, self._async_create_tms_entry, _tms_station_name
+                )
 
         choices = {}
         for p in self._tms_candidates:
@@ -275,18 +517,24 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             label = f"{rid} — {names.get('fi') or names.get('en') or p.get('name') or ''}"
             choices[str(rid)] = label
 
-        schema = vol.Schema({vol.Required("pick"): vol.In(choices)})
+        schema = vol.Schema({vol.Required("pick"): cv.multi_select(choices)})
         return self.async_show_form(step_id="tms_pick", data_schema=schema, errors=errors)
 
     async def async_step_weather(self, user_input=None):
         """Handle the weather station input step."""
         errors = {}
 
-        session = async_get_clientsession(self.hass)
-        client = DigitraficClient(session)
+        client = await self._async_get_client()
+        catalog = await client.async_get_weather_catalog()
 
         if user_input is not None:
             station_input = user_input.get(CONF_WEATHER_STATION_ID, "").strip()
+            nearby = self._nearby_picks(catalog, user_input)
+            if nearby and not station_input:
+                return await self._async_create_picked(
+                    MONITOR_WEATHER, nearby, self._async_create_weather_entry, _weather_station_name
+                )
+
             if not station_input:
                 errors["base"] = "empty_search"
             else:
@@ -299,64 +547,39 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if not candidates:
                     errors["base"] = "no_matches"
                 elif len(candidates) == 1:
-                    props = candidates[0]
-                    chosen_id = props.get("id")
-                    name_raw = props.get("name") or str(chosen_id)
-                    station_name = name_raw.replace("_", " ")
-
-                    monitor_type = MONITOR_WEATHER
-                    unique_id = f"{monitor_type}_{chosen_id}"
-                    await self.async_set_unique_id(unique_id)
-                    self._abort_if_unique_id_configured()
-
-                    data = {
-                        CONF_MONITOR_TYPE: monitor_type,
-                        CONF_LANGUAGE: getattr(self, "language", "en"),
-                        CONF_WEATHER_STATION_ID: chosen_id,
-                        CONF_ROAD_SECTION: station_name,
-                    }
-
-                    return self.async_create_entry(title=station_name, data=data)
+                    return await self._async_create_weather_entry(candidates[0])
                 else:
                     self._weather_candidates = candidates
                     self._weather_raw = station_input
                     return await self.async_step_weather_pick()
 
+        nearby = await self._async_nearby_choices(catalog)
+
         return self.async_show_form(
             step_id="weather",
-            data_schema=vol.Schema({vol.Required(CONF_WEATHER_STATION_ID): str}),
+            data_schema=self._input_schema(CONF_WEATHER_STATION_ID, nearby),
             errors=errors,
         )
 
     async def async_step_weather_pick(self, user_input=None):
-        """Allow the user to pick one of the weather station candidates."""
+        """Allow the user to pick one or more of the weather station candidates."""
         if not hasattr(self, "_weather_candidates") or not self._weather_candidates:
             return await self.async_step_weather()
 
         errors = {}
         if user_input is not None and "pick" in user_input:
-            pick_id = user_input.get("pick")
-            props = next((p for p in self._weather_candidates if str(p.get("id")) == str(pick_id)), None)
-            if not props:
+            pick_ids = _picked_ids(user_input.get("pick"))
+            picked = [p for p in self._weather_candidates if str(p.get("id")) in pick_ids]
+            if not picked:
                 errors["base"] = "invalid_selection"
             else:
-                chosen_id = props.get("id")
-                name_raw = props.get("name") or str(chosen_id)
-                station_name = name_raw.replace("_", " ")
-
-                monitor_type = MONITOR_WEATHER
-                unique_id = f"{monitor_type}_{chosen_id}"
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-
-                data = {
-                    CONF_MONITOR_TYPE: monitor_type,
-                    CONF_LANGUAGE: getattr(self, "language", "en"),
-                    CONF_WEATHER_STATION_ID: chosen_id,
-                    CONF_ROAD_SECTION: station_name,
-                }
-
-                return self.async_create_entry(title=station_name, data=data)
+                if len(picked) == 1 and getattr(self, "_raw_input", ""):
+                    # Remember the confirmed section so the same query resolves directly next time
+                    client = await self._async_get_client()
+                    client.save_override(self._raw_input, str(picked[0].get("id")))
+                return await self._async_create_picked(
+                    MONITOR_WEATHER, picked, self._async_create_weather_entry, _weather_station_name
+                )
 
         choices = {}
         for props in self._weather_candidates:
@@ -365,7 +588,7 @@ class DigitraficRoadConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             label = f"{sid} — {name_raw.replace('_', ' ')}"
             choices[str(sid)] = label
 
-        schema = vol.Schema({vol.Required("pick"): vol.In(choices)})
+        schema = vol.Schema({vol.Required("pick"): cv.multi_select(choices)})
         return self.async_show_form(step_id="weather_pick", data_schema=schema, errors=errors)
 
     @staticmethod
@@ -0,0 +1,70 @@
+"""Free-flow ratio and congestion level of TMS stations."""
+from bisect import bisect_right
+from typing import Any, Dict, Optional
+
+from .keys import measurement_key_id
+
+DIRECTIONS = (1, 2)
+
+# Ratio of the 5 minute rolling average speed to the station's free-flow
+# speed (VVAPAAS constant); a level applies from its lower bound upwards
+CONGESTION_LEVELS = ("stationary", "queuing", "slow", "heavy", "free_flow")
+CONGESTION_BOUNDS = (0.25, 0.5, 0.75, 0.9)
+
+# Key ids per direction: rolling speed, free-flow speed constant and the
+# percentage of free-flow speed published by the station itself
+SPEED_KEYS = {d: measurement_key_id(f"KESKINOPEUS_5MIN_LIUKUVA_SUUNTA{d}") for d in DIRECTIONS}
+FREE_FLOW_KEYS = {d: measurement_key_id(f"VVAPAAS{d}") for d in DIRECTIONS}
+FREE_FLOW_PERCENT_KEYS = {
+    d: measurement_key_id(f"KESKINOPEUS_5MIN_LIUKUVA_SUUNTA{d}_VVAPAAS{d}") for d in DIRECTIONS
+}
+
+
+def congestion_level(ratio: float) -> str:
+    """Return the congestion level of a free-flow ratio."""
+    return CONGESTION_LEVELS[bisect_right(CONGESTION_BOUNDS, ratio)]
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _measured(index: Dict[int, Any], key: int) -> Optional[float]:
+    # Alias entries (measurement None) may point at a different LAM key
+    entry = index.get(key)
+    if entry is None or entry.measurement is None:
+        return None
+    return _number(entry.measurement.value)
+
+
+def _metrics(ratio: float, speed: Optional[float], free_flow: Optional[float]) -> Dict[str, Any]:
+    return {"ratio": ratio, "level": congestion_level(ratio), "speed": speed, "free_flow_speed": free_flow}
+
+
+def compute_congestion(data: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """Return identifier -> direction -> congestion metrics for a TMS update.
+
+    `data` maps station ids to coordinator payloads (their `index`, see
+    `build_tms_index`), so each station and direction costs two or three
+    dict lookups by key id. A direction without a VVAPAAS constant falls
+    back to the free-flow percentage the station reports; directions with
+    neither are left out.
+    """
+    result: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    for identifier, payload in data.items():
+        index = (payload or {}).get("index") or {}
+        for direction in DIRECTIONS:
+            speed = _measured(index, SPEED_KEYS[direction])
+            free_entry = index.get(FREE_FLOW_KEYS[direction])
+            free = _number(free_entry.value) if free_entry is not None and free_entry.constant else None
+            if speed is not None and free:
+                metrics = _metrics(speed / free, speed, free)
+            else:
+                percent = _measured(index, FREE_FLOW_PERCENT_KEYS[direction])
+                if percent is None:
+                    continue
+                metrics = _metrics(percent / 100, speed, None)
+            result.setdefault(identifier, {})[direction] = metrics
+    return result
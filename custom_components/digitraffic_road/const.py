@@ -1,22 +1,79 @@
 """Constants for the DigiTraffic integration."""
 
 DOMAIN = "digitraffic_road"
+DATA_OVERRIDES = f"{DOMAIN}_overrides"
+DATA_CATALOGS = f"{DOMAIN}_catalogs"
+DATA_CAMERA_IMAGES = f"{DOMAIN}_camera_images"
 CONF_ROAD_SECTION = "road_section"
 CONF_ROAD_SECTION_ID = "road_section_id"
+CONF_RESOLVED_SECTION_ID = "resolved_section_id"
 CONF_LANGUAGE = "language"
 CONF_MONITOR_TYPE = "monitor_type"
 CONF_TMS_ID = "tms_id"
 CONF_WEATHER_STATION_ID = "weather_station_id"
+CONF_NEARBY = "nearby"
+CONF_TARGETS = "targets"
+CONF_CORRIDOR = "corridor"
+CONF_AREA = "area"
 
 MONITOR_CONDITIONS = "conditions"
 MONITOR_TMS = "tms"
 MONITOR_WEATHER = "weather"
+MONITOR_ANNOUNCEMENTS = "announcements"
 
 UPDATE_INTERVAL = 300  # Update every 5 minutes
+CATALOG_TTL = 6 * 3600  # Station and section lists change rarely
+SENSOR_CONSTANTS_TTL = 12 * 3600  # TMS sensor constants (e.g. VVAPAAS) change even more rarely
+# From this many stations in an entry, one all-stations request replaces the
+# per-station ones; below it the nationwide payloads cost more than they save
+BATCH_MIN_STATIONS = 10
+CATALOG_SECTIONS = "sections"
+CATALOG_TMS = "tms"
+CATALOG_WEATHER = "weather"
+CATALOG_WEATHERCAM = "weathercam"
+NEARBY_COUNT = 8  # Closest stations/sections offered in the config flow
+DEFAULT_AREA_RADIUS = 25  # km around the chosen point for traffic announcements
+
+CAMERA_PUBLISH_INTERVAL = 600  # Weather camera images are published about every 10 minutes
+CAMERA_MATCH_KM = 1.0  # Cameras this close to a weather station belong to it
+CAMERA_MEMORY_CACHE_BYTES = 8 * 1024 * 1024
+CAMERA_DISK_CACHE_BYTES = 64 * 1024 * 1024
+# Camera images live under <config>/.cache, away from the JSON state in .storage
+CAMERA_CACHE_DIR = ".cache"
+HISTORY_SIZE = 36  # Samples kept per measurement: 3 hours at the update interval
+TREND_WINDOW = 1800  # Seconds covered by the trend attributes
 
 ATTR_RELIABILITY = "reliability"
 ATTR_TIME = "time"
 ATTR_CONDITION = "condition"
 
+# LAM measurements exposed as sensors for every TMS station
+TMS_MEASUREMENT_KEYS = [
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1",
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2",
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1_VVAPAAS1",
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2_VVAPAAS2",
+    "KESKINOPEUS_60MIN_KIINTEA_SUUNTA1",
+    "KESKINOPEUS_60MIN_KIINTEA_SUUNTA2",
+    "KESKINOPEUS_5MIN_KIINTEA_SUUNTA1_VVAPAAS1",
+    "KESKINOPEUS_5MIN_KIINTEA_SUUNTA2_VVAPAAS2",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA1",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA2",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA1_MS1",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA2_MS2",
+    "OHITUKSET_5MIN_KIINTEA_SUUNTA1_MS1",
+    "OHITUKSET_5MIN_KIINTEA_SUUNTA2_MS2",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA1",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA2",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA1_MS1",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA2_MS2",
+]
+
+# Unit placeholders the API reports for unknown units
+INVALID_UNITS = ("///", "???", "***")
+
+SERVICE_GET_FORECAST = "get_forecast"
+SERVICE_BACKFILL_STATISTICS = "backfill_statistics"
+
 SENSOR_TYPE_CONDITIONS = "current_conditions"
 SENSOR_TYPE_FORECAST = "forecast"
@@ -1,150 +1,581 @@
 """Data coordinator for DigiTraffic."""
+import asyncio
 import logging
+import time
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional, Set, Tuple, Union
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .client import DigitraficClient
-from .const import DOMAIN, UPDATE_INTERVAL, MONITOR_CONDITIONS, MONITOR_TMS, MONITOR_WEATHER
+from .announcements import SITUATION_TYPES, AnnouncementStore, Area, area_id
+from .catalog import get_catalog_cache
+from .client import SECTION_ID_RE, DigitraficClient
+from .const import (
+    BATCH_MIN_STATIONS,
+    DOMAIN,
+    CONF_AREA,
+    CONF_MONITOR_TYPE,
+    CONF_RESOLVED_SECTION_ID,
+    CONF_ROAD_SECTION,
+    CONF_ROAD_SECTION_ID,
+    CONF_TARGETS,
+    CONF_TMS_ID,
+    CONF_WEATHER_STATION_ID,
+    HISTORY_SIZE,
+    UPDATE_INTERVAL,
+    MONITOR_ANNOUNCEMENTS,
+    MONITOR_CONDITIONS,
+    MONITOR_TMS,
+    MONITOR_WEATHER,
+    SENSOR_CONSTANTS_TTL,
+    TMS_MEASUREMENT_KEYS,
+)
+from .congestion import compute_congestion
+from .history import RingBuffer
+from .keys import MEASUREMENT_KEYS, measurement_key_id
+from .measurements import Measurement, TmsIndexEntry
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def entry_monitor_type(data: Dict[str, Any]) -> str:
+    """Return the monitor type of an entry, inferring it for old entries."""
+    monitor_type = data.get(CONF_MONITOR_TYPE)
+    if monitor_type is not None:
+        return monitor_type
+    if data.get(CONF_TMS_ID):
+        return MONITOR_TMS
+    if data.get(CONF_WEATHER_STATION_ID):
+        return MONITOR_WEATHER
+    return MONITOR_CONDITIONS
+
+
+def entry_targets(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the sections or stations tracked by an entry as `{"id", "name"}` dicts.
+
+    Batch entries list them under `targets`; single entries keep the id under
+    the monitor type's own key and the name under `road_section`.
+    """
+    targets = data.get(CONF_TARGETS)
+    if targets:
+        return list(targets)
+
+    monitor_type = entry_monitor_type(data)
+    if monitor_type == MONITOR_ANNOUNCEMENTS:
+        area = data.get(CONF_AREA)
+        if not area:
+            return []
+        identifier = area_id(area["latitude"], area["longitude"], area["radius"])
+    elif monitor_type == MONITOR_TMS:
+        identifier = data.get(CONF_TMS_ID)
+    elif monitor_type == MONITOR_WEATHER:
+        identifier = data.get(CONF_WEATHER_STATION_ID)
+    else:
+        identifier = data.get(CONF_ROAD_SECTION_ID)
+    if identifier is None:
+        return []
+    return [{"id": identifier, "name": data.get(CONF_ROAD_SECTION) or str(identifier)}]
+
+
+def build_tms_index(
+    measurements: Dict[str, Measurement],
+    sensor_constants: Optional[Dict[str, Any]],
+) -> Dict[int, TmsIndexEntry]:
+    """Return key id -> lookup entry for one TMS station update.
+
+    Each entry holds the entity `value` (a sensor constant wins over a
+    measurement of the same name), the `Measurement` if one exists, and
+    whether a `constant` exists. `TMS_MEASUREMENT_KEYS` that the station does
+    not report under their own name are resolved once here to the first
+    measurement whose name contains, or is contained in, the key; such alias
+    entries carry a value only.
+    """
+    index: Dict[int, TmsIndexEntry] = {}
+    for name, measurement in measurements.items():
+        index[measurement_key_id(name)] = TmsIndexEntry(measurement.value, measurement, False)
+
+    vals = sensor_constants.get("sensorConstantValues") if isinstance(sensor_constants, dict) else None
+    for v in vals or ():
+        name = v.get("name")
+        if not name:
+            continue
+        key = measurement_key_id(name)
+        entry = index.get(key)
+        index[key] = TmsIndexEntry(v.get("value"), entry.measurement if entry else None, True)
+
+    lowered = [(MEASUREMENT_KEYS.intern(name).lower, measurement) for name, measurement in measurements.items()]
+    for wanted in TMS_MEASUREMENT_KEYS:
+        key = MEASUREMENT_KEYS.intern(wanted)
+        if key.id in index:
+            continue
+        for name, measurement in lowered:
+            if key.lower in name or name in key.lower:
+                index[key.id] = TmsIndexEntry(measurement.value, None, False)
+                break
+    return index
+
+
+def build_weather_index(measurements: Dict[str, Measurement]) -> Dict[int, Measurement]:
+    """Return key id -> measurement for one weather station update.
+
+    Of names that only differ by case, the first one reported wins.
+    """
+    index: Dict[int, Measurement] = {}
+    for name, measurement in measurements.items():
+        index.setdefault(measurement_key_id(name), measurement)
+    return index
+
+
+def changed_index_keys(
+    old_data: Optional[Dict[str, Any]], new_data: Dict[str, Any]
+) -> Set[Tuple[str, int]]:
+    """Return the (identifier, key id) pairs whose lookup entry differs between two updates."""
+    changed: Set[Tuple[str, int]] = set()
+    old_data = old_data or {}
+    for identifier, payload in new_data.items():
+        new_index = (payload or {}).get("index") or {}
+        old_index = (old_data.get(identifier) or {}).get("index") or {}
+        for key in new_index.keys() | old_index.keys():
+            if new_index.get(key) != old_index.get(key):
+                changed.add((identifier, key))
+    return changed
+
+
 class DigitraficDataCoordinator(DataUpdateCoordinator):
-    """Coordinator to manage Digitraffic data updates."""
+    """Coordinator to manage Digitraffic data updates.
 
-    def __init__(self, hass: HomeAssistant, identifier: str, monitor_type: str, language: str = "fi"):
-        """Initialize the coordinator."""
+    One coordinator serves every section or station of an entry; `data` maps
+    each identifier (as a string) to that target's payload.
+
+    Measurement entities register with an `(identifier, key id)` listener
+    context; after a refresh only those whose key changed are notified.
+    Listeners without a context are always notified.
+
+    For TMS and weather stations the coordinator also keeps the last
+    `HISTORY_SIZE` numeric samples of every measurement in a `RingBuffer`,
+    keyed like the listener contexts.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        identifiers: Union[str, int, List[Any]],
+        monitor_type: str,
+        language: str = "fi",
+        entry: Optional[ConfigEntry] = None,
+        overrides: Optional[MutableMapping[str, str]] = None,
+    ):
+        """Initialize the coordinator.
+
+        `identifiers` are ids or `{"id", "name"}` targets as returned by
+        `entry_targets`. For driving-condition entries an identifier may be a
+        section title; it is resolved once and, for single-section entries,
+        the canonical id is stored back into `entry`. `overrides` is the
+        loaded section-title overrides store (see `async_get_overrides_store`).
+        """
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
-        self.identifier = str(identifier)
-        # Preserve section_id attribute for backwards compatibility with sensors that may reference it
-        self.section_id = self.identifier
         self.monitor_type = monitor_type
-        self.client = DigitraficClient(async_get_clientsession(hass))
+        self.client = DigitraficClient(
+            async_get_clientsession(hass),
+            overrides=overrides,
+            catalogs=get_catalog_cache(hass),
+        )
         self.language = language
+        self.entry = entry
+        # Bumped whenever new data is stored; entities memoize derived values per generation
+        self.generation = 0
+        # Contexts to notify after the current refresh; None notifies every listener
+        self._changed_contexts: Optional[Set[Tuple[str, int]]] = None
+        self._resolved_section_ids: Dict[str, str] = {}
+        # Set while the update listener is due for the coordinator's own entry data write
+        self.entry_data_write_pending = False
+        self._history: Dict[Tuple[str, int], RingBuffer] = {}
+        # TMS sensor constants by station id, downloaded once per SENSOR_CONSTANTS_TTL
+        self._sensor_constants: Dict[str, Dict[str, Any]] = {}
+        self._sensor_constants_expire = 0.0
+        # Traffic messages of an announcements entry, synced incrementally
+        self.announcements: Optional[AnnouncementStore] = None
+        if monitor_type == MONITOR_ANNOUNCEMENTS and entry is not None and entry.data.get(CONF_AREA):
+            area = entry.data[CONF_AREA]
+            self.announcements = AnnouncementStore(
+                Area(area["latitude"], area["longitude"], area["radius"]), language
+            )
+        self._set_targets(identifiers if isinstance(identifiers, (list, tuple)) else [identifiers])
+        if entry is not None and len(self.identifiers) == 1 and entry.data.get(CONF_RESOLVED_SECTION_ID):
+            self._resolved_section_ids[self.identifier] = entry.data[CONF_RESOLVED_SECTION_ID]
         _LOGGER.debug(
             "Initialized coordinator for %s with monitor type %s",
-            self.identifier,
+            ", ".join(self.identifiers),
             self.monitor_type,
         )
 
+    def _set_targets(self, items: List[Any]) -> None:
+        """Set the sections or stations served by this coordinator."""
+        self.targets: List[Dict[str, str]] = []
+        for item in items:
+            if isinstance(item, dict):
+                identifier = str(item["id"])
+                self.targets.append({"id": identifier, "name": item.get("name") or identifier})
+            else:
+                self.targets.append({"id": str(item), "name": str(item)})
+        self.identifiers: List[str] = [target["id"] for target in self.targets]
+        self.identifier = self.identifiers[0]
+        # Preserve section_id attribute for backwards compatibility with sensors that may reference it
+        self.section_id = self.identifier
+        for identifier in self.identifiers:
+            if SECTION_ID_RE.match(identifier):
+                self._resolved_section_ids.setdefault(identifier, identifier)
+
+    async def async_load_corridor(self, corridor: Dict[str, Any]) -> None:
+        """Track the sections currently in a road corridor entry.
+
+        One range query against the section catalog at setup; if it finds
+        nothing (e.g. catalog unavailable) the targets stored in the entry
+        are kept.
+        """
+        sections = await self.client.async_get_corridor_sections(
+            corridor["road"], corridor["first"], corridor["last"]
+        )
+        # Sections tracked by another entry keep their entities there
+        configured = {
+            str(target["id"])
+            for other in self.hass.config_entries.async_entries(DOMAIN)
+            if self.entry is None or other.entry_id != self.entry.entry_id
+            if entry_monitor_type(other.data) == self.monitor_type
+            for target in entry_targets(other.data)
+        }
+        targets = [
+            {"id": props.get("id"), "name": props.get("description") or props.get("name")}
+            for props in sections
+            if str(props.get("id")) not in configured
+        ]
+        if not targets:
+            _LOGGER.warning("No sections found for corridor %s, using stored sections", corridor)
+            return
+        self._set_targets(targets)
+        _LOGGER.debug("Corridor %s covers %d sections", corridor, len(self.targets))
+
+    @property
+    def resolved_section_id(self) -> Optional[str]:
+        """Return the canonical id of the (first) section, if resolved."""
+        return self._resolved_section_ids.get(self.identifier)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify context-less listeners and those whose measurement key changed."""
+        changed = self._changed_contexts
+        self._changed_contexts = None
+        if changed is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    def resolved_id_for(self, identifier: Any) -> Optional[str]:
+        """Return the canonical forecast section id of a section, if resolved."""
+        return self._resolved_section_ids.get(str(identifier))
+
+    def data_for(self, identifier: Any) -> Dict[str, Any]:
+        """Return the payload of one section or station, or {} if missing."""
+        return (self.data or {}).get(str(identifier)) or {}
+
+    def history_for(self, identifier: Any, key: int) -> Optional[RingBuffer]:
+        """Return the recent samples of a station measurement by key id, if any."""
+        return self._history.get((str(identifier), key))
+
+    def _record_history(self, data: Dict[str, Any]) -> None:
+        """Append the numeric measurements of an update to their ring buffers."""
+        for identifier, payload in data.items():
+            for name, measurement in (payload.get("measurements") or {}).items():
+                value = measurement.value
+                if measurement.measured_ts is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                key = (identifier, measurement_key_id(name))
+                buffer = self._history.get(key)
+                if buffer is None:
+                    buffer = self._history[key] = RingBuffer(HISTORY_SIZE)
+                buffer.append(measurement.measured_ts, value)
+
+    async def _async_resolve_section_ids(self) -> Dict[str, str]:
+        """Return identifier -> canonical forecast section id for this entry.
+
+        A section title is resolved at most once: the result is kept in memory
+        and persisted to the config entry data, so later refreshes never touch
+        the resolver. Persisting it does not reload the entry, see
+        `async_reload_entry`. If resolution fails the title is used as-is and resolution
+        is retried on the next refresh.
+        """
+        resolved_ids: Dict[str, str] = {}
+        for identifier in self.identifiers:
+            resolved = self._resolved_section_ids.get(identifier)
+            if resolved is None:
+                resolved = await self.client.resolve_section_id(identifier)
+                if not resolved:
+                    _LOGGER.warning("Could not resolve section title: %s", identifier)
+                    resolved_ids[identifier] = identifier
+                    continue
+                _LOGGER.debug("Resolved section title %s to %s", identifier, resolved)
+                self._resolved_section_ids[identifier] = resolved
+                if (
+                    self.entry is not None
+                    and len(self.identifiers) == 1
+                    and self.entry.data.get(CONF_RESOLVED_SECTION_ID) != resolved
+                ):
+                    # The update listener runs as a task after this call returns; it clears the flag
+                    self.entry_data_write_pending = True
+                    self.hass.config_entries.async_update_entry(
+                        self.entry,
+                        data={**self.entry.data, CONF_RESOLVED_SECTION_ID: resolved},
+                    )
+            resolved_ids[identifier] = resolved
+        return resolved_ids
+
+    def _station_ids(self, label: str) -> List[int]:
+        station_ids = []
+        for identifier in self.identifiers:
+            try:
+                station_ids.append(int(identifier))
+            except ValueError as err:
+                raise UpdateFailed(f"Invalid {label} station id: {identifier}") from err
+        return station_ids
+
+    def _tms_payload(
+        self,
+        identifier: str,
+        station: Optional[Dict[str, Any]],
+        sensor_constants: Optional[Dict[str, Any]],
+        tms_data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        measurements: Dict[str, Measurement] = {}
+
+        if tms_data and isinstance(tms_data, dict):
+            _LOGGER.debug("TMS data keys: %s", list(tms_data.keys()))
+            sensor_values = tms_data.get("sensorValues", []) or []
+            _LOGGER.debug(
+                "Found %d sensor values for station %s",
+                len(sensor_values),
+                identifier,
+            )
+
+            for sv in sensor_values:
+                measurement = Measurement.from_api(sv)
+                if measurement is not None:
+                    measurements[measurement.name] = measurement
+
+        if station is None and not measurements:
+            _LOGGER.warning("No TMS station data for id: %s", identifier)
+
+        return {
+            "tms_station": station,
+            "sensor_constants": sensor_constants,
+            "measurements": measurements,
+            # Shared by every entity of the station: one dict lookup per property
+            "index": build_tms_index(measurements, sensor_constants),
+        }
+
+    def _weather_payload(
+        self,
+        identifier: str,
+        station: Optional[Dict[str, Any]],
+        station_data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        measurements: Dict[str, Measurement] = {}
+        data_updated_time = None
+
+        if station_data and isinstance(station_data, dict):
+            data_updated_time = station_data.get("dataUpdatedTime")
+            for sv in station_data.get("sensorValues", []) or []:
+                measurement = Measurement.from_api(sv)
+                if measurement is not None:
+                    measurements[measurement.name] = measurement
+
+        if station is None and not measurements:
+            _LOGGER.warning("No weather station data for id: %s", identifier)
+
+        return {
+            "weather_station": station,
+            "measurements": measurements,
+            "data_updated_time": data_updated_time,
+            "index": build_weather_index(measurements),
+            # Changes only when the station starts or stops reporting a
+            # measurement; the sensor platform adds entities when it changes
+            "key_fingerprint": hash(frozenset(measurements)) if measurements else None,
+        }
+
+    @staticmethod
+    async def _async_stations_data(
+        station_ids: List[int],
+        fetch_one: Callable[[int], Awaitable[Optional[Dict[str, Any]]]],
+        fetch_all: Callable[[List[int]], Awaitable[Dict[str, Dict[str, Any]]]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return station id -> payload, from one all-stations request for large entries.
+
+        Below `BATCH_MIN_STATIONS` the stations are requested one by one
+        (concurrently); the nationwide payload would be far larger than the
+        per-station ones it replaces.
+        """
+        if len(station_ids) >= BATCH_MIN_STATIONS:
+            return await fetch_all(station_ids)
+        results = await asyncio.gather(*(fetch_one(station_id) for station_id in station_ids))
+        return {str(station_id): result for station_id, result in zip(station_ids, results) if result}
+
+    async def _async_tms_sensor_constants(self, station_ids: List[int]) -> Dict[str, Dict[str, Any]]:
+        """Return sensor constants by station id, refreshed once per `SENSOR_CONSTANTS_TTL`.
+
+        If some stations are missing from a download the constants are
+        fetched again on the next refresh; the last values are kept meanwhile.
+        """
+        now = time.monotonic()
+        if now < self._sensor_constants_expire:
+            return self._sensor_constants
+        constants = await self._async_stations_data(
+            station_ids,
+            self.client.async_get_tms_sensor_constants,
+            self.client.async_get_tms_sensor_constants_all,
+        )
+        self._sensor_constants.update(constants)
+        if all(str(station_id) in constants for station_id in station_ids):
+            self._sensor_constants_expire = now + SENSOR_CONSTANTS_TTL
+        return self._sensor_constants
+
+    async def _async_update_tms(self) -> Dict[str, Any]:
+        station_ids = self._station_ids("TMS")
+        constants = await self._async_tms_sensor_constants(station_ids)
+        stations_data = await self._async_stations_data(
+            station_ids,
+            self.client.async_get_tms_station_data,
+            self.client.async_get_tms_stations_data,
+        )
+        # Station metadata comes from the cached catalog on every path, so
+        # payloads look the same however many stations the entry has
+        catalog = await self.client.async_get_tms_catalog()
+        data = {
+            identifier: self._tms_payload(
+                identifier,
+                catalog.get(identifier) if catalog is not None else None,
+                constants.get(identifier),
+                stations_data.get(identifier),
+            )
+            for identifier in self.identifiers
+        }
+        return self._with_congestion(data)
+
+    @staticmethod
+    def _with_congestion(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add each station's per-direction congestion metrics, computed for all stations at once."""
+        congestion = compute_congestion(data)
+        for identifier, payload in data.items():
+            payload["congestion"] = congestion.get(identifier, {})
+        return data
+
+    async def _async_update_weather(self) -> Dict[str, Any]:
+        station_ids = self._station_ids("weather")
+        stations_data = await self._async_stations_data(
+            station_ids,
+            self.client.async_get_weather_station_data,
+            self.client.async_get_weather_stations_data,
+        )
+        catalog = await self.client.async_get_weather_catalog()
+        return {
+            identifier: self._weather_payload(
+                identifier,
+                catalog.get(identifier) if catalog is not None else None,
+                stations_data.get(identifier),
+            )
+            for identifier in self.identifiers
+        }
+
+    async def _async_update_sections(self) -> Dict[str, Any]:
+        resolved_ids = await self._async_resolve_section_ids()
+        # One forecast feed download covers every section of the entry
+        reports = await self.client.async_get_section_reports(
+            list(dict.fromkeys(resolved_ids.values())), language=self.language
+        )
+
+        data: Dict[str, Any] = {}
+        for identifier in self.identifiers:
+            report = reports.get(resolved_ids[identifier]) or {}
+            conditions = report.get("conditions")
+            forecast = report.get("forecast")
+
+            if conditions is None:
+                _LOGGER.warning("No conditions data for section: %s", identifier)
+            if forecast is None:
+                _LOGGER.warning("No forecast data for section: %s", identifier)
+
+            data[identifier] = {
+                "conditions": conditions,
+                "forecast": forecast,
+            }
+        return data
+
+    async def _async_update_announcements(self) -> Dict[str, Any]:
+        store = self.announcements
+        if store is None:
+            raise UpdateFailed("Announcement entry has no area configured")
+
+        status, feed, validators = await self.client.async_get_traffic_messages(
+            SITUATION_TYPES, store.etag, store.last_modified
+        )
+        if status == 304 and self.data is not None:
+            _LOGGER.debug("Traffic messages not modified")
+            return self.data
+        if feed is None:
+            raise UpdateFailed(f"Traffic message feed unavailable (status {status})")
+        store.etag = validators.get("etag")
+        store.last_modified = validators.get("last_modified")
+
+        if not store.merge(feed.get("features") or []) and self.data is not None:
+            return self.data
+        messages = store.sorted_messages()
+        counts: Dict[str, int] = {}
+        for message in messages:
+            situation_type = message.get("situation_type") or "UNKNOWN"
+            counts[situation_type] = counts.get(situation_type, 0) + 1
+        return {self.identifier: {"messages": messages, "counts": counts}}
+
     async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch data from Digitraffic API."""
+        """Fetch data from Digitraffic API for every target of the entry."""
+        self._changed_contexts = None
         try:
             _LOGGER.debug(
                 "Updating data for %s (monitor_type=%s)",
-                self.identifier,
+                ", ".join(self.identifiers),
                 self.monitor_type,
             )
 
-            data: Dict[str, Any]
-
             if self.monitor_type == MONITOR_TMS:
-                try:
-                    station_id = int(str(self.identifier))
-                except ValueError as err:
-                    raise UpdateFailed(f"Invalid TMS station id: {self.identifier}") from err
-
-                station = await self.client.async_get_tms_station(station_id)
-                sensor_constants = await self.client.async_get_tms_sensor_constants(station_id)
-                tms_data = await self.client.async_get_tms_station_data(station_id)
-
-                measurements: Dict[str, Any] = {}
-                sensor_values = []
-
-                if tms_data and isinstance(tms_data, dict):
-                    _LOGGER.debug("TMS data keys: %s", list(tms_data.keys()))
-                    sensor_values = tms_data.get("sensorValues", []) or []
-                    _LOGGER.debug(
-                        "Found %d sensor values for station %s",
-                        len(sensor_values),
-                        self.identifier,
-                    )
-
-                    for sv in sensor_values:
-                        name = sv.get("name")
-                        if not name:
-                            continue
-                        measurements[name] = {
-                            "id": sv.get("id"),
-                            "value": sv.get("value"),
-                            "unit": sv.get("unit"),
-                            "measuredTime": sv.get("measuredTime"),
-                            "timeWindowStart": sv.get("timeWindowStart"),
-                            "timeWindowEnd": sv.get("timeWindowEnd"),
-                        }
-
-                if station is None and not measurements:
-                    _LOGGER.warning("No TMS station data for id: %s", self.identifier)
-
-                data = {
-                    "tms_station": station,
-                    "sensor_constants": sensor_constants,
-                    "measurements": measurements,
-                    "sensor_values": sensor_values,
-                }
-
+                data = await self._async_update_tms()
+                self._record_history(data)
             elif self.monitor_type == MONITOR_WEATHER:
-                try:
-                    station_id = int(str(self.identifier))
-                except ValueError as err:
-                    raise UpdateFailed(f"Invalid weather station id: {self.identifier}") from err
-
-                station_feature = await self.client.async_get_weather_station(station_id)
-                station_data = await self.client.async_get_weather_station_data(station_id)
-
-                measurements: Dict[str, Any] = {}
-                sensor_values = []
-                data_updated_time = None
-
-                if station_data and isinstance(station_data, dict):
-                    sensor_values = station_data.get("sensorValues", []) or []
-                    data_updated_time = station_data.get("dataUpdatedTime")
-                    for sv in sensor_values:
-                        key = sv.get("name")
-                        if not key:
-                            continue
-                        measurements[key] = sv
-
-                if station_feature is None and not measurements:
-                    _LOGGER.warning("No weather station data for id: %s", self.identifier)
-
-                data = {
-                    "weather_station": station_feature,
-                    "measurements": measurements,
-                    "sensor_values": sensor_values,
-                    "data_updated_time": data_updated_time,
-                }
-
+                data = await self._async_update_weather()
+                self._record_history(data)
+            elif self.monitor_type == MONITOR_ANNOUNCEMENTS:
+                data = await self._async_update_announcements()
             else:
-                conditions = await self.client.get_road_conditions(self.identifier, language=self.language)
-                forecast = await self.client.get_forecast(self.identifier, language=self.language)
-
-                if conditions is None:
-                    _LOGGER.warning("No conditions data for section: %s", self.identifier)
-                if forecast is None:
-                    _LOGGER.warning("No forecast data for section: %s", self.identifier)
-
-                data = {
-                    "conditions": conditions,
-                    "forecast": forecast,
-                }
+                data = await self._async_update_sections()
 
             _LOGGER.debug(
                 "Successfully updated data for %s (type=%s)",
-                self.identifier,
+                ", ".join(self.identifiers),
                 self.monitor_type,
             )
+            # After a failed refresh every entity must re-evaluate its availability
+            if self.last_update_success and self.data:
+                self._changed_contexts = changed_index_keys(self.data, data)
+                _LOGGER.debug("%d measurement keys changed", len(self._changed_contexts))
+            self.generation += 1
             return data
-            
+
         except Exception as err:
             _LOGGER.error("Error communicating with Digitraffic API: %s", err, exc_info=True)
             raise UpdateFailed(f"Error communicating with Digitraffic API: {err}") from err
@@ -0,0 +1,84 @@
+"""Base entity for DigiTraffic."""
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import TREND_WINDOW
+from .coordinator import DigitraficDataCoordinator
+
+
+class DigitraficCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity that derives its values once per data generation.
+
+    Subclasses wrap expensive properties with `_memo`; the value is computed
+    on first access after a refresh and served from the cache until the
+    coordinator stores new data. A refresh only writes the entity's state
+    when its availability, state, unit or attributes actually changed.
+    """
+
+    coordinator: DigitraficDataCoordinator
+
+    # Attributes that change on every refresh without the value changing
+    # (e.g. station-level timestamps); they are written along with real
+    # changes but never cause a write on their own
+    _volatile_attributes: FrozenSet[str] = frozenset()
+
+    _memo_generation = -1
+    _memo_values: Dict[str, Any]
+    _written_state: Optional[Tuple[Any, ...]] = None
+
+    def _memo(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return `compute()` cached for the current coordinator data generation."""
+        generation = self.coordinator.generation
+        if generation != self._memo_generation:
+            self._memo_generation = generation
+            self._memo_values = {}
+        try:
+            return self._memo_values[name]
+        except KeyError:
+            value = self._memo_values[name] = compute()
+            return value
+
+    def _trend_attributes(self, identifier: Any, key: int) -> Dict[str, Any]:
+        """Return rolling min/max/mean/slope attributes over the last `TREND_WINDOW` seconds."""
+        history = self.coordinator.history_for(identifier, key)
+        stats = history.stats(TREND_WINDOW) if history is not None else None
+        if stats is None:
+            return {}
+        low, high, mean, slope = stats
+        return {
+            "trend_min": low,
+            "trend_max": high,
+            "trend_mean": round(mean, 3),
+            # Change per hour; positive when rising
+            "trend_slope": round(slope, 3) if slope is not None else None,
+        }
+
+    def _state_fingerprint(self) -> Tuple[Any, ...]:
+        """Return what a state write would publish, minus volatile attributes."""
+        attributes = self.extra_state_attributes or {}
+        if self._volatile_attributes:
+            attributes = {
+                key: value for key, value in attributes.items() if key not in self._volatile_attributes
+            }
+        return (
+            self.available,
+            self.state,
+            getattr(self, "native_unit_of_measurement", None),
+            attributes,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written_state = self._state_fingerprint()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the refresh changed it."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written_state:
+            return
+        self._written_state = fingerprint
+        self.async_write_ha_state()
@@ -0,0 +1,94 @@
+"""Fixed-size in-memory history of recent measurement values."""
+from array import array
+from typing import Iterator, Optional, Tuple
+
+
+class RingBuffer:
+    """Last `capacity` (timestamp, value) samples of one measurement.
+
+    Samples live in two preallocated `array("d")` columns, so a buffer costs
+    16 bytes per slot however long it runs. Timestamps are epoch seconds and
+    must not decrease; a sample with the timestamp of the newest one (the
+    station has not measured since the last poll) is ignored.
+    """
+
+    __slots__ = ("_times", "_values", "_head", "_count")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer."""
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Index the next sample is written to
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of samples kept."""
+        return len(self._times)
+
+    @property
+    def last_time(self) -> Optional[float]:
+        """Return the timestamp of the newest sample."""
+        if not self._count:
+            return None
+        return self._times[self._head - 1]
+
+    def append(self, timestamp: float, value: float) -> bool:
+        """Add a sample; return False if it was not newer than the newest one."""
+        last = self.last_time
+        if last is not None and timestamp <= last:
+            return False
+        self._times[self._head] = timestamp
+        self._values[self._head] = value
+        self._head = (self._head + 1) % len(self._times)
+        if self._count < len(self._times):
+            self._count += 1
+        return True
+
+    def samples(self, since: Optional[float] = None) -> Iterator[Tuple[float, float]]:
+        """Yield samples oldest first, optionally only those at or after `since`."""
+        capacity = len(self._times)
+        start = self._head - self._count
+        for position in range(start, self._head):
+            index = position % capacity
+            timestamp = self._times[index]
+            if since is None or timestamp >= since:
+                yield timestamp, self._values[index]
+
+    def stats(self, window: Optional[float] = None) -> Optional[Tuple[float, float, float, Optional[float]]]:
+        """Return (min, max, mean, slope) of the samples in the last `window` seconds.
+
+        The window ends at the newest sample. The slope is the least-squares
+        change per hour, None with fewer than two samples. Returns None if
+        the buffer is empty.
+        """
+        last = self.last_time
+        if last is None:
+            return None
+        since = last - window if window is not None else None
+
+        count = 0
+        low = high = None
+        sum_t = sum_v = sum_tt = sum_tv = 0.0
+        for timestamp, value in self.samples(since):
+            # Relative hours keep the sums well conditioned
+            t = (timestamp - last) / 3600
+            count += 1
+            sum_t += t
+            sum_v += value
+            sum_tt += t * t
+            sum_tv += t * value
+            low = value if low is None or value < low else low
+            high = value if high is None or value > high else high
+
+        slope = None
+        denominator = count * sum_tt - sum_t * sum_t
+        if count > 1 and denominator > 0:
+            slope = (count * sum_tv - sum_t * sum_v) / denominator
+        return low, high, sum_v / count, slope
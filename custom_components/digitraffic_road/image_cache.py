@@ -0,0 +1,198 @@
+"""Shared memory and disk cache of weather camera images."""
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# (preset id, etag, last modified) -> (status, image bytes, validators)
+Fetcher = Callable[
+    [str, Optional[str], Optional[str]],
+    Awaitable[Tuple[int, Optional[bytes], Dict[str, Optional[str]]]],
+]
+# Runs a blocking callable with its arguments off the event loop
+BlockingRunner = Callable[..., Awaitable[Any]]
+# Schedules a named background task, e.g. `hass.async_create_background_task`
+TaskFactory = Callable[[Coroutine[Any, Any, Any], str], "asyncio.Future[Any]"]
+
+
+class CachedImage:
+    """One camera image with the validators needed to revalidate it."""
+
+    __slots__ = ("content", "etag", "last_modified", "fetched_at")
+
+    def __init__(
+        self,
+        content: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        fetched_at: float,
+    ) -> None:
+        """Initialize the entry; `fetched_at` is epoch seconds."""
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+
+class CameraImageCache:
+    """Camera images shared by every camera entity and viewer.
+
+    An image younger than `interval` is served from memory (or, after a
+    restart, from disk) without a request. An older one is revalidated with
+    a conditional GET, and a 304 only renews its age. Concurrent requests
+    for the same preset wait for one shared fetch. If a fetch fails the
+    last image is served.
+
+    Both tiers are LRU with a byte limit: memory holds the recently viewed
+    images, `directory` holds up to `disk_limit` bytes of `<preset>.jpg`
+    files with `<preset>.json` validators.
+
+    Shared fetches run as `create_task` background tasks; `cancel_inflight`
+    drops them when the integration unloads.
+    """
+
+    def __init__(
+        self,
+        fetch: Fetcher,
+        run_blocking: BlockingRunner,
+        create_task: TaskFactory,
+        directory: Path,
+        interval: float,
+        memory_limit: int,
+        disk_limit: int,
+    ) -> None:
+        """Initialize an empty cache."""
+        self._fetch = fetch
+        self._run_blocking = run_blocking
+        self._create_task = create_task
+        self.directory = directory
+        self.interval = interval
+        self.memory_limit = memory_limit
+        self.disk_limit = disk_limit
+        self._memory: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._memory_bytes = 0
+        self._inflight: Dict[str, "asyncio.Future[Optional[bytes]]"] = {}
+
+    async def async_get(self, preset_id: str) -> Optional[bytes]:
+        """Return the current image of a camera preset, fetching it at most once per interval."""
+        entry = self._memory.get(preset_id)
+        if entry is not None:
+            self._memory.move_to_end(preset_id)
+        else:
+            entry = await self._run_blocking(self._read_disk, preset_id)
+            if entry is not None:
+                self._remember(preset_id, entry)
+
+        if entry is not None and time.time() - entry.fetched_at < self.interval:
+            return entry.content
+
+        future = self._inflight.get(preset_id)
+        if future is None:
+            future = self._create_task(
+                self._async_refresh(preset_id, entry), f"digitraffic_road camera image {preset_id}"
+            )
+            self._inflight[preset_id] = future
+            future.add_done_callback(lambda done: self._forget(preset_id, done))
+        # A viewer that goes away must not cancel the fetch other viewers wait for
+        return await asyncio.shield(future)
+
+    def cancel_inflight(self) -> None:
+        """Cancel and drop every shared fetch still running."""
+        inflight, self._inflight = self._inflight, {}
+        for future in inflight.values():
+            future.cancel()
+
+    def _forget(self, preset_id: str, future: "asyncio.Future[Optional[bytes]]") -> None:
+        # A fetch started after `cancel_inflight` may already hold the slot
+        if self._inflight.get(preset_id) is future:
+            del self._inflight[preset_id]
+
+    async def _async_refresh(self, preset_id: str, entry: Optional[CachedImage]) -> Optional[bytes]:
+        status, content, validators = await self._fetch(
+            preset_id,
+            entry.etag if entry is not None else None,
+            entry.last_modified if entry is not None else None,
+        )
+        now = time.time()
+
+        if status == 304 and entry is not None:
+            _LOGGER.debug("Camera image %s not modified", preset_id)
+            entry.fetched_at = now
+            await self._run_blocking(self._write_disk, preset_id, entry, False)
+            return entry.content
+
+        if status == 200 and content:
+            fresh = CachedImage(content, validators.get("etag"), validators.get("last_modified"), now)
+            self._remember(preset_id, fresh)
+            await self._run_blocking(self._write_disk, preset_id, fresh, True)
+            return content
+
+        # Serve the last image rather than a broken one
+        return entry.content if entry is not None else None
+
+    def _remember(self, preset_id: str, entry: CachedImage) -> None:
+        previous = self._memory.pop(preset_id, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous.content)
+        self._memory[preset_id] = entry
+        self._memory_bytes += len(entry.content)
+        # Keep at least the image just stored
+        while self._memory_bytes > self.memory_limit and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted.content)
+
+    def _paths(self, preset_id: str) -> Tuple[Path, Path]:
+        return self.directory / f"{preset_id}.jpg", self.directory / f"{preset_id}.json"
+
+    def _read_disk(self, preset_id: str) -> Optional[CachedImage]:
+        image_path, meta_path = self._paths(preset_id)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            content = image_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        # Reading counts as use for the disk LRU
+        try:
+            os.utime(image_path)
+        except OSError:
+            pass
+        return CachedImage(content, meta.get("etag"), meta.get("last_modified"), meta.get("fetched_at", 0))
+
+    def _write_disk(self, preset_id: str, entry: CachedImage, with_image: bool) -> None:
+        image_path, meta_path = self._paths(preset_id)
+        meta = {"etag": entry.etag, "last_modified": entry.last_modified, "fetched_at": entry.fetched_at}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if with_image:
+                image_path.write_bytes(entry.content)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            if with_image:
+                self._prune_disk()
+        except OSError as err:
+            _LOGGER.debug("Failed to cache camera image %s: %s", preset_id, err)
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used images until the directory fits `disk_limit`."""
+        images = []
+        total = 0
+        for image_path in self.directory.glob("*.jpg"):
+            try:
+                stat = image_path.stat()
+            except OSError:
+                continue
+            images.append((stat.st_mtime, stat.st_size, image_path))
+            total += stat.st_size
+        images.sort()
+        # The newest image always stays
+        for _, size, image_path in images[:-1]:
+            if total <= self.disk_limit:
+                break
+            image_path.unlink(missing_ok=True)
+            image_path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
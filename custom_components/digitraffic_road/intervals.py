@@ -0,0 +1,53 @@
+"""Sorted interval index for road address range queries."""
+from bisect import bisect_left, bisect_right
+from typing import Any, Hashable, List, Tuple
+
+
+class IntervalIndex:
+    """Static set of closed intervals answering "which intervals overlap [lo, hi]".
+
+    Intervals are kept sorted by start together with a running maximum of
+    their ends. A query bisects twice to bound the candidates, so it only
+    touches intervals that can overlap the range instead of every interval.
+    Bounds may be any mutually comparable values, e.g. (section, distance)
+    tuples.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._items: List[Tuple[Any, Any, Hashable]] = []
+        self._starts: List[Any] = []
+        self._max_ends: List[Any] = []
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, start: Any, end: Any, key: Hashable) -> None:
+        """Add the interval [start, end] for `key`."""
+        if end < start:
+            start, end = end, start
+        self._items.append((start, end, key))
+        self._sorted = False
+
+    def _build(self) -> None:
+        self._items.sort(key=lambda item: (item[0], item[1]))
+        self._starts = [start for start, _, _ in self._items]
+        self._max_ends = []
+        running = None
+        for _, end, _ in self._items:
+            running = end if running is None or end > running else running
+            self._max_ends.append(running)
+        self._sorted = True
+
+    def overlapping(self, lo: Any, hi: Any) -> List[Hashable]:
+        """Return keys of intervals overlapping [lo, hi], ordered by start."""
+        if lo > hi:
+            lo, hi = hi, lo
+        if not self._sorted:
+            self._build()
+        # Intervals starting after `hi` cannot overlap; before `first` every
+        # interval (and all earlier ones) ended before `lo`
+        last = bisect_right(self._starts, hi)
+        first = bisect_left(self._max_ends, lo, 0, last)
+        return [key for _, end, key in self._items[first:last] if end >= lo]
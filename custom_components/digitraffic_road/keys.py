@@ -0,0 +1,100 @@
+"""Process-wide registry of measurement and sensor constant names.
+
+Every name is interned once and gets a small integer id. Station indexes,
+listener contexts and histories are keyed by that id, and the derived
+forms entities need (lowercase, unique-id slug, display names) are
+computed once per name instead of once per entity or per update.
+
+Names that only differ by case share an id; the first spelling seen is
+kept as the canonical `name`.
+"""
+import re
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .const import TMS_MEASUREMENT_KEYS
+
+
+def slugify_measurement_key(key: str) -> str:
+    """Return a safe unique-id suffix derived from the measurement key."""
+    normalized = key.lower()
+    normalized = (
+        normalized.replace("ä", "a")
+        .replace("ö", "o")
+        .replace("å", "a")
+        .replace(" ", "_")
+    )
+    return re.sub(r"[^a-z0-9_]+", "_", normalized)
+
+
+class MeasurementKey:
+    """One interned measurement name and its precomputed forms."""
+
+    __slots__ = ("id", "name", "lower", "slug", "_display")
+
+    def __init__(self, key_id: int, name: str) -> None:
+        """Initialize the key; use `KeyRegistry.intern` to create keys."""
+        self.id = key_id
+        self.name = sys.intern(name)
+        self.lower = sys.intern(name.lower())
+        self.slug = slugify_measurement_key(name)
+        self._display: Dict[Tuple[Callable[[str, str], str], str], str] = {}
+
+    def display(self, language: str, formatter: Callable[[str, str], str]) -> str:
+        """Return `formatter(name, language)`, computed on first use."""
+        cache_key = (formatter, language)
+        try:
+            return self._display[cache_key]
+        except KeyError:
+            value = self._display[cache_key] = formatter(self.name, language)
+            return value
+
+    def __repr__(self) -> str:
+        return f"MeasurementKey({self.id}, {self.name!r})"
+
+
+class KeyRegistry:
+    """Name -> `MeasurementKey` table with dense integer ids."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._keys: List[MeasurementKey] = []
+        self._by_name: Dict[str, MeasurementKey] = {}
+        self._by_lower: Dict[str, MeasurementKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, key_id: int) -> MeasurementKey:
+        return self._keys[key_id]
+
+    def intern(self, name: str) -> MeasurementKey:
+        """Return the key of `name`, registering it on first sight."""
+        key = self._by_name.get(name)
+        if key is not None:
+            return key
+        lower = name.lower()
+        key = self._by_lower.get(lower)
+        if key is None:
+            key = MeasurementKey(len(self._keys), name)
+            self._keys.append(key)
+            self._by_lower[key.lower] = key
+        # Every spelling seen maps straight to its key
+        self._by_name[sys.intern(name)] = key
+        return key
+
+    def get(self, name: str) -> Optional[MeasurementKey]:
+        """Return the key of `name` if it has been registered."""
+        return self._by_name.get(name) or self._by_lower.get(name.lower())
+
+
+MEASUREMENT_KEYS = KeyRegistry()
+
+# Sensors are created for these on every TMS station, so give them the lowest ids
+for _name in TMS_MEASUREMENT_KEYS:
+    MEASUREMENT_KEYS.intern(_name)
+
+
+def measurement_key_id(name: str) -> int:
+    """Return the registry id of a measurement or sensor constant name."""
+    return MEASUREMENT_KEYS.intern(name).id
@@ -0,0 +1,150 @@
+"""Compact in-memory model of station sensor values.
+
+The station data endpoints return each sensor value as a dict with a dozen
+keys (ids, both description languages, timestamps as strings, ...). A
+coordinator keeps the latest values of every station it tracks, so they are
+stored as `Measurement` records instead: slotted, with the value coerced to a
+number once, timestamps parsed to epoch seconds once and repeated strings
+(names, units, descriptions) interned.
+
+This module has no Home Assistant dependencies so that scripts can load it
+directly (see `scripts/benchmark_measurements.py`).
+"""
+import math
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, NamedTuple, Optional
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Return an API timestamp (ISO 8601, "Z" suffix allowed) as epoch seconds."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def coerce_value(value: Any) -> Any:
+    """Return a sensor value as int or float when it is numeric, else unchanged.
+
+    Only finite numbers count: "nan" or "inf" strings are kept as strings,
+    and a NaN or infinite float becomes None. NaN never equals itself, so it
+    would make every update look like a change.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if not isinstance(value, str):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class Measurement:
+    """Latest value of one sensor of a TMS or road weather station."""
+
+    __slots__ = (
+        "name",
+        "sensor_id",
+        "value",
+        "unit",
+        "measured_ts",
+        "window_start_ts",
+        "window_end_ts",
+        "description_fi",
+        "description_en",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        sensor_id: Optional[int] = None,
+        value: Any = None,
+        unit: Optional[str] = None,
+        measured_ts: Optional[float] = None,
+        window_start_ts: Optional[float] = None,
+        window_end_ts: Optional[float] = None,
+        description_fi: Optional[str] = None,
+        description_en: Optional[str] = None,
+    ) -> None:
+        """Initialize the record; prefer `from_api` for API sensor values."""
+        self.name = name
+        self.sensor_id = sensor_id
+        self.value = value
+        self.unit = unit
+        self.measured_ts = measured_ts
+        self.window_start_ts = window_start_ts
+        self.window_end_ts = window_end_ts
+        self.description_fi = description_fi
+        self.description_en = description_en
+
+    @classmethod
+    def from_api(cls, sensor_value: Dict[str, Any]) -> Optional["Measurement"]:
+        """Build a record from one `sensorValues` item, or None if it has no name."""
+        name = sensor_value.get("name")
+        if not name:
+            return None
+        return cls(
+            sys.intern(name),
+            sensor_value.get("id"),
+            coerce_value(sensor_value.get("value")),
+            _intern(sensor_value.get("unit")),
+            parse_timestamp(sensor_value.get("measuredTime")),
+            parse_timestamp(sensor_value.get("timeWindowStart")),
+            parse_timestamp(sensor_value.get("timeWindowEnd")),
+            _intern(sensor_value.get("sensorValueDescriptionFi")),
+            _intern(sensor_value.get("sensorValueDescriptionEn")),
+        )
+
+    @property
+    def measured_time(self) -> Optional[datetime]:
+        """Return the measurement time as an aware UTC datetime."""
+        return _to_datetime(self.measured_ts)
+
+    def description(self, language: str) -> Optional[str]:
+        """Return the value description in `language`, falling back to the other one."""
+        if language == "fi":
+            return self.description_fi or self.description_en
+        return self.description_en or self.description_fi
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Measurement({self.name!r}, value={self.value!r}, unit={self.unit!r})"
+
+
+class TmsIndexEntry(NamedTuple):
+    """What a TMS measurement entity reads for its key (see `build_tms_index`)."""
+
+    value: Any
+    measurement: Optional[Measurement]
+    constant: bool
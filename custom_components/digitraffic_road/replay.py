@@ -0,0 +1,100 @@
+"""Replay files of recorded station data and their hourly aggregation.
+
+A replay file holds one JSON document per line (optionally gzip
+compressed), each being a Digitraffic station data payload as returned by
+`/stations/{id}/data` (`{"id": ..., "sensorValues": [...]}`) or by
+`/stations/data` (`{"stations": [...]}`).
+
+This module has no Home Assistant dependencies; `backfill.py` imports the
+aggregated rows as long-term statistics.
+"""
+import gzip
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .const import INVALID_UNITS
+
+_LOGGER = logging.getLogger(__name__)
+
+# (station id, measurement key) -> hour start -> [sum, count, min, max]
+Buckets = Dict[Tuple[str, str], Dict[datetime, List[float]]]
+
+
+def iter_replay_file(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the station payloads of a replay file (blocking; use the executor)."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        for line_number, line in enumerate(fh, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                document = json.loads(line)
+            except ValueError as err:
+                _LOGGER.debug("Skipping line %d of %s: %s", line_number, path, err)
+                continue
+            if isinstance(document, dict) and isinstance(document.get("stations"), list):
+                yield from document["stations"]
+            elif isinstance(document, dict):
+                yield document
+
+
+def _hour_start(measured_time: str) -> Optional[datetime]:
+    try:
+        measured = datetime.fromisoformat(measured_time.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    if measured.tzinfo is None:
+        measured = measured.replace(tzinfo=timezone.utc)
+    return measured.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def aggregate_hourly(
+    payloads: Iterable[Dict[str, Any]],
+    station_ids: Optional[Set[str]] = None,
+) -> Tuple[Buckets, Dict[Tuple[str, str], Optional[str]], int]:
+    """Fold numeric sensor values into hourly buckets.
+
+    Returns the buckets, the last valid unit seen per series and the number
+    of samples used. A sample repeated by consecutive payloads (polls that
+    saw the same measured time) is counted once.
+    """
+    buckets: Buckets = {}
+    units: Dict[Tuple[str, str], Optional[str]] = {}
+    last_measured: Dict[Tuple[str, str], str] = {}
+    samples = 0
+    for payload in payloads:
+        station = str(payload.get("id", ""))
+        if not station or (station_ids and station not in station_ids):
+            continue
+        for sv in payload.get("sensorValues") or ():
+            key = sv.get("name")
+            value = sv.get("value")
+            measured_time = sv.get("measuredTime")
+            if not key or isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            series = (station, key)
+            if last_measured.get(series) == measured_time:
+                continue
+            hour = _hour_start(measured_time)
+            if hour is None:
+                continue
+            last_measured[series] = measured_time
+            bucket = buckets.setdefault(series, {}).get(hour)
+            if bucket is None:
+                buckets[series][hour] = [value, 1, value, value]
+            else:
+                bucket[0] += value
+                bucket[1] += 1
+                bucket[2] = min(bucket[2], value)
+                bucket[3] = max(bucket[3], value)
+            unit = sv.get("unit")
+            if unit and unit not in INVALID_UNITS:
+                units[series] = unit
+            else:
+                units.setdefault(series, None)
+            samples += 1
+    return buckets, units, samples
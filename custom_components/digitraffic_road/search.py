@@ -0,0 +1,221 @@
+"""Typo-tolerant trigram search used by the DigiTraffic catalogs."""
+import re
+import unicodedata
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+# Minimum similarity for a fuzzy hit to be reported at all
+MIN_FUZZY_SCORE = 0.3
+# Keys of one posting list checked per requested typeahead suggestion
+COMPLETE_SCAN_FACTOR = 20
+
+
+def fold_text(s: str) -> str:
+    """Lowercase, strip diacritics (ä -> a, ö -> o, å -> a) and punctuation."""
+    s = unicodedata.normalize("NFKD", s.lower())
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = re.sub(r"[^a-z0-9 ]+", " ", s)
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def trigrams(folded: str) -> Set[str]:
+    """Return the padded trigram set of an already folded string.
+
+    Each word is padded with two leading and one trailing space, so short
+    words and word starts still produce distinctive trigrams.
+    """
+    grams: Set[str] = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+class FuzzyIndex:
+    """Inverted trigram index over short names.
+
+    Several names may be added for the same key (e.g. Finnish, Swedish and
+    English station names); a query reports each key once with the score of
+    its best matching name. Scoring blends how much of the query is covered by
+    the name with the Dice similarity of both trigram sets, so "marostenmaki"
+    still ranks "vt4 Marostenmäki" first while a one-letter typo only costs a
+    few shared trigrams.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: Dict[str, List[int]] = {}
+        self._doc_keys: List[Hashable] = []
+        self._doc_sizes: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_keys)
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index `text` as a name of `key`."""
+        self.add_folded(key, fold_text(text))
+
+    def add_folded(self, key: Hashable, folded: str) -> None:
+        """Index a name already passed through `fold_text`."""
+        grams = trigrams(folded)
+        if not grams:
+            return
+        doc = len(self._doc_keys)
+        self._doc_keys.append(key)
+        self._doc_sizes.append(len(grams))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(doc)
+
+    def query(self, text: str, min_score: float = MIN_FUZZY_SCORE) -> Dict[Any, float]:
+        """Return a mapping of key -> similarity (0..1) for names similar to `text`."""
+        grams = trigrams(fold_text(text))
+        if not grams:
+            return {}
+
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for doc in self._postings.get(gram, ()):
+                shared[doc] = shared.get(doc, 0) + 1
+
+        query_size = len(grams)
+        scores: Dict[Any, float] = {}
+        for doc, common in shared.items():
+            coverage = common / query_size
+            dice = 2 * common / (query_size + self._doc_sizes[doc])
+            score = 0.6 * coverage + 0.4 * dice
+            if score < min_score:
+                continue
+            key = self._doc_keys[doc]
+            if score > scores.get(key, 0.0):
+                scores[key] = score
+        return scores
+
+    def search(self, text: str, limit: int = 12, min_score: float = MIN_FUZZY_SCORE) -> List[Tuple[float, Any]]:
+        """Return up to `limit` (score, key) pairs, best first."""
+        scores = self.query(text, min_score=min_score)
+        ranked = sorted(((score, key) for key, score in scores.items()), key=lambda item: -item[0])
+        return ranked[:limit]
+
+
+class PrefixTrie:
+    """Character tries over folded names and their words, for typeahead.
+
+    Every node keeps the keys of all names (or words) starting with the
+    node's prefix, sorted by rank (shorter names first, then insertion order)
+    once by `sort` after the last add. A keystroke walks down the tries once
+    per query word and reads at most `limit * COMPLETE_SCAN_FACTOR` keys of
+    one posting list, however many catalog entries share the prefix.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        # A node is [children, keys]
+        self._names: list = [{}, []]
+        self._words: list = [{}, []]
+        self._labels: Dict[Hashable, str] = {}
+        self._label_words: Dict[Hashable, Tuple[str, ...]] = {}
+        self._order: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    @staticmethod
+    def _insert(root: list, word: str, key: Hashable) -> None:
+        node = root
+        for ch in word:
+            node = node[0].setdefault(ch, [{}, []])
+            keys = node[1]
+            if not keys or keys[-1] != key:
+                keys.append(key)
+
+    @staticmethod
+    def _lookup(root: list, prefix: str) -> List[Hashable]:
+        node = root
+        for ch in prefix:
+            node = node[0].get(ch)
+            if node is None:
+                return []
+        return node[1]
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index `text` and its words for `key`.
+
+        Adding several names for one key keeps the shortest folded name as
+        its label for ranking.
+        """
+        self.add_folded(key, fold_text(text))
+
+    def add_folded(self, key: Hashable, folded: str) -> None:
+        """Index a name already passed through `fold_text`."""
+        if not folded:
+            return
+        if key not in self._order:
+            self._order[key] = len(self._order)
+        current = self._labels.get(key)
+        if current is None or len(folded) < len(current):
+            self._labels[key] = folded
+
+        words = folded.split()
+        self._label_words[key] = tuple(set(self._label_words.get(key, ())) | set(words))
+        self._insert(self._names, folded, key)
+        for word in set(words):
+            self._insert(self._words, word, key)
+
+    def sort(self) -> None:
+        """Sort every posting list by rank; call once after the last add.
+
+        Catalogs call this at the end of their build, which runs in the
+        executor, so `complete` never sorts on the event loop.
+        """
+        labels = self._labels
+        order = self._order
+
+        def rank(key: Hashable) -> Tuple[int, int]:
+            return len(labels[key]), order[key]
+
+        stack = [self._names, self._words]
+        while stack:
+            node = stack.pop()
+            keys = sorted(node[1], key=rank)
+            # Several names of one key under the same prefix rank equal, so they end up adjacent
+            node[1] = [key for i, key in enumerate(keys) if not i or keys[i - 1] != key]
+            stack.extend(node[0].values())
+
+    def complete(self, text: str, limit: int = 10) -> List[Hashable]:
+        """Return up to `limit` keys with a word starting with every query word.
+
+        Names that start with the whole query come first; within each tier
+        shorter names rank first, then insertion order. Only the first
+        `limit * COMPLETE_SCAN_FACTOR` keys of the shortest word posting list
+        are checked for multi-word queries, so a rare combination of common
+        prefixes may need a few more typed letters to show up.
+        """
+        folded = fold_text(text)
+        words = folded.split()
+        if not words or limit <= 0:
+            return []
+
+        results = self._lookup(self._names, folded)[:limit]
+        if len(results) >= limit:
+            return results
+
+        # Any other suggestion has a word starting with each query word, so it
+        # is in the shortest word posting list
+        unique_words = set(words)
+        postings = min((self._lookup(self._words, word) for word in unique_words), key=len)
+        if len(unique_words) == 1:
+            # Every key of the list matches; the first `limit` hold enough non-prefix hits
+            candidates = postings[:limit]
+        else:
+            candidates = postings[:limit * COMPLETE_SCAN_FACTOR]
+        label_words = self._label_words
+
+        seen = set(results)
+        for key in candidates:
+            if key in seen:
+                continue
+            if all(any(lw.startswith(word) for lw in label_words[key]) for word in unique_words):
+                results.append(key)
+                if len(results) >= limit:
+                    break
+        return results
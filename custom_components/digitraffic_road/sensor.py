@@ -7,29 +7,34 @@ from typing import Any, Dict
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .congestion import CONGESTION_LEVELS, DIRECTIONS
 from .const import (
     DOMAIN,
-    CONF_MONITOR_TYPE,
-    CONF_ROAD_SECTION,
-    CONF_ROAD_SECTION_ID,
-    CONF_TMS_ID,
-    CONF_WEATHER_STATION_ID,
-    MONITOR_CONDITIONS,
+    INVALID_UNITS,
+    MONITOR_ANNOUNCEMENTS,
     MONITOR_TMS,
     MONITOR_WEATHER,
     SENSOR_TYPE_CONDITIONS,
     SENSOR_TYPE_FORECAST,
+    SERVICE_GET_FORECAST,
+    TMS_MEASUREMENT_KEYS,
 )
-from .coordinator import DigitraficDataCoordinator
+from .coordinator import DigitraficDataCoordinator, entry_monitor_type
+from .entity import DigitraficCoordinatorEntity
+from .keys import MEASUREMENT_KEYS, MeasurementKey, measurement_key_id
+from .measurements import Measurement, TmsIndexEntry
 
 _LOGGER = logging.getLogger(__name__)
 
-# Cache for loaded translations
-_TRANSLATION_CACHE: Dict[str, Dict[str, Any]] = {}
+# Flat lookup tables compiled from translations/<language>.json by
+# `async_load_translations`: language -> datapoint key -> name, and
+# language -> WMO code -> description
+_DATAPOINT_NAMES: Dict[str, Dict[str, str]] = {}
+_WMO_CODES: Dict[str, Dict[int, str]] = {}
 
 # Weather station measurements that are enabled by default
 # All other measurements will be created but disabled
@@ -48,48 +53,61 @@ WEATHER_ENABLED_BY_DEFAULT = {
 }
 
 
-def _load_translations(language: str = "fi") -> Dict[str, Any]:
-    """Load translations from JSON file."""
-    if language in _TRANSLATION_CACHE:
-        return _TRANSLATION_CACHE[language]
-    
-    try:
-        translation_file = os.path.join(
-            os.path.dirname(__file__),
-            "translations",
-            f"{language}.json"
-        )
-        with open(translation_file, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
-            _TRANSLATION_CACHE[language] = translations
-            return translations
-    except Exception as e:
-        _LOGGER.warning("Failed to load translations for %s: %s", language, e)
-        return {}
+def _read_translations(language: str) -> Dict[str, Any]:
+    """Read a translation file (blocking; runs in the executor)."""
+    translation_file = os.path.join(
+        os.path.dirname(__file__),
+        "translations",
+        f"{language}.json"
+    )
+    with open(translation_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _compile_translations(language: str, translations: Dict[str, Any]) -> None:
+    """Flatten the datapoint names and WMO codes of one language."""
+    sensor_translations = translations.get("sensor", {})
+    _DATAPOINT_NAMES[language] = dict(sensor_translations.get("datapoints", {}))
+    wmo_codes: Dict[int, str] = {}
+    for code, text in sensor_translations.get("wmo_codes", {}).items():
+        try:
+            wmo_codes[int(code)] = text
+        except ValueError:
+            continue
+    _WMO_CODES[language] = wmo_codes
+
+
+async def async_load_translations(hass: HomeAssistant, languages) -> None:
+    """Load and compile translations once per language, off the event loop."""
+    for language in languages:
+        if language in _DATAPOINT_NAMES:
+            continue
+        try:
+            translations = await hass.async_add_executor_job(_read_translations, language)
+        except Exception as e:
+            _LOGGER.warning("Failed to load translations for %s: %s", language, e)
+            translations = {}
+        _compile_translations(language, translations)
 
 
 def _get_datapoint_translation(key: str, language: str = "fi") -> str:
-    """Get translated name for a datapoint from translation files."""
-    translations = _load_translations(language)
-    datapoints = translations.get("sensor", {}).get("datapoints", {})
-    return datapoints.get(key, key)
+    """Get translated name for a datapoint from the preloaded translations."""
+    return _DATAPOINT_NAMES.get(language, {}).get(key, key)
 
 
 def translate_wmo_code(code: int | float | str, language: str = "fi") -> str:
     """Translate WMO weather code to human-readable description."""
     try:
         code_int = int(float(code))
-        translations = _load_translations(language)
-        wmo_codes = translations.get("sensor", {}).get("wmo_codes", {})
-        translated = wmo_codes.get(str(code_int))
-        if translated:
-            return translated
-        # Fallback for unknown codes
-        if language == "en":
-            return f"Unknown weather code: {code_int}"
-        return f"Tuntematon sääkoodi: {code_int}"
     except (ValueError, TypeError):
         return str(code)
+    translated = _WMO_CODES.get(language, {}).get(code_int)
+    if translated:
+        return translated
+    # Fallback for unknown codes
+    if language == "en":
+        return f"Unknown weather code: {code_int}"
+    return f"Tuntematon sääkoodi: {code_int}"
 
 
 WEATHER_SENSOR_NAME_EN = {
@@ -227,18 +245,6 @@ def format_weather_measurement_name(key: str, language: str) -> str:
     return _humanize_weather_key(key)
 
 
-def slugify_measurement_key(key: str) -> str:
-    """Return a safe unique-id suffix derived from the measurement key."""
-    normalized = key.lower()
-    normalized = (
-        normalized.replace("ä", "a")
-        .replace("ö", "o")
-        .replace("å", "a")
-        .replace(" ", "_")
-    )
-    return re.sub(r"[^a-z0-9_]+", "_", normalized)
-
-
 def should_skip_weather_key(key: str) -> bool:
     """Determine if a weather key should be skipped (duplicates, unused channels)."""
     return str(key).upper().endswith("_2")
@@ -252,81 +258,45 @@ async def async_setup_entry(
     """Set up sensor platform."""
     coordinator: DigitraficDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    data = config_entry.data
-
-    monitor_type = data.get(CONF_MONITOR_TYPE)
-    tms_id = data.get(CONF_TMS_ID)
-    weather_station_id = data.get(CONF_WEATHER_STATION_ID)
-
-    if monitor_type is None:
-        if tms_id:
-            monitor_type = MONITOR_TMS
-        elif weather_station_id:
-            monitor_type = MONITOR_WEATHER
-        else:
-            monitor_type = MONITOR_CONDITIONS
-
-    if monitor_type == MONITOR_TMS and tms_id:
-        section_name = data.get(CONF_ROAD_SECTION) or str(tms_id)
-
-        lam_measurement_keys = [
-            "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1",
-            "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2",
-            "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1_VVAPAAS1",
-            "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2_VVAPAAS2",
-            "KESKINOPEUS_60MIN_KIINTEA_SUUNTA1",
-            "KESKINOPEUS_60MIN_KIINTEA_SUUNTA2",
-            "KESKINOPEUS_5MIN_KIINTEA_SUUNTA1_VVAPAAS1",
-            "KESKINOPEUS_5MIN_KIINTEA_SUUNTA2_VVAPAAS2",
-            "OHITUKSET_5MIN_LIUKUVA_SUUNTA1",
-            "OHITUKSET_5MIN_LIUKUVA_SUUNTA2",
-            "OHITUKSET_5MIN_LIUKUVA_SUUNTA1_MS1",
-            "OHITUKSET_5MIN_LIUKUVA_SUUNTA2_MS2",
-            "OHITUKSET_5MIN_KIINTEA_SUUNTA1_MS1",
-            "OHITUKSET_5MIN_KIINTEA_SUUNTA2_MS2",
-            "OHITUKSET_60MIN_KIINTEA_SUUNTA1",
-            "OHITUKSET_60MIN_KIINTEA_SUUNTA2",
-            "OHITUKSET_60MIN_KIINTEA_SUUNTA1_MS1",
-            "OHITUKSET_60MIN_KIINTEA_SUUNTA2_MS2",
-        ]
-
-        entities = [
-            DigitraficTmsMeasurementSensor(coordinator, tms_id, section_name, key)
-            for key in lam_measurement_keys
-        ]
-        entities.append(DigitraficTmsConstantsSensor(coordinator, tms_id, section_name))
+    monitor_type = entry_monitor_type(config_entry.data)
+    # A batch or corridor entry covers several sections or stations
+    targets = coordinator.targets
+
+    # Entity names and WMO descriptions read these tables; weather entities
+    # always expose the Finnish and English descriptions too
+    await async_load_translations(hass, {coordinator.language or "fi", "fi", "en"})
+
+    if monitor_type == MONITOR_TMS:
+        entities = []
+        for target in targets:
+            tms_id = target["id"]
+            section_name = target.get("name") or str(tms_id)
+            entities.extend(
+                DigitraficTmsMeasurementSensor(coordinator, tms_id, section_name, key)
+                for key in TMS_MEASUREMENT_KEYS
+            )
+            entities.append(DigitraficTmsConstantsSensor(coordinator, tms_id, section_name))
+            for direction in DIRECTIONS:
+                entities.append(DigitraficTmsFreeFlowSensor(coordinator, tms_id, section_name, direction))
+                entities.append(DigitraficTmsCongestionSensor(coordinator, tms_id, section_name, direction))
 
         async_add_entities(entities)
         return
 
-    if monitor_type == MONITOR_WEATHER and weather_station_id:
-        station_name = data.get(CONF_ROAD_SECTION) or str(weather_station_id)
-        existing = coordinator.data.get("measurements") if coordinator.data else {}
-
-        measurement_keys = []
-        if isinstance(existing, dict):
-            measurement_keys = [
-                key for key in existing.keys() if not should_skip_weather_key(key)
-            ]
-
-        if not measurement_keys:
-            measurement_keys = [
-                key
-                for key in WEATHER_SENSOR_DEFINITIONS.keys()
-                if not should_skip_weather_key(key)
-            ]
-
-        created_keys: set[str] = set()
-
-        def _normalize_key(key: str) -> str:
-            return str(key).upper()
+    if monitor_type == MONITOR_WEATHER:
+        created_keys: set[tuple[str, int]] = set()
+        station_names = {
+            str(target["id"]): (target["id"], target.get("name") or str(target["id"]))
+            for target in targets
+        }
 
-        def _make_entities(keys) -> list:
+        def _make_entities(station_key: str, keys) -> list:
+            weather_station_id, station_name = station_names[station_key]
             entities: list = []
             for raw_key in keys:
                 if should_skip_weather_key(raw_key):
                     continue
-                norm = _normalize_key(raw_key)
+                norm = (station_key, measurement_key_id(raw_key))
                 if norm in created_keys:
                     continue
                 created_keys.add(norm)
@@ -342,40 +312,78 @@ async def async_setup_entry(
                 )
             return entities
 
-        initial_entities = _make_entities(measurement_keys)
+        # Key-set fingerprint per station already turned into entities
+        seen_fingerprints: dict[str, Any] = {}
+
+        initial_entities: list = []
+        for station_key in station_names:
+            payload = coordinator.data_for(station_key)
+            existing = payload.get("measurements")
+            seen_fingerprints[station_key] = payload.get("key_fingerprint")
+
+            measurement_keys = []
+            if isinstance(existing, dict):
+                measurement_keys = [
+                    key for key in existing.keys() if not should_skip_weather_key(key)
+                ]
+
+            if not measurement_keys:
+                measurement_keys = [
+                    key
+                    for key in WEATHER_SENSOR_DEFINITIONS.keys()
+                    if not should_skip_weather_key(key)
+                ]
+            initial_entities.extend(_make_entities(station_key, measurement_keys))
+
         if initial_entities:
             async_add_entities(initial_entities)
 
-        async def _async_check_new_measurements() -> None:
-            if not coordinator.data:
-                return
-            measurements = coordinator.data.get("measurements")
-            if not isinstance(measurements, dict):
-                return
-            new_entities = _make_entities(measurements.keys())
+        @callback
+        def _handle_coordinator_update() -> None:
+            # Only stations whose measurement key set changed are scanned
+            new_entities: list = []
+            for station_key in station_names:
+                payload = coordinator.data_for(station_key)
+                fingerprint = payload.get("key_fingerprint")
+                if fingerprint is None or fingerprint == seen_fingerprints.get(station_key):
+                    continue
+                seen_fingerprints[station_key] = fingerprint
+                new_entities.extend(_make_entities(station_key, payload["measurements"].keys()))
             if new_entities:
                 async_add_entities(new_entities)
 
-        def _handle_coordinator_update() -> None:
-            hass.async_create_task(_async_check_new_measurements())
-
         remove_listener = coordinator.async_add_listener(_handle_coordinator_update)
         config_entry.async_on_unload(remove_listener)
 
         return
 
-    section_id = data.get(CONF_ROAD_SECTION_ID)
-    section_name = data.get(CONF_ROAD_SECTION) or section_id
+    if monitor_type == MONITOR_ANNOUNCEMENTS:
+        async_add_entities(
+            DigitraficAnnouncementsSensor(coordinator, target["id"], target.get("name") or target["id"])
+            for target in targets
+        )
+        return
+
+    # The full structured forecast is served on demand instead of being recorded
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_GET_FORECAST,
+        {},
+        "async_get_forecast",
+        supports_response=SupportsResponse.ONLY,
+    )
 
-    entities = [
-        DigitraficCurrentConditionsSensor(coordinator, section_id, section_name),
-        DigitraficForecastSensor(coordinator, section_id, section_name),
-    ]
+    entities = []
+    for target in targets:
+        section_id = target["id"]
+        section_name = target.get("name") or section_id
+        entities.append(DigitraficCurrentConditionsSensor(coordinator, section_id, section_name))
+        entities.append(DigitraficForecastSensor(coordinator, section_id, section_name))
 
     async_add_entities(entities)
 
 
-class DigitraficCurrentConditionsSensor(CoordinatorEntity, SensorEntity):
+class DigitraficCurrentConditionsSensor(DigitraficCoordinatorEntity, SensorEntity):
     """Sensor for current road conditions."""
 
     def __init__(
@@ -396,10 +404,10 @@ class DigitraficCurrentConditionsSensor(CoordinatorEntity, SensorEntity):
     @property
     def state(self) -> Any:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        conditions_data = self.coordinator.data.get("conditions")
+        return self._memo("state", self._compute_state)
+
+    def _compute_state(self) -> Any:
+        conditions_data = self.coordinator.data_for(self.section_id).get("conditions")
         if conditions_data:
             return self.coordinator.client.parse_conditions(conditions_data)
         return None
@@ -407,12 +415,12 @@ class DigitraficCurrentConditionsSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return entity extra state attributes."""
+        return self._memo("extra_state_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self) -> Dict[str, Any]:
         attributes = {}
         
-        if not self.coordinator.data:
-            return attributes
-        
-        conditions_data = self.coordinator.data.get("conditions")
+        conditions_data = self.coordinator.data_for(self.section_id).get("conditions")
         if conditions_data and conditions_data.get("features"):
             feature = conditions_data["features"][0]
             properties = feature.get("properties", {})
@@ -453,6 +461,30 @@ def format_station_name(raw: str) -> str:
     return " ".join(t.capitalize() for t in raw.split())
 
 
+# English LAM key names (kept for backwards compatibility with the translation files)
+TMS_KEY_NAME_EN = {
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1": "Rolling avg speed 5min sliding dir 1",
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2": "Rolling avg speed 5min sliding dir 2",
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1_VVAPAAS1": "Rolling avg speed 5min pct of free-flow dir 1",
+    "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2_VVAPAAS2": "Rolling avg speed 5min pct of free-flow dir 2",
+    "KESKINOPEUS_60MIN_KIINTEA_SUUNTA1": "Fixed avg speed 60min dir 1",
+    "KESKINOPEUS_60MIN_KIINTEA_SUUNTA2": "Fixed avg speed 60min dir 2",
+    "KESKINOPEUS_5MIN_KIINTEA_SUUNTA1_VVAPAAS1": "Fixed avg speed 5min pct of free-flow dir 1",
+    "KESKINOPEUS_5MIN_KIINTEA_SUUNTA2_VVAPAAS2": "Fixed avg speed 5min pct of free-flow dir 2",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA1": "Rolling count overtakes 5min dir 1",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA2": "Rolling count overtakes 5min dir 2",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA1_MS1": "Rolling count overtakes 5min lane 1 dir 1",
+    "OHITUKSET_5MIN_LIUKUVA_SUUNTA2_MS2": "Rolling count overtakes 5min lane 2 dir 2",
+    "OHITUKSET_5MIN_KIINTEA_SUUNTA1_MS1": "Fixed count overtakes 5min lane 1 dir 1",
+    "OHITUKSET_5MIN_KIINTEA_SUUNTA2_MS2": "Fixed count overtakes 5min lane 2 dir 2",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA1": "Fixed count overtakes 60min dir 1",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA2": "Fixed count overtakes 60min dir 2",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA1_MS1": "Fixed count overtakes 60min lane 1 dir 1",
+    "OHITUKSET_60MIN_KIINTEA_SUUNTA2_MS2": "Fixed count overtakes 60min lane 2 dir 2",
+
+}
+
+
 def format_measurement_key(key: str, language: str = "fi") -> str:
     """Format measurement key tokens according to agreed rules.
 
@@ -473,31 +505,10 @@ def format_measurement_key(key: str, language: str = "fi") -> str:
     if translated != key:
         return translated
     
-    # English translations map (kept for backwards compatibility)
-    english_translations = {
-        "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1": "Rolling avg speed 5min sliding dir 1",
-        "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2": "Rolling avg speed 5min sliding dir 2",
-        "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1_VVAPAAS1": "Rolling avg speed 5min pct of free-flow dir 1",
-        "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2_VVAPAAS2": "Rolling avg speed 5min pct of free-flow dir 2",
-        "KESKINOPEUS_60MIN_KIINTEA_SUUNTA1": "Fixed avg speed 60min dir 1",
-        "KESKINOPEUS_60MIN_KIINTEA_SUUNTA2": "Fixed avg speed 60min dir 2",
-        "KESKINOPEUS_5MIN_KIINTEA_SUUNTA1_VVAPAAS1": "Fixed avg speed 5min pct of free-flow dir 1",
-        "KESKINOPEUS_5MIN_KIINTEA_SUUNTA2_VVAPAAS2": "Fixed avg speed 5min pct of free-flow dir 2",
-        "OHITUKSET_5MIN_LIUKUVA_SUUNTA1": "Rolling count overtakes 5min dir 1",
-        "OHITUKSET_5MIN_LIUKUVA_SUUNTA2": "Rolling count overtakes 5min dir 2",
-        "OHITUKSET_5MIN_LIUKUVA_SUUNTA1_MS1": "Rolling count overtakes 5min lane 1 dir 1",
-        "OHITUKSET_5MIN_LIUKUVA_SUUNTA2_MS2": "Rolling count overtakes 5min lane 2 dir 2",
-        "OHITUKSET_5MIN_KIINTEA_SUUNTA1_MS1": "Fixed count overtakes 5min lane 1 dir 1",
-        "OHITUKSET_5MIN_KIINTEA_SUUNTA2_MS2": "Fixed count overtakes 5min lane 2 dir 2",
-        "OHITUKSET_60MIN_KIINTEA_SUUNTA1": "Fixed count overtakes 60min dir 1",
-        "OHITUKSET_60MIN_KIINTEA_SUUNTA2": "Fixed count overtakes 60min dir 2",
-        "OHITUKSET_60MIN_KIINTEA_SUUNTA1_MS1": "Fixed count overtakes 60min lane 1 dir 1",
-        "OHITUKSET_60MIN_KIINTEA_SUUNTA2_MS2": "Fixed count overtakes 60min lane 2 dir 2",
-    }
-    
-    if language == "en" and key in english_translations:
-        return english_translations[key]
     
+    if language == "en" and key in TMS_KEY_NAME_EN:
+        return TMS_KEY_NAME_EN[key]
+
     # Finnish formatting (default)
     tokens = key.split("_")
     out = []
@@ -520,8 +531,49 @@ def format_measurement_key(key: str, language: str = "fi") -> str:
     return " ".join(out)
 
 
-class DigitraficForecastSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for road condition forecast."""
+SPEED_UNITS = ("km/h", "kmh", "km")
+
+
+def _tms_key_entry(key: str) -> Dict[str, Any]:
+    """Return the language-independent registry entry of a LAM key."""
+    if "KESKINOPEUS" in key:
+        unit = "km/h"
+    elif "OHITUKSET" in key:
+        unit = "count"
+    elif "VVAPAAS" in key:
+        unit = "%"
+    else:
+        unit = None
+    return {
+        "unit": unit,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "speed": "KESKINOPEUS" in key,
+    }
+
+
+# LAM key id -> default unit, state class and whether it is a speed; display
+# names are cached on the `MeasurementKey` itself
+TMS_KEY_REGISTRY: Dict[int, Dict[str, Any]] = {
+    measurement_key_id(key): _tms_key_entry(key) for key in TMS_MEASUREMENT_KEYS
+}
+
+
+def tms_key_info(key: MeasurementKey) -> Dict[str, Any]:
+    """Return the registry entry of a LAM key."""
+    info = TMS_KEY_REGISTRY.get(key.id)
+    if info is None:
+        info = TMS_KEY_REGISTRY[key.id] = _tms_key_entry(key.name)
+    return info
+
+
+class DigitraficForecastSensor(DigitraficCoordinatorEntity, SensorEntity):
+    """Sensor for road condition forecast.
+
+    The per-step forecast list is kept out of the recorder; the
+    `get_forecast` service returns it, with the raw values, on demand.
+    """
+
+    _unrecorded_attributes = frozenset({"forecast_data"})
 
     def __init__(
         self, 
@@ -541,10 +593,10 @@ class DigitraficForecastSensor(CoordinatorEntity, SensorEntity):
     @property
     def state(self) -> str | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        forecast_data = self.coordinator.data.get("forecast")
+        return self._memo("state", self._compute_state)
+
+    def _compute_state(self) -> str | None:
+        forecast_data = self.coordinator.data_for(self.section_id).get("forecast")
         if forecast_data:
             return self.coordinator.client.parse_forecast(forecast_data)
         return None
@@ -552,12 +604,12 @@ class DigitraficForecastSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return entity extra state attributes."""
+        return self._memo("extra_state_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self) -> Dict[str, Any]:
         attributes = {}
         
-        if not self.coordinator.data:
-            return attributes
-        
-        forecast_data = self.coordinator.data.get("forecast")
+        forecast_data = self.coordinator.data_for(self.section_id).get("forecast")
         if forecast_data and forecast_data.get("features"):
             # Include detailed forecast data as attributes
             forecasts = []
@@ -583,10 +635,24 @@ class DigitraficForecastSensor(CoordinatorEntity, SensorEntity):
         """Return the icon."""
         return "mdi:weather-cloudy"
 
+    async def async_get_forecast(self) -> ServiceResponse:
+        """Return the structured forecast from the coordinator's cached data."""
+        forecast_data = self.coordinator.data_for(self.section_id).get("forecast") or {}
+        return {
+            "section_id": self.coordinator.resolved_id_for(self.section_id) or self.section_id,
+            "section_name": self._section_name,
+            "forecast": [
+                dict(feature.get("properties", {}))
+                for feature in forecast_data.get("features", [])
+            ],
+        }
+
 
-class DigitraficWeatherMeasurementSensor(CoordinatorEntity, SensorEntity):
+class DigitraficWeatherMeasurementSensor(DigitraficCoordinatorEntity, SensorEntity):
     """Sensor entity representing a single weather-station measurement."""
 
+    _volatile_attributes = frozenset({"station_data_updated_time"})
+
     def __init__(
         self,
         coordinator: DigitraficDataCoordinator,
@@ -598,12 +664,13 @@ class DigitraficWeatherMeasurementSensor(CoordinatorEntity, SensorEntity):
         # Store attributes needed before super().__init__()
         self.station_id = station_id
         self.measurement_key = measurement_key
+        self._key = MEASUREMENT_KEYS.intern(measurement_key)
+        self._index_key = self._key.id
         self._metadata = metadata or {}
         self._use_description = bool(self._metadata.get("use_description"))
 
         # Set unique_id BEFORE super().__init__() - required for entity registry
-        slug = slugify_measurement_key(measurement_key)
-        self._attr_unique_id = f"{DOMAIN}_weather_{station_id}_{slug}"
+        self._attr_unique_id = f"{DOMAIN}_weather_{station_id}_{self._key.slug}"
         
         # Set enabled default BEFORE super().__init__() - required for entity registry
         self._attr_entity_registry_enabled_default = measurement_key in WEATHER_ENABLED_BY_DEFAULT
@@ -613,7 +680,7 @@ class DigitraficWeatherMeasurementSensor(CoordinatorEntity, SensorEntity):
             "name_fi" if coordinator.language == "fi" else "name_en"
         )
         if not friendly_name:
-            friendly_name = format_weather_measurement_name(measurement_key, coordinator.language)
+            friendly_name = self._key.display(coordinator.language, format_weather_measurement_name)
         self._attr_name = f"{format_station_name(str(station_name))} - {friendly_name}"
 
         # Set device class, state class, and icon before super().__init__()
@@ -628,24 +695,13 @@ class DigitraficWeatherMeasurementSensor(CoordinatorEntity, SensorEntity):
         if icon:
             self._attr_icon = icon
         
-        # Call super().__init__() AFTER all attributes are set
-        super().__init__(coordinator)
+        # Call super().__init__() AFTER all attributes are set; the context
+        # limits coordinator callbacks to refreshes that change this key
+        super().__init__(coordinator, context=(str(station_id), self._index_key))
 
-    def _get_measurement(self) -> Dict[str, Any] | None:
-        data = self.coordinator.data or {}
-        measurements = data.get("measurements") or {}
-        if not isinstance(measurements, dict):
-            return None
-
-        measurement = measurements.get(self.measurement_key)
-        if measurement is not None:
-            return measurement
-
-        for key, value in measurements.items():
-            if isinstance(key, str) and key.lower() == self.measurement_key.lower():
-                return value
-
-        return None
+    def _get_measurement(self) -> Measurement | None:
+        index = self.coordinator.data_for(self.station_id).get("index") or {}
+        return index.get(self._index_key)
 
     @property
     def available(self) -> bool:
@@ -655,13 +711,16 @@ class DigitraficWeatherMeasurementSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def state(self) -> Any:
+        return self._memo("state", self._compute_state)
+
+    def _compute_state(self) -> Any:
         measurement = self._get_measurement()
         if not measurement:
             return None
 
         # Special handling for VALLITSEVA_SÄÄ - translate WMO code to text
         if self.measurement_key == "VALLITSEVA_SÄÄ":
-            value = measurement.get("value")
+            value = measurement.value
             if value is not None:
                 lang = self.coordinator.language or "fi"
                 return translate_wmo_code(value, lang)
@@ -669,43 +728,43 @@ class DigitraficWeatherMeasurementSensor(CoordinatorEntity, SensorEntity):
 
         if self._use_description:
             lang = self.coordinator.language or "fi"
-            desc_key = "sensorValueDescriptionFi" if lang == "fi" else "sensorValueDescriptionEn"
-            description = (
-                measurement.get(desc_key)
-                or measurement.get("sensorValueDescriptionFi")
-                or measurement.get("sensorValueDescriptionEn")
-            )
-            return description or measurement.get("value")
+            return measurement.description(lang) or measurement.value
 
-        return measurement.get("value")
+        return measurement.value
 
     @property
     def native_unit_of_measurement(self) -> str | None:
+        return self._memo("native_unit_of_measurement", self._compute_native_unit_of_measurement)
+
+    def _compute_native_unit_of_measurement(self) -> str | None:
         if self._use_description:
             return None
         measurement = self._get_measurement()
         if not measurement:
             return None
-        unit = measurement.get("unit")
+        unit = measurement.unit
         # Filter out invalid/placeholder units
-        if unit in ("///", "???", "***"):
+        if unit in INVALID_UNITS:
             return None
         return unit
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
+        return self._memo("extra_state_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self) -> Dict[str, Any]:
         measurement = self._get_measurement()
         if not measurement:
             return {}
 
         attrs: Dict[str, Any] = {
-            "sensor_id": measurement.get("id"),
-            "measured_time": measurement.get("measuredTime"),
+            "sensor_id": measurement.sensor_id,
+            "measured_time": measurement.measured_time,
         }
 
         # For VALLITSEVA_SÄÄ, add translated description
         if self.measurement_key == "VALLITSEVA_SÄÄ":
-            value = measurement.get("value")
+            value = measurement.value
             attrs["wmo_code"] = value
             if value is not None:
                 lang = self.coordinator.language or "fi"
@@ -715,27 +774,27 @@ class DigitraficWeatherMeasurementSensor(CoordinatorEntity, SensorEntity):
                 attrs["weather_description_en"] = translate_wmo_code(value, "en")
 
         if not self._use_description:
-            attrs["raw_value"] = measurement.get("value")
+            attrs["raw_value"] = measurement.value
+            if self.measurement_key != "VALLITSEVA_SÄÄ":
+                attrs.update(self._trend_attributes(self.station_id, self._index_key))
 
-        if measurement.get("unit"):
-            attrs["unit"] = measurement.get("unit")
+        if measurement.unit:
+            attrs["unit"] = measurement.unit
 
-        desc_fi = measurement.get("sensorValueDescriptionFi")
-        if desc_fi:
-            attrs["description_fi"] = desc_fi
+        if measurement.description_fi:
+            attrs["description_fi"] = measurement.description_fi
 
-        desc_en = measurement.get("sensorValueDescriptionEn")
-        if desc_en:
-            attrs["description_en"] = desc_en
+        if measurement.description_en:
+            attrs["description_en"] = measurement.description_en
 
-        data_updated = (self.coordinator.data or {}).get("data_updated_time")
+        data_updated = self.coordinator.data_for(self.station_id).get("data_updated_time")
         if data_updated:
             attrs["station_data_updated_time"] = data_updated
 
         return attrs
 
 
-class DigitraficTmsConstantsSensor(CoordinatorEntity, SensorEntity):
+class DigitraficTmsConstantsSensor(DigitraficCoordinatorEntity, SensorEntity):
     """Sensor that exposes TMS sensor-constant values (VVAPAAS, MS1/MS2, etc.).
 
     This sensor aggregates the station's sensor-constant values into a single
@@ -756,8 +815,11 @@ class DigitraficTmsConstantsSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self):
+        return self._memo("extra_state_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self):
         attrs = {}
-        data = self.coordinator.data or {}
+        data = self.coordinator.data_for(self.station_id)
         sc = data.get("sensor_constants") or {}
         # Expecting sensorConstantValues list
         vals = sc.get("sensorConstantValues") if isinstance(sc, dict) else None
@@ -770,7 +832,7 @@ class DigitraficTmsConstantsSensor(CoordinatorEntity, SensorEntity):
         return attrs
 
 
-class DigitraficTmsMeasurementSensor(CoordinatorEntity, SensorEntity):
+class DigitraficTmsMeasurementSensor(DigitraficCoordinatorEntity, SensorEntity):
     """Placeholder sensor for a specific LAM/TMS measurement key.
 
     Currently this reads values from coordinator.data if available; if the
@@ -779,58 +841,40 @@ class DigitraficTmsMeasurementSensor(CoordinatorEntity, SensorEntity):
     """
 
     def __init__(self, coordinator: DigitraficDataCoordinator, station_id: int, station_name: str, measure_key: str):
-        super().__init__(coordinator)
+        self._key = MEASUREMENT_KEYS.intern(measure_key)
+        # Only notified by refreshes that change this key (see the coordinator)
+        super().__init__(coordinator, context=(str(station_id), self._key.id))
         self.station_id = station_id
         self._station_name = station_name
         self.measure_key = measure_key
+        self._index_key = self._key.id
+        self._key_info = tms_key_info(self._key)
         self._attr_unique_id = f"{DOMAIN}_tms_{station_id}_{measure_key}"
         # Use friendly formatting for station and measurement names
-        self._attr_name = f"{format_station_name(station_name)} - {format_measurement_key(measure_key, coordinator.language)}"
+        key_name = self._key.display(coordinator.language, format_measurement_key)
+        self._attr_name = f"{format_station_name(station_name)} - {key_name}"
         # Enable HA statistics and graphing
-        self._attr_state_class = "measurement"
+        self._attr_state_class = self._key_info["state_class"]
+
+    def _lookup(self) -> TmsIndexEntry | None:
+        """Return this key's entry in the station's per-update index.
+
+        The coordinator resolves constants, measurements and name aliases
+        once per update (see `build_tms_index`).
+        """
+        index = self.coordinator.data_for(self.station_id).get("index") or {}
+        return index.get(self._index_key)
 
     @property
     def state(self) -> Any:
-        data = self.coordinator.data or {}
-        _LOGGER.debug("Getting state for %s, data keys: %s", self.measure_key, list(data.keys()))
-        
-        # Try sensor constants first (some keys like VVAPAAS may be constants)
-        sc = data.get("sensor_constants") or {}
-        vals = sc.get("sensorConstantValues") if isinstance(sc, dict) else None
-        if vals:
-            for v in vals:
-                if v.get("name") == self.measure_key:
-                    value = v.get("value")
-                    _LOGGER.debug("Found constant value for %s: %s", self.measure_key, value)
-                    # Return numeric constant value as-is (int/float)
-                    return value
-
-        # Next try station measurements if coordinator provides them under 'measurements'
-        measurements = data.get("measurements") or {}
-        _LOGGER.debug("Measurements available: %s", list(measurements.keys()) if isinstance(measurements, dict) else "None")
-        
-        if isinstance(measurements, dict) and self.measure_key in measurements:
-            m = measurements.get(self.measure_key)
-            if isinstance(m, dict) and "value" in m:
-                value = m.get("value")
-                _LOGGER.debug("Found measurement value for %s: %s", self.measure_key, value)
-                return value
-            # If measurement entry is a raw value, return it (numeric)
-            _LOGGER.debug("Found raw measurement for %s: %s", self.measure_key, m)
-            return m
-
-        # Check if there's a close match (sometimes the API returns slightly different keys)
-        if isinstance(measurements, dict):
-            for key, measurement in measurements.items():
-                if self.measure_key.lower() in key.lower() or key.lower() in self.measure_key.lower():
-                    if isinstance(measurement, dict) and "value" in measurement:
-                        value = measurement.get("value")
-                        _LOGGER.debug("Found fuzzy match %s -> %s: %s", self.measure_key, key, value)
-                        return value
-
-        _LOGGER.debug("No data found for %s", self.measure_key)
-        # Return unavailable state instead of None to distinguish from "no data yet"
-        return None
+        return self._memo("state", self._compute_state)
+
+    def _compute_state(self) -> Any:
+        entry = self._lookup()
+        if entry is None:
+            # Return unavailable state instead of None to distinguish from "no data yet"
+            return None
+        return entry.value
 
     @property
     def available(self) -> bool:
@@ -838,52 +882,153 @@ class DigitraficTmsMeasurementSensor(CoordinatorEntity, SensorEntity):
         # Sensor is available if coordinator is successful AND we have data for this measurement
         if not self.coordinator.last_update_success:
             return False
-            
-        # Check if we have actual measurement data
-        data = self.coordinator.data or {}
-        measurements = data.get("measurements") or {}
-        sensor_constants = data.get("sensor_constants") or {}
-        
+
         # Available if we have either measurement data or sensor constant data
-        has_measurement = isinstance(measurements, dict) and self.measure_key in measurements
-        has_constant = False
-        if isinstance(sensor_constants, dict):
-            vals = sensor_constants.get("sensorConstantValues", [])
-            has_constant = any(v.get("name") == self.measure_key for v in vals)
-            
-        return has_measurement or has_constant
+        entry = self._lookup()
+        return entry is not None and (entry.measurement is not None or entry.constant)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit of measurement from coordinator data."""
-        data = self.coordinator.data or {}
-        measurements = data.get("measurements") or {}
-        if isinstance(measurements, dict) and self.measure_key in measurements:
-            m = measurements.get(self.measure_key)
-            if isinstance(m, dict) and "unit" in m:
-                unit = m.get("unit")
-                _LOGGER.debug("Unit for %s: %s", self.measure_key, unit)
-                # Filter out invalid/placeholder units
-                if unit in ("///", "???", "***"):
-                    _LOGGER.debug("Filtering out invalid unit '%s' for %s", unit, self.measure_key)
-                    unit = None
-                # For speed measurements, ensure we have km/h
-                elif "KESKINOPEUS" in self.measure_key and unit in ["km/h", "kmh", "km"]:
-                    return "km/h"
-                
-                if unit:
-                    return unit
-                
-        # Default units based on measurement type
-        if "KESKINOPEUS" in self.measure_key:
-            return "km/h"
-        elif "OHITUKSET" in self.measure_key:
-            return "count"
-        elif "VVAPAAS" in self.measure_key:
-            return "%"
-            
-        return None
+        return self._memo("native_unit_of_measurement", self._compute_native_unit_of_measurement)
+
+    def _compute_native_unit_of_measurement(self) -> str | None:
+        entry = self._lookup()
+        if entry is not None and entry.measurement is not None:
+            unit = entry.measurement.unit
+            # Filter out invalid/placeholder units
+            if unit in INVALID_UNITS:
+                unit = None
+            # For speed measurements, ensure we have km/h
+            elif self._key_info["speed"] and unit in SPEED_UNITS:
+                return "km/h"
+            if unit:
+                return unit
+
+        # Default unit based on measurement type
+        return self._key_info["unit"]
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return rolling trend attributes of the measured value."""
+        return self._memo("extra_state_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self) -> Dict[str, Any]:
+        entry = self._lookup()
+        if entry is None or entry.measurement is None or entry.constant:
+            return {}
+        return self._trend_attributes(self.station_id, self._index_key)
 
     @property
     def icon(self) -> str:
         return "mdi:counter"
+
+
+class DigitraficTmsFreeFlowSensor(DigitraficCoordinatorEntity, SensorEntity):
+    """Current speed as a percentage of the free-flow speed in one direction.
+
+    The ratios of all stations of the entry are computed by the coordinator
+    in one pass per update (see `compute_congestion`).
+    """
+
+    _attr_native_unit_of_measurement = "%"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:speedometer"
+
+    def __init__(self, coordinator: DigitraficDataCoordinator, station_id: int, station_name: str, direction: int):
+        super().__init__(coordinator)
+        self.station_id = station_id
+        self.direction = direction
+        self._attr_unique_id = f"{DOMAIN}_tms_{station_id}_free_flow_{direction}"
+        label = f"Sujuvuus suunta {direction}" if coordinator.language == "fi" else f"Free-flow ratio dir {direction}"
+        self._attr_name = f"{format_station_name(station_name)} - {label}"
+
+    def _metrics(self) -> Dict[str, Any] | None:
+        return (self.coordinator.data_for(self.station_id).get("congestion") or {}).get(self.direction)
+
+    @property
+    def available(self) -> bool:
+        return self.coordinator.last_update_success and self._metrics() is not None
+
+    @property
+    def native_value(self) -> float | None:
+        metrics = self._metrics()
+        return round(metrics["ratio"] * 100, 1) if metrics else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return self._memo("extra_state_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self) -> Dict[str, Any]:
+        metrics = self._metrics()
+        if not metrics:
+            return {}
+        return {
+            "congestion_level": metrics["level"],
+            "speed": metrics["speed"],
+            "free_flow_speed": metrics["free_flow_speed"],
+        }
+
+
+class DigitraficTmsCongestionSensor(DigitraficTmsFreeFlowSensor):
+    """Congestion level derived from the free-flow ratio in one direction."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = list(CONGESTION_LEVELS)
+    _attr_native_unit_of_measurement = None
+    _attr_state_class = None
+    _attr_icon = "mdi:car-multiple"
+
+    def __init__(self, coordinator: DigitraficDataCoordinator, station_id: int, station_name: str, direction: int):
+        super().__init__(coordinator, station_id, station_name, direction)
+        self._attr_unique_id = f"{DOMAIN}_tms_{station_id}_congestion_{direction}"
+        label = f"Ruuhkataso suunta {direction}" if coordinator.language == "fi" else f"Congestion level dir {direction}"
+        self._attr_name = f"{format_station_name(station_name)} - {label}"
+
+    @property
+    def native_value(self) -> str | None:
+        metrics = self._metrics()
+        return metrics["level"] if metrics else None
+
+    def _compute_extra_state_attributes(self) -> Dict[str, Any]:
+        metrics = self._metrics()
+        if not metrics:
+            return {}
+        return {"free_flow_ratio": round(metrics["ratio"] * 100, 1)}
+
+
+class DigitraficAnnouncementsSensor(DigitraficCoordinatorEntity, SensorEntity):
+    """Number of active traffic announcements in an area.
+
+    The message list is kept out of the recorder; only the counts per
+    situation type are recorded with the state.
+    """
+
+    _unrecorded_attributes = frozenset({"messages"})
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:alert-decagram-outline"
+
+    def __init__(self, coordinator: DigitraficDataCoordinator, area_id: str, area_name: str):
+        super().__init__(coordinator)
+        self.area_id = area_id
+        self._attr_unique_id = f"{DOMAIN}_announcements_{area_id}"
+        label = "Liikennetiedotteet" if coordinator.language == "fi" else "Traffic announcements"
+        self._attr_name = f"{area_name} - {label}"
+
+    @property
+    def native_value(self) -> int | None:
+        messages = self.coordinator.data_for(self.area_id).get("messages")
+        return len(messages) if messages is not None else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return self._memo("extra_state_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self) -> Dict[str, Any]:
+        data = self.coordinator.data_for(self.area_id)
+        attrs: Dict[str, Any] = {
+            situation_type.lower(): count for situation_type, count in (data.get("counts") or {}).items()
+        }
+        attrs["messages"] = data.get("messages") or []
+        return attrs
+
@@ -0,0 +1,114 @@
+"""Compact, gzip-compressed catalog snapshot bundled with the integration.
+
+The snapshot keeps only what search, nearest and corridor lookups need
+(ids, names, road addresses and one coordinate per entry) as positional
+rows, so the section, TMS and weather catalogs fit in a small file. It is
+built by `scripts/build_catalog_snapshot.py` when packaging a release and
+is not kept in git; without it catalogs are downloaded on first use. This module has no
+Home Assistant or package imports so `scripts/build_catalog_snapshot.py`
+can load it directly.
+"""
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SNAPSHOT_PATH = Path(__file__).parent / "catalog_snapshot.json.gz"
+SNAPSHOT_VERSION = 2
+
+# Keys must match the catalog kinds in const.py (CATALOG_*)
+SNAPSHOT_KINDS = ("sections", "tms", "weather")
+
+COORDINATE_DIGITS = 5  # ~1 m, plenty for nearest-station offers
+
+
+def _location(feat: Dict[str, Any]) -> List[Optional[float]]:
+    """Return [lon, lat] of a point or the middle vertex of a line."""
+    geometry = feat.get("geometry") or {}
+    coords = geometry.get("coordinates")
+    try:
+        if geometry.get("type") == "LineString":
+            coords = coords[len(coords) // 2]
+        elif geometry.get("type") == "MultiLineString":
+            flat = [c for line in coords for c in line]
+            coords = flat[len(flat) // 2]
+        return [round(float(coords[0]), COORDINATE_DIGITS), round(float(coords[1]), COORDINATE_DIGITS)]
+    except (TypeError, ValueError, IndexError):
+        return [None, None]
+
+
+def _point(lon: Optional[float], lat: Optional[float]) -> Optional[Dict[str, Any]]:
+    if lon is None or lat is None:
+        return None
+    return {"type": "Point", "coordinates": [lon, lat]}
+
+
+def pack_features(kind: str, features: List[Dict[str, Any]]) -> List[list]:
+    """Convert Digitraffic GeoJSON features into compact snapshot rows."""
+    rows: List[list] = []
+    for feat in features:
+        props = feat.get("properties", {}) or {}
+        if kind == "sections":
+            row = [
+                props.get("id"),
+                props.get("description") or props.get("name"),
+                props.get("roadNumber"),
+                props.get("roadSectionNumber"),
+                props.get("length"),
+            ]
+        elif kind == "tms":
+            names = props.get("names", {}) or {}
+            row = [props.get("id"), props.get("name"), names.get("fi"), names.get("sv"), names.get("en")]
+        else:
+            row = [props.get("id"), props.get("name")]
+        rows.append(row + _location(feat))
+    return rows
+
+
+def unpack_rows(kind: str, rows: List[list]) -> List[Dict[str, Any]]:
+    """Convert compact snapshot rows back into minimal GeoJSON features."""
+    features: List[Dict[str, Any]] = []
+    for row in rows:
+        *fields, lon, lat = row
+        if kind == "sections":
+            sid, description, road_number, section_number, length = fields
+            props = {
+                "id": sid,
+                "description": description,
+                "roadNumber": road_number,
+                "roadSectionNumber": section_number,
+                "length": length,
+            }
+        elif kind == "tms":
+            sid, name, name_fi, name_sv, name_en = fields
+            props = {"id": sid, "name": name, "names": {"fi": name_fi, "sv": name_sv, "en": name_en}}
+        else:
+            sid, name = fields
+            props = {"id": sid, "name": name}
+        features.append({"type": "Feature", "properties": props, "geometry": _point(lon, lat)})
+    return features
+
+
+def write_snapshot(path: Path, features_by_kind: Dict[str, List[Dict[str, Any]]], generated: str) -> None:
+    """Write a snapshot file from GeoJSON features keyed by catalog kind."""
+    payload = {"version": SNAPSHOT_VERSION, "generated": generated}
+    for kind in SNAPSHOT_KINDS:
+        payload[kind] = pack_features(kind, features_by_kind.get(kind, []))
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with gzip.open(path, "wb", compresslevel=9) as fh:
+        fh.write(raw)
+
+
+def read_snapshot(path: Path = SNAPSHOT_PATH) -> Dict[str, List[Dict[str, Any]]]:
+    """Read a snapshot file into GeoJSON features keyed by catalog kind.
+
+    Returns an empty mapping if no snapshot is bundled or it has an unknown
+    version. This does blocking file I/O; call it from the executor.
+    """
+    if not path.exists():
+        return {}
+    with gzip.open(path, "rb") as fh:
+        payload = json.loads(fh.read().decode("utf-8"))
+    if payload.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return {kind: unpack_rows(kind, payload.get(kind, [])) for kind in SNAPSHOT_KINDS}
@@ -0,0 +1,117 @@
+"""Grid spatial index for nearest station and section lookups."""
+import math
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance in kilometres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def feature_location(feat: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """Return a representative (lat, lon) for a GeoJSON feature.
+
+    Points use their own coordinates; lines (forecast sections) use their
+    middle vertex. Digitraffic coordinates are [lon, lat, (altitude)].
+    """
+    geometry = feat.get("geometry") or {}
+    coords = geometry.get("coordinates")
+    gtype = geometry.get("type")
+    try:
+        if gtype == "Point":
+            point = coords
+        elif gtype == "LineString":
+            point = coords[len(coords) // 2]
+        elif gtype == "MultiLineString":
+            flat = [c for line in coords for c in line]
+            point = flat[len(flat) // 2]
+        else:
+            return None
+        return float(point[1]), float(point[0])
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class GridIndex:
+    """Bucket points into fixed lat/lon cells and search rings of cells outwards.
+
+    A nearest-N query only visits the cells around the query point until the
+    N-th best distance is closer than anything in the unvisited cells can be.
+    """
+
+    def __init__(self, cell_deg: float = 0.25) -> None:
+        """Initialize an empty grid with `cell_deg` sized cells."""
+        self._cell_deg = cell_deg
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, Hashable]]] = {}
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._cells.values())
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / self._cell_deg)), int(math.floor(lon / self._cell_deg))
+
+    def add(self, key: Hashable, lat: float, lon: float) -> None:
+        """Add a point for `key`."""
+        ci, cj = self._cell(lat, lon)
+        self._cells.setdefault((ci, cj), []).append((lat, lon, key))
+        if self._bounds is None:
+            self._bounds = (ci, ci, cj, cj)
+        else:
+            imin, imax, jmin, jmax = self._bounds
+            self._bounds = (min(imin, ci), max(imax, ci), min(jmin, cj), max(jmax, cj))
+
+    def _ring_cells(self, ci: int, cj: int, ring: int):
+        """Yield the populated-area cells on the square ring around (ci, cj)."""
+        imin, imax, jmin, jmax = self._bounds
+        if ring == 0:
+            yield ci, cj
+            return
+        jlo, jhi = max(cj - ring, jmin), min(cj + ring, jmax)
+        for i in (ci - ring, ci + ring):
+            if imin <= i <= imax:
+                for j in range(jlo, jhi + 1):
+                    yield i, j
+        ilo, ihi = max(ci - ring + 1, imin), min(ci + ring - 1, imax)
+        for j in (cj - ring, cj + ring):
+            if jmin <= j <= jmax:
+                for i in range(ilo, ihi + 1):
+                    yield i, j
+
+    def nearest(self, lat: float, lon: float, count: int = 5) -> List[Tuple[float, Any]]:
+        """Return up to `count` (distance_km, key) pairs closest to (lat, lon)."""
+        if self._bounds is None or count <= 0:
+            return []
+
+        ci, cj = self._cell(lat, lon)
+        imin, imax, jmin, jmax = self._bounds
+        max_ring = max(abs(ci - imin), abs(ci - imax), abs(cj - jmin), abs(cj - jmax))
+
+        # Rings that lie entirely outside the populated area hold nothing
+        first_ring = max(imin - ci, ci - imax, jmin - cj, cj - jmax, 0)
+
+        found: List[Tuple[float, Any]] = []
+        for ring in range(first_ring, max_ring + 1):
+            for cell in self._ring_cells(ci, cj, ring):
+                for plat, plon, key in self._cells.get(cell, ()):
+                    found.append((haversine_km(lat, lon, plat, plon), key))
+            if len(found) < count:
+                continue
+            # Anything outside the visited rings is at least this far away
+            reach_deg = ring * self._cell_deg
+            lon_scale = math.cos(math.radians(min(89.9, abs(lat) + reach_deg)))
+            reach_km = reach_deg * KM_PER_DEGREE * min(1.0, lon_scale)
+            found.sort(key=lambda item: item[0])
+            if found[count - 1][0] <= reach_km:
+                break
+
+        found.sort(key=lambda item: item[0])
+        return found[:count]
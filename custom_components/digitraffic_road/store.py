@@ -0,0 +1,101 @@
+"""Persistent section-title overrides for DigiTraffic."""
+import asyncio
+import json
+import logging
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Dict, Iterator
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_OVERRIDES, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.overrides"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds; bursts of override writes are coalesced into one save
+
+# Location used by earlier versions, inside the integration package
+LEGACY_OVERRIDES_PATH = Path(__file__).parent / "overrides.json"
+
+
+def _read_legacy_overrides() -> Dict[str, str]:
+    """Read the legacy overrides.json (runs in the executor)."""
+    if not LEGACY_OVERRIDES_PATH.exists():
+        return {}
+    with LEGACY_OVERRIDES_PATH.open("r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    return data if isinstance(data, dict) else {}
+
+
+class OverridesStore(MutableMapping):
+    """In-memory map of normalized section title -> section id.
+
+    Loaded once through Home Assistant's storage helper; every change
+    schedules a debounced save, so lookups and writes never block the event
+    loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty, not yet loaded store."""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._overrides: Dict[str, str] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load overrides from storage, importing a legacy overrides.json once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            data = await self._store.async_load()
+            if data is None:
+                try:
+                    legacy = await self._hass.async_add_executor_job(_read_legacy_overrides)
+                except Exception as err:
+                    _LOGGER.debug("Failed to read legacy overrides: %s", err)
+                    legacy = {}
+                if legacy:
+                    _LOGGER.debug("Imported %d legacy overrides", len(legacy))
+                    self._overrides.update(legacy)
+                    self._schedule_save()
+            elif isinstance(data, dict):
+                self._overrides.update(data.get("overrides", {}))
+            self._loaded = True
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> Dict[str, Dict[str, str]]:
+        return {"overrides": dict(self._overrides)}
+
+    def __getitem__(self, key: str) -> str:
+        return self._overrides[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        if self._overrides.get(key) == value:
+            return
+        self._overrides[key] = value
+        self._schedule_save()
+
+    def __delitem__(self, key: str) -> None:
+        del self._overrides[key]
+        self._schedule_save()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._overrides)
+
+    def __len__(self) -> int:
+        return len(self._overrides)
+
+
+async def async_get_overrides_store(hass: HomeAssistant) -> OverridesStore:
+    """Return the integration-wide overrides store, loading it on first use."""
+    store = hass.data.get(DATA_OVERRIDES)
+    if store is None:
+        store = hass.data[DATA_OVERRIDES] = OverridesStore(hass)
+    await store.async_load()
+    return store
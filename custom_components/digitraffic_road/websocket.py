@@ -0,0 +1,58 @@
+"""Websocket API for DigiTraffic typeahead suggestions."""
+import logging
+from typing import Any, Dict
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .catalog import async_get_catalog_cache
+from .client import DigitraficClient
+from .const import CATALOG_SECTIONS, CATALOG_TMS, CATALOG_WEATHER, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_SUGGESTIONS = 25
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, websocket_suggest)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/suggest",
+        vol.Required("kind"): vol.In([CATALOG_SECTIONS, CATALOG_TMS, CATALOG_WEATHER]),
+        vol.Required("query"): str,
+        vol.Optional("limit", default=10): vol.All(int, vol.Range(min=1, max=MAX_SUGGESTIONS)),
+    }
+)
+@websocket_api.async_response
+async def websocket_suggest(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: Dict[str, Any],
+) -> None:
+    """Return ranked suggestions for a partially typed station or section name.
+
+    Suggestions come from the prefix trie of the cached catalog; only a
+    request finding no cached or bundled catalog waits on a download.
+    """
+    kind = msg["kind"]
+    client = DigitraficClient(
+        async_get_clientsession(hass),
+        catalogs=await async_get_catalog_cache(hass),
+    )
+    catalog = await client.async_get_catalog(kind)
+    if catalog is None:
+        connection.send_error(msg["id"], "catalog_unavailable", f"No {kind} catalog available")
+        return
+
+    suggestions = [
+        {"id": props.get("id"), "label": catalog.label(props)}
+        for props in catalog.suggest(msg["query"], msg["limit"])
+    ]
+    connection.send_result(msg["id"], {"suggestions": suggestions})
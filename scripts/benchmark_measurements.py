@@ -0,0 +1,172 @@
+"""Compare the memory kept per update by raw sensor value dicts and `Measurement` records.
+
+Usage:
+    python scripts/benchmark_measurements.py [stations]
+
+Builds synthetic TMS and road weather station payloads shaped like the
+`/stations/data` responses (default 150 stations of each type), then measures
+with tracemalloc what stays allocated once the response itself is dropped:
+the previous storage (raw weather dicts, a 6-key dict per TMS value, plus the
+`sensorValues` lists) versus `Measurement` records.
+"""
+import gc
+import importlib.util
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / "custom_components" / "digitraffic_road"
+
+TMS_KEYS = [
+    f"{prefix}_SUUNTA{direction}{suffix}"
+    for prefix in (
+        "KESKINOPEUS_5MIN_LIUKUVA",
+        "KESKINOPEUS_60MIN_KIINTEA",
+        "OHITUKSET_5MIN_LIUKUVA",
+        "OHITUKSET_60MIN_KIINTEA",
+        "KESKINOPEUS_5MIN_KIINTEA",
+        "OHITUKSET_5MIN_KIINTEA",
+    )
+    for direction in (1, 2)
+    for suffix in ("", "_VVAPAAS", "_MS1", "_MS2", "_PROSENTTIA")
+]
+WEATHER_KEYS = [
+    f"{name}_{lane}" if lane else name
+    for name in ("ILMA", "TIE", "MAA", "KASTEPISTE", "JÄÄTYMISPISTE", "ILMAN_KOSTEUS", "KESKITUULI",
+                 "MAKSIMITUULI", "TUULENSUUNTA", "NÄKYVYYS_KM", "SADE_INTENSITEETTI", "KELI")
+    for lane in ("", "1", "2")
+]
+DESCRIBED = {"KELI", "KELI_1", "KELI_2"}
+
+
+def _load_measurements_module():
+    spec = importlib.util.spec_from_file_location("digitraffic_measurements", PACKAGE / "measurements.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _tms_response(stations: int) -> str:
+    rng = random.Random(1)
+    return json.dumps({"stations": [
+        {
+            "id": 23000 + station,
+            "dataUpdatedTime": "2025-01-15T10:05:12Z",
+            "sensorValues": [
+                {
+                    "id": 5000 + number,
+                    "stationId": 23000 + station,
+                    "name": key,
+                    "shortName": key[:8],
+                    "timeWindowStart": "2025-01-15T10:00:00Z",
+                    "timeWindowEnd": "2025-01-15T10:05:00Z",
+                    "measuredTime": "2025-01-15T10:05:00Z",
+                    "unit": "km/h" if "NOPEUS" in key else "kpl/h",
+                    "value": rng.randint(0, 120),
+                }
+                for number, key in enumerate(TMS_KEYS)
+            ],
+        }
+        for station in range(stations)
+    ]})
+
+
+def _weather_response(stations: int) -> str:
+    rng = random.Random(2)
+    return json.dumps({"stations": [
+        {
+            "id": 1000 + station,
+            "dataUpdatedTime": "2025-01-15T10:05:12Z",
+            "sensorValues": [
+                {
+                    "id": number,
+                    "stationId": 1000 + station,
+                    "name": key,
+                    "shortName": key[:8],
+                    "measuredTime": "2025-01-15T10:04:00Z",
+                    "value": round(rng.uniform(-20, 20), 1),
+                    "unit": "°C",
+                    **(
+                        {"sensorValueDescriptionFi": "Kuiva", "sensorValueDescriptionEn": "Dry"}
+                        if key in DESCRIBED
+                        else {}
+                    ),
+                }
+                for number, key in enumerate(WEATHER_KEYS)
+            ],
+        }
+        for station in range(stations)
+    ]})
+
+
+def _store_raw(kind: str, stations: list) -> dict:
+    stored = {}
+    for station in stations:
+        sensor_values = station.get("sensorValues") or []
+        if kind == "tms":
+            measurements = {
+                sv["name"]: {
+                    "id": sv.get("id"),
+                    "value": sv.get("value"),
+                    "unit": sv.get("unit"),
+                    "measuredTime": sv.get("measuredTime"),
+                    "timeWindowStart": sv.get("timeWindowStart"),
+                    "timeWindowEnd": sv.get("timeWindowEnd"),
+                }
+                for sv in sensor_values
+            }
+        else:
+            measurements = {sv["name"]: sv for sv in sensor_values}
+        stored[str(station["id"])] = {"measurements": measurements, "sensor_values": sensor_values}
+    return stored
+
+
+def _store_compact(module, stations: list) -> dict:
+    stored = {}
+    for station in stations:
+        measurements = {}
+        for sv in station.get("sensorValues") or []:
+            measurement = module.Measurement.from_api(sv)
+            if measurement is not None:
+                measurements[measurement.name] = measurement
+        stored[str(station["id"])] = {"measurements": measurements}
+    return stored
+
+
+def _retained(response: str, store) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    stations = json.loads(response)["stations"]
+    stored = store(stations)
+    del stations
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del stored
+    return size
+
+
+def main() -> int:
+    module = _load_measurements_module()
+    stations = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+
+    print(f"{'':8} {'stations':>8} {'values':>8} {'raw KiB':>9} {'compact KiB':>12} {'saved':>6}")
+    for kind, response, keys in (
+        ("tms", _tms_response(stations), TMS_KEYS),
+        ("weather", _weather_response(stations), WEATHER_KEYS),
+    ):
+        raw = _retained(response, lambda parsed: _store_raw(kind, parsed))
+        compact = _retained(response, lambda parsed: _store_compact(module, parsed))
+        print(
+            f"{kind:8} {stations:>8} {stations * len(keys):>8} {raw / 1024:>9.0f} "
+            f"{compact / 1024:>12.0f} {1 - compact / raw:>6.0%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Regenerate the bundled catalog snapshot from the live Digitraffic API.
+
+Usage:
+    python scripts/build_catalog_snapshot.py [output_path]
+
+Downloads the forecast section, TMS station and weather station lists and
+writes them in the compact format read by
+`custom_components/digitraffic_road/snapshot.py`. The release workflow
+(`.github/workflows/release.yml`) runs this before zipping the integration.
+"""
+import gzip
+import importlib.util
+import json
+import sys
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / "custom_components" / "digitraffic_road"
+
+SOURCES = {
+    "sections": "https://tie.digitraffic.fi/api/weather/v1/forecast-sections",
+    "tms": "https://tie.digitraffic.fi/api/tms/v1/stations",
+    "weather": "https://tie.digitraffic.fi/api/weather/v1/stations",
+}
+
+
+def _load_snapshot_module():
+    spec = importlib.util.spec_from_file_location("digitraffic_snapshot", PACKAGE / "snapshot.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _fetch_features(url: str) -> list:
+    request = urllib.request.Request(
+        url,
+        headers={
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "Digitraffic-User": "digitraffic_road/snapshot",
+        },
+    )
+    with urllib.request.urlopen(request, timeout=60) as resp:
+        raw = resp.read()
+        if resp.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+    return json.loads(raw.decode("utf-8")).get("features", [])
+
+
+def main() -> int:
+    snapshot = _load_snapshot_module()
+    output = Path(sys.argv[1]) if len(sys.argv) > 1 else snapshot.SNAPSHOT_PATH
+
+    features_by_kind = {}
+    for kind, url in SOURCES.items():
+        features_by_kind[kind] = _fetch_features(url)
+        print(f"{kind}: {len(features_by_kind[kind])} features")
+        # A release must not ship an empty catalog
+        if not features_by_kind[kind]:
+            print(f"No {kind} features downloaded, snapshot not written", file=sys.stderr)
+            return 1
+
+    generated = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    snapshot.write_snapshot(output, features_by_kind, generated)
+    print(f"Wrote {output} ({output.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
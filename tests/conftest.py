@@ -0,0 +1,24 @@
+"""Test setup for the integration's Home Assistant-free modules.
+
+The package `__init__` imports Home Assistant, so the package is registered
+here without running it; its pure modules (search, catalog, history, ...)
+then import normally as `custom_components.digitraffic_road.<module>`.
+"""
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = ROOT / "custom_components" / "digitraffic_road"
+
+
+def _register_package(name: str, path: Path) -> None:
+    if name in sys.modules:
+        return
+    package = types.ModuleType(name)
+    package.__path__ = [str(path)]
+    sys.modules[name] = package
+
+
+_register_package("custom_components", PACKAGE_DIR.parent)
+_register_package("custom_components.digitraffic_road", PACKAGE_DIR)
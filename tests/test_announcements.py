@@ -0,0 +1,82 @@
+"""Tests for the area-filtered traffic message store."""
+from custom_components.digitraffic_road.announcements import AnnouncementStore, Area, area_id
+
+# Jyväskylä
+AREA = Area(62.2426, 25.7473, 25)
+
+
+def _feature(situation_id, version, lon, lat, title="Tietyö"):
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": {
+            "situationId": situation_id,
+            "version": version,
+            "situationType": "ROAD_WORK",
+            "announcements": [
+                {"language": "FI", "title": title, "location": {"description": "Tie 4"}},
+                {"language": "EN", "title": "Road work"},
+            ],
+        },
+    }
+
+
+NEAR = _feature("GUID1", 1, 25.75, 62.25)
+NEAR_LINE = {
+    **_feature("GUID2", 1, 0, 0),
+    "geometry": {"type": "MultiLineString", "coordinates": [[[24.0, 60.0], [25.8, 62.3]]]},
+}
+FAR = _feature("GUID3", 1, 24.94, 60.17)
+
+
+def test_area_distance_uses_the_closest_vertex():
+    assert AREA.distance(NEAR["geometry"]) < 1
+    assert 0 < AREA.distance(NEAR_LINE["geometry"]) < 25
+    assert AREA.distance(FAR["geometry"]) is None
+    assert AREA.distance(None) is None
+
+
+def test_area_id():
+    assert area_id(62.2426, 25.7473, 25) == "62.2426_25.7473_25"
+
+
+def test_merge_keeps_messages_in_the_area():
+    store = AnnouncementStore(AREA, language="en")
+
+    assert store.merge([NEAR, NEAR_LINE, FAR])
+    assert set(store.messages) == {"GUID1", "GUID2"}
+    message = store.sorted_messages()[0]
+    assert message["id"] == "GUID1"
+    assert message["title"] == "Road work"
+    assert message["situation_type"] == "ROAD_WORK"
+
+
+def test_merge_reports_changes_only():
+    store = AnnouncementStore(AREA)
+    store.merge([NEAR, FAR])
+
+    # Same versions: nothing is parsed again
+    assert not store.merge([NEAR, FAR])
+
+    updated = _feature("GUID1", 2, 25.75, 62.25, title="Tietyö päättynyt")
+    assert store.merge([updated, FAR])
+    assert store.messages["GUID1"]["title"] == "Tietyö päättynyt"
+
+    # An outside message moving into the area is picked up
+    moved = _feature("GUID3", 2, 25.7, 62.2)
+    assert store.merge([updated, moved])
+    assert set(store.messages) == {"GUID1", "GUID3"}
+
+
+def test_merge_drops_messages_leaving_the_area_or_the_feed():
+    store = AnnouncementStore(AREA)
+    store.merge([NEAR, NEAR_LINE])
+
+    moved_away = _feature("GUID2", 2, 24.94, 60.17)
+    assert store.merge([NEAR, moved_away])
+    assert set(store.messages) == {"GUID1"}
+
+    assert store.merge([moved_away])
+    assert store.messages == {}
+    # Outside messages leaving the feed do not count as a change
+    assert not store.merge([])
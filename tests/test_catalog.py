@@ -0,0 +1,72 @@
+"""Tests for the indexed station catalogs."""
+import asyncio
+import threading
+
+from custom_components.digitraffic_road.catalog import CatalogCache, WeatherStationCatalog
+
+
+def _station(station_id, name, lon=25.0, lat=61.0):
+    return {
+        "type": "Feature",
+        "properties": {"id": station_id, "name": name},
+        "geometry": {"type": "Point", "coordinates": [lon, lat, 0]},
+    }
+
+
+FEATURES = [
+    _station(1001, "vt4_Marostenmaki"),
+    _station(1002, "vt4_Jyvaskyla_Palokka"),
+    _station(1003, "st_51_Inkoo"),
+    _station(1001, "duplicate id"),
+    {"type": "Feature", "properties": {"id": 1004}},
+]
+CATALOG = WeatherStationCatalog(FEATURES)
+
+
+def test_indexes_features_by_string_id():
+    assert len(CATALOG) == 3
+    assert CATALOG.get(1001)["name"] == "vt4_Marostenmaki"
+    assert CATALOG.get(" 1002 ")["name"] == "vt4_Jyvaskyla_Palokka"
+    assert CATALOG.get(1004) is None
+
+
+def test_search_ranks_id_before_name_matches():
+    assert [props["id"] for props in CATALOG.search("1003")][:1] == [1003]
+
+
+def test_search_by_name_tokens():
+    results = CATALOG.search("vt4 palokka")
+    assert results[0]["id"] == 1002
+    assert {props["id"] for props in results} >= {1001, 1002}
+
+
+
+def test_exact_matches_normalized_name():
+    assert [props["id"] for props in CATALOG.exact("VT4 marostenmaki")] == [1001]
+
+
+def test_label_replaces_underscores():
+    assert CATALOG.label(CATALOG.get(1003)) == "st 51 Inkoo"
+
+
+def test_cache_builds_catalogs_with_its_blocking_runner():
+    threads = []
+
+    async def run_blocking(target, *args):
+        def build():
+            threads.append(threading.current_thread())
+            return target(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(None, build)
+
+    async def run():
+        return await CatalogCache(run_blocking=run_blocking).async_build(WeatherStationCatalog, FEATURES)
+
+    catalog = asyncio.run(run())
+    assert len(catalog) == 3
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_cache_without_runner_builds_inline():
+    catalog = asyncio.run(CatalogCache().async_build(WeatherStationCatalog, FEATURES))
+    assert catalog.get(1002)["name"] == "vt4_Jyvaskyla_Palokka"
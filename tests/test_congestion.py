@@ -0,0 +1,80 @@
+"""Tests for the TMS congestion metrics."""
+import pytest
+
+from custom_components.digitraffic_road.congestion import (
+    FREE_FLOW_KEYS,
+    FREE_FLOW_PERCENT_KEYS,
+    SPEED_KEYS,
+    compute_congestion,
+    congestion_level,
+)
+from custom_components.digitraffic_road.measurements import Measurement, TmsIndexEntry
+
+
+def _measured(name, value):
+    return TmsIndexEntry(value, Measurement(name, value=value), False)
+
+
+def _constant(value):
+    return TmsIndexEntry(value, None, True)
+
+
+@pytest.mark.parametrize(
+    ("ratio", "level"),
+    [(0.1, "stationary"), (0.25, "queuing"), (0.6, "slow"), (0.8, "heavy"), (0.9, "free_flow"), (1.2, "free_flow")],
+)
+def test_congestion_level(ratio, level):
+    assert congestion_level(ratio) == level
+
+
+def test_ratio_from_speed_and_free_flow_constant():
+    data = {
+        "23001": {
+            "index": {
+                SPEED_KEYS[1]: _measured("KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1", 40),
+                FREE_FLOW_KEYS[1]: _constant(80),
+                SPEED_KEYS[2]: _measured("KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2", 95),
+                FREE_FLOW_KEYS[2]: _constant(100),
+            }
+        }
+    }
+
+    assert compute_congestion(data) == {
+        "23001": {
+            1: {"ratio": 0.5, "level": "slow", "speed": 40.0, "free_flow_speed": 80.0},
+            2: {"ratio": 0.95, "level": "free_flow", "speed": 95.0, "free_flow_speed": 100.0},
+        }
+    }
+
+
+def test_falls_back_to_reported_percentage():
+    data = {
+        "23002": {
+            "index": {
+                SPEED_KEYS[1]: _measured("KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1", 20),
+                FREE_FLOW_PERCENT_KEYS[1]: _measured("KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1_VVAPAAS1", 20),
+            }
+        }
+    }
+
+    assert compute_congestion(data) == {
+        "23002": {1: {"ratio": 0.2, "level": "stationary", "speed": 20.0, "free_flow_speed": None}}
+    }
+
+
+def test_skips_directions_without_usable_values():
+    data = {
+        "23003": {
+            "index": {
+                # Alias entries carry no measurement of their own
+                SPEED_KEYS[1]: TmsIndexEntry(50, None, False),
+                FREE_FLOW_KEYS[1]: _constant(100),
+                SPEED_KEYS[2]: _measured("KESKINOPEUS_5MIN_LIUKUVA_SUUNTA2", 50),
+                FREE_FLOW_KEYS[2]: _constant(0),
+            }
+        },
+        "23004": {"index": {SPEED_KEYS[1]: _measured("KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1", "///")}},
+        "23005": None,
+    }
+
+    assert compute_congestion(data) == {}
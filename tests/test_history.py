@@ -0,0 +1,52 @@
+"""Tests for the measurement ring buffer."""
+import pytest
+
+from custom_components.digitraffic_road.history import RingBuffer
+
+
+def test_append_rejects_samples_not_newer_than_the_last():
+    buffer = RingBuffer(3)
+    assert buffer.last_time is None
+    assert buffer.append(100, 1.0)
+    assert not buffer.append(100, 2.0)
+    assert not buffer.append(50, 3.0)
+    assert list(buffer.samples()) == [(100, 1.0)]
+
+
+def test_wraps_around_keeping_the_newest_samples():
+    buffer = RingBuffer(3)
+    for minute in range(5):
+        buffer.append(minute * 60, float(minute))
+
+    assert len(buffer) == 3
+    assert buffer.capacity == 3
+    assert buffer.last_time == 240
+    assert list(buffer.samples()) == [(120, 2.0), (180, 3.0), (240, 4.0)]
+    assert list(buffer.samples(since=180)) == [(180, 3.0), (240, 4.0)]
+
+
+def test_stats_over_a_window():
+    buffer = RingBuffer(36)
+    # Temperature falling 1 degree per 10 minutes
+    for step in range(12):
+        buffer.append(step * 600, 10.0 - step)
+
+    low, high, mean, slope = buffer.stats(window=1800)
+    assert (low, high, mean) == (-1.0, 2.0, 0.5)
+    assert slope == pytest.approx(-6.0)
+
+    low, high, mean, slope = buffer.stats()
+    assert (low, high) == (-1.0, 10.0)
+    assert slope == pytest.approx(-6.0)
+
+
+def test_stats_of_empty_and_single_sample_buffers():
+    buffer = RingBuffer(4)
+    assert buffer.stats() is None
+    buffer.append(0, 5.0)
+    assert buffer.stats(window=600) == (5.0, 5.0, 5.0, None)
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
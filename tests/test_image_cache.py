@@ -0,0 +1,140 @@
+"""Tests for the camera image cache."""
+import asyncio
+
+from custom_components.digitraffic_road.image_cache import CameraImageCache
+
+
+class _Camera:
+    """Fetcher serving a fixed image per preset, with ETag revalidation."""
+
+    def __init__(self):
+        self.images = {}
+        self.requests = []
+        self.fail = False
+
+    async def fetch(self, preset_id, etag, last_modified):
+        self.requests.append((preset_id, etag))
+        await asyncio.sleep(0)
+        if self.fail:
+            return 0, None, {}
+        content = self.images[preset_id]
+        validators = {"etag": f'"{len(content)}"', "last_modified": None}
+        if etag == validators["etag"]:
+            return 304, None, validators
+        return 200, content, validators
+
+
+async def _run_blocking(target, *args):
+    return target(*args)
+
+
+def _create_task(coro, name):
+    return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+def _cache(camera, tmp_path, interval=600.0, memory_limit=1000, disk_limit=1000):
+    return CameraImageCache(camera.fetch, _run_blocking, _create_task, tmp_path, interval, memory_limit, disk_limit)
+
+
+def test_concurrent_viewers_share_one_fetch(tmp_path):
+    camera = _Camera()
+    camera.images["C0150201"] = b"jpeg"
+    cache = _cache(camera, tmp_path)
+
+    async def run():
+        return await asyncio.gather(*(cache.async_get("C0150201") for _ in range(10)))
+
+    assert asyncio.run(run()) == [b"jpeg"] * 10
+    assert camera.requests == [("C0150201", None)]
+    assert (tmp_path / "C0150201.jpg").read_bytes() == b"jpeg"
+
+
+def test_fresh_images_are_served_without_a_request(tmp_path):
+    camera = _Camera()
+    camera.images["C1"] = b"jpeg"
+    cache = _cache(camera, tmp_path)
+
+    async def run():
+        await cache.async_get("C1")
+        return await cache.async_get("C1")
+
+    assert asyncio.run(run()) == b"jpeg"
+    assert len(camera.requests) == 1
+
+
+def test_expired_images_are_revalidated(tmp_path):
+    camera = _Camera()
+    camera.images["C1"] = b"jpeg"
+    cache = _cache(camera, tmp_path, interval=0)
+
+    async def run():
+        first = await cache.async_get("C1")
+        not_modified = await cache.async_get("C1")
+        camera.images["C1"] = b"new jpeg"
+        changed = await cache.async_get("C1")
+        camera.fail = True
+        stale = await cache.async_get("C1")
+        return first, not_modified, changed, stale
+
+    assert asyncio.run(run()) == (b"jpeg", b"jpeg", b"new jpeg", b"new jpeg")
+    assert camera.requests == [("C1", None), ("C1", '"4"'), ("C1", '"4"'), ("C1", '"8"')]
+
+
+def test_images_survive_a_restart_on_disk(tmp_path):
+    camera = _Camera()
+    camera.images["C1"] = b"jpeg"
+    asyncio.run(_cache(camera, tmp_path).async_get("C1"))
+
+    restarted = _cache(camera, tmp_path)
+    assert asyncio.run(restarted.async_get("C1")) == b"jpeg"
+    assert len(camera.requests) == 1
+
+
+def test_memory_is_least_recently_used_within_its_limit(tmp_path):
+    camera = _Camera()
+    camera.images.update({"a": b"1" * 40, "b": b"2" * 40, "c": b"3" * 40})
+    cache = _cache(camera, tmp_path, memory_limit=100)
+
+    async def run():
+        await cache.async_get("a")
+        await cache.async_get("b")
+        # Viewing "a" again makes "b" the least recently used image
+        await cache.async_get("a")
+        await cache.async_get("c")
+
+    asyncio.run(run())
+    assert list(cache._memory) == ["a", "c"]
+    assert cache._memory_bytes == 80
+
+
+def test_disk_is_pruned_to_its_limit(tmp_path):
+    camera = _Camera()
+    camera.images.update({"a": b"1" * 40, "b": b"2" * 40, "c": b"3" * 40})
+    cache = _cache(camera, tmp_path, disk_limit=100)
+
+    async def run():
+        for preset in ("a", "b", "c"):
+            await cache.async_get(preset)
+
+    asyncio.run(run())
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["b.jpg", "b.json", "c.jpg", "c.json"]
+
+
+def test_cancel_inflight_drops_running_fetches(tmp_path):
+    camera = _Camera()
+    camera.images["C1"] = b"jpeg"
+    cache = _cache(camera, tmp_path)
+
+    async def run():
+        viewer = asyncio.ensure_future(cache.async_get("C1"))
+        await asyncio.sleep(0)
+        fetch = cache._inflight["C1"]
+        cache.cancel_inflight()
+        # A viewer arriving after the unload starts a fetch of its own
+        fresh = await cache.async_get("C1")
+        return fetch, viewer, fresh
+
+    fetch, viewer, fresh = asyncio.run(run())
+    assert fetch.cancelled() and viewer.cancelled()
+    assert fresh == b"jpeg"
+    assert cache._inflight == {}
@@ -0,0 +1,48 @@
+"""Tests for the road address interval index."""
+import random
+
+from custom_components.digitraffic_road.intervals import IntervalIndex
+
+
+def test_overlapping_returns_keys_in_start_order():
+    index = IntervalIndex()
+    index.add((421, 0), (421, 5300), "a")
+    index.add((423, 0), (423, 2000), "c")
+    index.add((422, 0), (422, 4100), "b")
+    index.add((430, 0), (430, 100), "far")
+
+    assert index.overlapping((421, 0), (423, float("inf"))) == ["a", "b", "c"]
+    assert index.overlapping((422, 4100), (422, 4100)) == ["b"]
+    assert index.overlapping((424, 0), (429, 0)) == []
+
+
+def test_reversed_bounds_are_swapped():
+    index = IntervalIndex()
+    index.add(10, 5, "x")
+    assert index.overlapping(8, 6) == ["x"]
+
+
+def test_long_interval_is_found_past_shorter_ones():
+    index = IntervalIndex()
+    index.add(0, 100, "long")
+    for start in range(1, 50):
+        index.add(start, start + 1, start)
+
+    assert index.overlapping(90, 95) == ["long"]
+
+
+def test_overlapping_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    index = IntervalIndex()
+    for key in range(300):
+        start = rng.uniform(0, 1000)
+        end = start + rng.expovariate(1 / 20)
+        intervals.append((start, end, key))
+        index.add(start, end, key)
+
+    for _ in range(50):
+        lo = rng.uniform(0, 1000)
+        hi = lo + rng.uniform(0, 50)
+        expected = [key for start, end, key in sorted(intervals) if start <= hi and end >= lo]
+        assert index.overlapping(lo, hi) == expected
@@ -0,0 +1,55 @@
+"""Tests for the measurement key registry."""
+from custom_components.digitraffic_road.const import TMS_MEASUREMENT_KEYS
+from custom_components.digitraffic_road.keys import (
+    MEASUREMENT_KEYS,
+    KeyRegistry,
+    measurement_key_id,
+    slugify_measurement_key,
+)
+
+
+def test_intern_assigns_dense_ids_once():
+    registry = KeyRegistry()
+    air = registry.intern("ILMA")
+    road = registry.intern("TIE_1")
+
+    assert (air.id, road.id) == (0, 1)
+    assert registry.intern("ILMA") is air
+    assert registry[1] is road
+    assert len(registry) == 2
+
+
+def test_names_differing_by_case_share_a_key():
+    registry = KeyRegistry()
+    key = registry.intern("JÄÄN_MÄÄRÄ1")
+
+    assert registry.intern("jään_määrä1") is key
+    assert registry.get("Jään_Määrä1") is key
+    assert key.name == "JÄÄN_MÄÄRÄ1"
+    assert len(registry) == 1
+    assert registry.get("MISSING") is None
+
+
+def test_precomputed_forms():
+    key = KeyRegistry().intern("JÄÄN_MÄÄRÄ1")
+    assert key.lower == "jään_määrä1"
+    assert key.slug == slugify_measurement_key("JÄÄN_MÄÄRÄ1") == "jaan_maara1"
+
+
+def test_display_is_computed_once_per_language():
+    calls = []
+
+    def formatter(name, language):
+        calls.append(language)
+        return f"{name}/{language}"
+
+    key = KeyRegistry().intern("ILMA")
+    assert key.display("fi", formatter) == "ILMA/fi"
+    assert key.display("fi", formatter) == "ILMA/fi"
+    assert key.display("en", formatter) == "ILMA/en"
+    assert calls == ["fi", "en"]
+
+
+def test_tms_keys_have_the_lowest_ids():
+    assert [measurement_key_id(name) for name in TMS_MEASUREMENT_KEYS] == list(range(len(TMS_MEASUREMENT_KEYS)))
+    assert MEASUREMENT_KEYS[0].name == TMS_MEASUREMENT_KEYS[0]
@@ -0,0 +1,64 @@
+"""Tests for the slotted measurement model."""
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.digitraffic_road.measurements import Measurement, coerce_value, parse_timestamp
+
+SENSOR_VALUE = {
+    "id": 1,
+    "stationId": 1001,
+    "name": "ILMA",
+    "shortName": "Ilma",
+    "measuredTime": "2025-01-01T10:05:00Z",
+    "value": -3.5,
+    "unit": "°C",
+    "sensorValueDescriptionFi": "Pakkasta",
+    "sensorValueDescriptionEn": None,
+}
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("12", 12), ("-3.5", -3.5), ("KUIVA", "KUIVA"), (7, 7), (None, None), (True, True)],
+)
+def test_coerce_value(raw, expected):
+    value = coerce_value(raw)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize("raw", ["nan", "NaN", "inf", "-Infinity"])
+def test_coerce_value_keeps_non_finite_strings(raw):
+    assert coerce_value(raw) == raw
+
+
+@pytest.mark.parametrize("raw", [float("nan"), float("inf")])
+def test_coerce_value_drops_non_finite_floats(raw):
+    assert coerce_value(raw) is None
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("2025-01-01T00:00:00Z") == datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+    assert parse_timestamp("2025-01-01T02:00:00+02:00") == parse_timestamp("2025-01-01T00:00:00Z")
+    assert parse_timestamp("2025-01-01T00:00:00") == parse_timestamp("2025-01-01T00:00:00Z")
+    assert parse_timestamp("yesterday") is None
+    assert parse_timestamp(None) is None
+
+
+def test_from_api():
+    measurement = Measurement.from_api(SENSOR_VALUE)
+
+    assert measurement.name == "ILMA"
+    assert measurement.value == -3.5
+    assert measurement.measured_time == datetime(2025, 1, 1, 10, 5, tzinfo=timezone.utc)
+    assert measurement.description("en") == "Pakkasta"
+    assert Measurement.from_api({"value": 1}) is None
+
+
+def test_equal_records_compare_equal_even_for_nan_input():
+    assert Measurement.from_api(SENSOR_VALUE) == Measurement.from_api(dict(SENSOR_VALUE))
+    assert Measurement.from_api(SENSOR_VALUE) != Measurement.from_api({**SENSOR_VALUE, "value": -4})
+
+    nan_value = {**SENSOR_VALUE, "value": "NaN"}
+    assert Measurement.from_api(nan_value) == Measurement.from_api(dict(nan_value))
@@ -0,0 +1,65 @@
+"""Tests for replay file parsing and hourly aggregation."""
+import gzip
+import json
+from datetime import datetime, timezone
+
+from custom_components.digitraffic_road.replay import aggregate_hourly, iter_replay_file
+
+
+def _value(name, value, measured_time, unit="km/h"):
+    return {"name": name, "value": value, "measuredTime": measured_time, "unit": unit}
+
+
+def test_iter_replay_file_reads_both_payload_shapes(tmp_path):
+    path = tmp_path / "tms.jsonl.gz"
+    lines = [
+        json.dumps({"id": 23001, "sensorValues": []}),
+        "",
+        "not json",
+        json.dumps({"stations": [{"id": 23002}, {"id": 23003}]}),
+        json.dumps([1, 2]),
+    ]
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        fh.write("\n".join(lines))
+
+    assert [payload["id"] for payload in iter_replay_file(path)] == [23001, 23002, 23003]
+
+
+def test_iter_replay_file_reads_plain_files(tmp_path):
+    path = tmp_path / "weather.jsonl"
+    path.write_text(json.dumps({"id": 1001}) + "\n", encoding="utf-8")
+    assert list(iter_replay_file(path)) == [{"id": 1001}]
+
+
+def test_aggregate_hourly_buckets_and_deduplicates():
+    key = "KESKINOPEUS_5MIN_LIUKUVA_SUUNTA1"
+    payloads = [
+        {"id": 23001, "sensorValues": [_value(key, 80, "2025-01-01T10:05:00Z")]},
+        # The next poll saw the same sample again
+        {"id": 23001, "sensorValues": [_value(key, 80, "2025-01-01T10:05:00Z")]},
+        {"id": 23001, "sensorValues": [_value(key, 60, "2025-01-01T10:35:00Z", unit="///")]},
+        {"id": 23001, "sensorValues": [_value(key, 90, "2025-01-01T11:00:00+00:00")]},
+        {"id": 23001, "sensorValues": [_value(key, True, "2025-01-01T11:05:00Z"), _value(key, "n/a", "x")]},
+    ]
+
+    buckets, units, samples = aggregate_hourly(payloads)
+
+    ten = datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+    eleven = datetime(2025, 1, 1, 11, tzinfo=timezone.utc)
+    assert samples == 3
+    assert buckets == {("23001", key): {ten: [140, 2, 60, 80], eleven: [90, 1, 90, 90]}}
+    assert units == {("23001", key): "km/h"}
+
+
+def test_aggregate_hourly_filters_stations_and_keeps_unknown_units():
+    payloads = [
+        {"id": 1001, "sensorValues": [_value("ILMA", -3.5, "2025-01-01T10:00:00Z", unit="???")]},
+        {"id": 1002, "sensorValues": [_value("ILMA", -4.0, "2025-01-01T10:00:00Z", unit="°C")]},
+        {"sensorValues": [_value("ILMA", -5.0, "2025-01-01T10:00:00Z")]},
+    ]
+
+    buckets, units, samples = aggregate_hourly(payloads, station_ids={"1001"})
+
+    assert list(buckets) == [("1001", "ILMA")]
+    assert units == {("1001", "ILMA"): None}
+    assert samples == 1
@@ -0,0 +1,122 @@
+"""Tests for the trigram search used by the catalogs."""
+from custom_components.digitraffic_road.catalog import TmsStationCatalog
+from custom_components.digitraffic_road.search import FuzzyIndex, PrefixTrie, fold_text, trigrams
+
+
+def test_fold_text_strips_diacritics_and_punctuation():
+    assert fold_text("Vt4: Marostenmäki – Äänekoski (Å)") == "vt4 marostenmaki aanekoski a"
+
+
+def test_trigrams_pad_each_word():
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+def test_fuzzy_index_tolerates_typos_and_missing_umlauts():
+    index = FuzzyIndex()
+    index.add("a", "vt4 Marostenmäki")
+    index.add("b", "vt4 Jyväskylä")
+    index.add("c", "st51 Inkoo")
+
+    assert index.search("marostenmaki")[0][1] == "a"
+    assert index.search("jyvaskla")[0][1] == "b"
+    assert "c" not in index.query("marostenmaki")
+
+
+def test_fuzzy_index_reports_best_name_once_per_key():
+    index = FuzzyIndex()
+    index.add("station", "Helsinki")
+    index.add("station", "Helsingfors")
+
+    scores = index.query("helsingfors")
+    assert list(scores) == ["station"]
+    assert scores["station"] == 1.0
+
+
+def test_catalog_search_matches_any_language_with_typos():
+    catalog = TmsStationCatalog(
+        [
+            {"properties": {"id": 23001, "name": "vt1_Espoo", "names": {"fi": "Tie 1 Espoo", "sv": "Väg 1 Esbo"}}},
+            {"properties": {"id": 23002, "name": "vt3_Tampere", "names": {"fi": "Tie 3 Tampere"}}},
+        ]
+    )
+
+    assert catalog.search("esbo")[0]["id"] == 23001
+    assert catalog.search("tamprre")[0]["id"] == 23002
+    assert catalog.search("zzzz") == []
+
+
+def test_prefix_trie_completes_every_query_word():
+    trie = PrefixTrie()
+    trie.add("long", "Tie 4 Jyväskylä Palokka")
+    trie.add("short", "Jyväskylä")
+    trie.add("other", "Tie 9 Jämsä")
+    trie.sort()
+
+    assert trie.complete("jyv") == ["short", "long"]
+    assert trie.complete("tie jy") == ["long"]
+    assert trie.complete("palok jyvas") == ["long"]
+    assert trie.complete("x") == []
+    assert trie.complete("  ") == []
+
+
+def test_prefix_trie_ranks_whole_query_prefix_first():
+    trie = PrefixTrie()
+    trie.add("inner", "Kuusaa Tie 4")
+    trie.add("leading", "Tie 4 Kuusaa Äänekoski")
+    trie.sort()
+
+    assert trie.complete("tie 4") == ["leading", "inner"]
+    assert trie.complete("tie 4", limit=1) == ["leading"]
+
+
+def test_prefix_trie_sort_ranks_and_dedupes_postings():
+    trie = PrefixTrie()
+    trie.add("b", "Helsinki Pasila")
+    trie.add("a", "Helsinki")
+    trie.add("a", "Helsingfors")
+    trie.sort()
+
+    assert trie.complete("hel") == ["a", "b"]
+    assert trie.complete("hels pas") == ["b"]
+
+
+def test_prefix_trie_reads_only_the_top_of_long_posting_lists():
+    trie = PrefixTrie()
+    for i in range(250):
+        trie.add(f"k{i}", f"Kuusaa {'x' * (i + 1)}")
+        trie.add(f"l{i}", f"Laukaa {'x' * (i + 1)}")
+    trie.add("deep", f"Kuusaa Laukaa {'x' * 300}")
+    trie.sort()
+
+    assert trie.complete("k", limit=3) == ["k0", "k1", "k2"]
+    assert trie.complete("x", limit=2) == ["k0", "l0"]
+    # A multi-word match ranked below the scan bound needs a longer query
+    assert trie.complete("ku la", limit=3) == []
+    assert trie.complete("kuusaa la", limit=3) == ["deep"]
+
+
+def test_catalog_suggest_uses_station_names():
+    catalog = TmsStationCatalog(
+        [
+            {"properties": {"id": 1, "name": "vt1_Espoo", "names": {"fi": "Tie 1 Espoo", "sv": "Väg 1 Esbo"}}},
+            {"properties": {"id": 2, "name": "vt1_Espoo_Kehä", "names": {"fi": "Tie 1 Espoo Kehä"}}},
+        ]
+    )
+
+    assert [props["id"] for props in catalog.suggest("esb")] == [1]
+    assert [props["id"] for props in catalog.suggest("espoo ke")] == [2]
+
+
+def test_add_folded_matches_add():
+    by_text, by_folded = FuzzyIndex(), FuzzyIndex()
+    trie_text, trie_folded = PrefixTrie(), PrefixTrie()
+    for key, name in (("a", "vt4 Marostenmäki"), ("b", "Tie 4 Äänekoski")):
+        by_text.add(key, name)
+        by_folded.add_folded(key, fold_text(name))
+        trie_text.add(key, name)
+        trie_folded.add_folded(key, fold_text(name))
+    trie_text.sort()
+    trie_folded.sort()
+
+    assert by_text.query("aanekosk") == by_folded.query("aanekosk")
+    assert trie_text.complete("tie") == trie_folded.complete("tie") == ["b"]
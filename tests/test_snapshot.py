@@ -0,0 +1,93 @@
+"""Tests for the bundled catalog snapshot."""
+import asyncio
+
+from custom_components.digitraffic_road import catalog as catalog_module
+from custom_components.digitraffic_road.catalog import SectionCatalog, WeatherStationCatalog, async_get_catalog_cache
+from custom_components.digitraffic_road.snapshot import read_snapshot, write_snapshot
+
+SECTIONS = [
+    {
+        "type": "Feature",
+        "properties": {
+            "id": "00004_421_00000_1_0",
+            "description": "Tie 4: Marostenmäki - Kuusaa",
+            "roadNumber": 4,
+            "roadSectionNumber": 421,
+            "length": 5300,
+        },
+        "geometry": {"type": "LineString", "coordinates": [[25.7, 62.3], [25.75, 62.35], [25.8, 62.4]]},
+    },
+    {
+        "type": "Feature",
+        "properties": {
+            "id": "00004_422_00000_1_0",
+            "description": "Tie 4: Kuusaa - Äänekoski",
+            "roadNumber": 4,
+            "roadSectionNumber": 422,
+            "length": 4100,
+        },
+        "geometry": {"type": "LineString", "coordinates": [[25.8, 62.4], [25.85, 62.5]]},
+    },
+]
+WEATHER = [{"type": "Feature", "properties": {"id": 1001, "name": "vt4_Kuusaa"}, "geometry": None}]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    write_snapshot(path, {"sections": SECTIONS, "weather": WEATHER}, "2025-01-01T00:00:00+00:00")
+
+    features = read_snapshot(path)
+    assert [feat["properties"] for feat in features["sections"]] == [feat["properties"] for feat in SECTIONS]
+    assert features["sections"][0]["geometry"] == {"type": "Point", "coordinates": [25.75, 62.35]}
+    assert features["weather"][0]["properties"] == {"id": 1001, "name": "vt4_Kuusaa"}
+    assert features["weather"][0]["geometry"] is None
+    assert features["tms"] == []
+
+    seeded = SectionCatalog(features["sections"], snapshot=True)
+    assert seeded.search("marostenmaki")[0]["id"] == "00004_421_00000_1_0"
+    assert seeded.is_expired(ttl=10**9)
+
+    # Section lengths give snapshot and downloaded catalogs the same road addresses
+    live = SectionCatalog(SECTIONS)
+    assert seeded.corridor(4, 421, 422) == live.corridor(4, 421, 422)
+    assert seeded._road_ranges[4]._items == live._road_ranges[4]._items
+
+
+def test_missing_snapshot_reads_empty(tmp_path):
+    assert read_snapshot(tmp_path / "missing.json.gz") == {}
+
+
+class _Hass:
+    """The parts of Home Assistant the catalog cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def async_create_task(self, coro):
+        return asyncio.ensure_future(coro)
+
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+def test_concurrent_callers_wait_for_the_snapshot(monkeypatch):
+    loads = []
+
+    def load_snapshot_catalogs():
+        loads.append(1)
+        return {"weather": WeatherStationCatalog(WEATHER, snapshot=True)}
+
+    monkeypatch.setattr(catalog_module, "load_snapshot_catalogs", load_snapshot_catalogs)
+
+    async def run():
+        hass = _Hass()
+
+        async def seeded_catalog():
+            # What the caller sees right when the cache is handed to it
+            return (await async_get_catalog_cache(hass)).peek("weather")
+
+        return await asyncio.gather(*(seeded_catalog() for _ in range(3)))
+
+    seeded = asyncio.run(run())
+    assert loads == [1]
+    assert all(catalog is not None and catalog.get(1001) for catalog in seeded)
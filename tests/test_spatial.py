@@ -0,0 +1,35 @@
+"""Tests for the grid spatial index."""
+import random
+
+import pytest
+
+from custom_components.digitraffic_road.spatial import GridIndex, feature_location, haversine_km
+
+
+def test_haversine_km():
+    # Helsinki - Tampere is about 160 km
+    assert haversine_km(60.1699, 24.9384, 61.4978, 23.7610) == pytest.approx(161, abs=2)
+    assert haversine_km(61.0, 25.0, 61.0, 25.0) == 0
+
+
+def test_feature_location_of_points_and_lines():
+    assert feature_location({"geometry": {"type": "Point", "coordinates": [25.0, 61.0, 0]}}) == (61.0, 25.0)
+    line = {"geometry": {"type": "LineString", "coordinates": [[24, 60], [25, 61], [26, 62]]}}
+    assert feature_location(line) == (61.0, 25.0)
+    assert feature_location({"geometry": None}) is None
+
+
+@pytest.mark.parametrize("query", [(60.2, 24.9), (65.0, 25.5), (70.5, 28.0), (55.0, 10.0)])
+def test_nearest_matches_brute_force(query):
+    rng = random.Random(4)
+    points = [(f"p{i}", rng.uniform(59.8, 70.0), rng.uniform(20.5, 31.5)) for i in range(500)]
+    index = GridIndex()
+    for key, lat, lon in points:
+        index.add(key, lat, lon)
+
+    expected = sorted((haversine_km(*query, lat, lon), key) for key, lat, lon in points)[:5]
+    assert index.nearest(*query, count=5) == expected
+
+
+def test_nearest_on_empty_index():
+    assert GridIndex().nearest(61.0, 25.0) == []